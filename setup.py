@@ -113,6 +113,7 @@ connectors_reqs = {
     "onedrive": load_requirements("requirements/connectors/onedrive.in"),
     "opensearch": load_requirements("requirements/connectors/opensearch.in"),
     "outlook": load_requirements("requirements/connectors/outlook.in"),
+    "parquet": load_requirements("requirements/connectors/parquet.in"),
     "pinecone": load_requirements("requirements/connectors/pinecone.in"),
     "postgres": load_requirements("requirements/connectors/postgres.in"),
     "qdrant": load_requirements("requirements/connectors/qdrant.in"),
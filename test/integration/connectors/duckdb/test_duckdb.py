@@ -10,6 +10,7 @@ from test.integration.connectors.utils.validation.destination import (
     StagerValidationConfigs,
     stager_validation,
 )
+from unstructured_ingest.v2.interfaces import UploadContent
 from unstructured_ingest.v2.interfaces.file_data import FileData, SourceIdentifiers
 from unstructured_ingest.v2.processes.connectors.duckdb.duckdb import (
     CONNECTOR_TYPE,
@@ -73,6 +74,40 @@ def test_duckdb_destination(upload_file: Path, provisioned_db_file: Path, temp_d
     validate_duckdb_destination(db_path=provisioned_db_file, expected_num_elements=len(data))
 
 
+@pytest.mark.tags(CONNECTOR_TYPE, DESTINATION_TAG, "duckdb")
+@pytest.mark.parametrize("parquet_shards", [False, True])
+def test_duckdb_destination_batch(
+    upload_file: Path, provisioned_db_file: Path, temp_dir: Path, parquet_shards: bool
+):
+    stager = DuckDBUploadStager()
+    contents = []
+    for i in range(3):
+        file_data = FileData(
+            source_identifiers=SourceIdentifiers(
+                fullpath=upload_file.name, filename=upload_file.name
+            ),
+            connector_type=CONNECTOR_TYPE,
+            identifier=f"mock-file-data-{i}",
+        )
+        staged_path = stager.run(
+            elements_filepath=upload_file,
+            file_data=file_data,
+            output_dir=Path(temp_dir) / str(i),
+            output_filename=upload_file.name,
+        )
+        contents.append(UploadContent(path=staged_path, file_data=file_data))
+
+    connection_config = DuckDBConnectionConfig(database=str(provisioned_db_file))
+    upload_config = DuckDBUploaderConfig(parquet_shards=parquet_shards)
+    uploader = DuckDBUploader(connection_config=connection_config, upload_config=upload_config)
+
+    uploader.run_batch(contents=contents)
+
+    with contents[0].path.open() as f:
+        data = json.load(f)
+    validate_duckdb_destination(db_path=provisioned_db_file, expected_num_elements=3 * len(data))
+
+
 @pytest.mark.parametrize("upload_file_str", ["upload_file_ndjson", "upload_file"])
 def test_duckdb_stager(
     request: TopRequest,
@@ -87,3 +122,35 @@ def test_duckdb_stager(
         stager=stager,
         tmp_dir=tmp_path,
     )
+
+
+@pytest.mark.tags(CONNECTOR_TYPE, DESTINATION_TAG, "duckdb")
+def test_duckdb_destination_parquet_shards_types(provisioned_db_file: Path, temp_dir: Path):
+    # Every shard gets the column types inferred from its own document, the shards are not
+    # unified with each other, which would turn the integer version into "1.0"
+    documents = [
+        [{"id": "1", "version": 1, "languages": None}],
+        [{"id": "2", "version": 1.5, "languages": ["eng"]}],
+    ]
+    contents = []
+    for i, elements in enumerate(documents):
+        staged_path = Path(temp_dir) / f"{i}.json"
+        staged_path.write_text(json.dumps(elements))
+        file_data = FileData(
+            source_identifiers=SourceIdentifiers(
+                fullpath=staged_path.name, filename=staged_path.name
+            ),
+            connector_type=CONNECTOR_TYPE,
+            identifier=f"mock-file-data-{i}",
+        )
+        contents.append(UploadContent(path=staged_path, file_data=file_data))
+
+    uploader = DuckDBUploader(
+        connection_config=DuckDBConnectionConfig(database=str(provisioned_db_file)),
+        upload_config=DuckDBUploaderConfig(parquet_shards=True),
+    )
+    uploader.run_batch(contents=contents)
+
+    with duckdb.connect(provisioned_db_file) as conn:
+        rows = conn.sql("select id, version, languages from elements order by id").fetchall()
+    assert rows == [("1", "1", None), ("2", "1.5", ["eng"])]
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from pathlib import Path
 from typing import Literal, Union
@@ -14,6 +15,7 @@ from upath import UPath
 from test.integration.connectors.utils.constants import DESTINATION_TAG
 from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces.file_data import FileData, SourceIdentifiers
+from unstructured_ingest.v2.interfaces.uploader import UploadContent
 from unstructured_ingest.v2.processes.connectors.lancedb.aws import (
     LanceDBAwsAccessConfig,
     LanceDBAwsConnectionConfig,
@@ -163,6 +165,48 @@ async def test_lancedb_destination(
     assert len(overwritten_table_df) == 2 * NUMBER_EXPECTED_ROWS
 
 
+@pytest.mark.asyncio
+@pytest.mark.tags(CONNECTOR_TYPE, DESTINATION_TAG)
+@pytest.mark.parametrize("connection_with_uri", ["local"], indirect=True)
+async def test_lancedb_destination_batch(
+    upload_file: Path,
+    connection_with_uri: tuple[AsyncConnection, str],
+    tmp_path: Path,
+) -> None:
+    connection, uri = connection_with_uri
+    stager = LanceDBUploadStager()
+    uploader = _get_uploader(uri)
+    uploader.upload_config.optimize = True
+    contents = []
+    for i in range(3):
+        file_data = FileData(
+            source_identifiers=SourceIdentifiers(
+                fullpath=upload_file.name, filename=upload_file.name
+            ),
+            connector_type=CONNECTOR_TYPE,
+            identifier=f"mock-file-data-{i}",
+        )
+        staged_file_path = stager.run(
+            elements_filepath=upload_file,
+            file_data=file_data,
+            output_dir=tmp_path,
+            output_filename=f"{upload_file.stem}-{i}{upload_file.suffix}",
+        )
+        contents.append(UploadContent(path=staged_file_path, file_data=file_data))
+
+    await asyncio.to_thread(uploader.run_batch, contents=contents)
+    with await connection.open_table(TABLE_NAME) as table:
+        table_df: pd.DataFrame = await table.to_pandas()
+    assert len(table_df) == 3 * NUMBER_EXPECTED_ROWS
+    assert set(table_df[RECORD_ID_LABEL]) == {c.file_data.identifier for c in contents}
+
+    # Re-uploading some of the records overwrites their rows
+    await asyncio.to_thread(uploader.run_batch, contents=contents[1:])
+    with await connection.open_table(TABLE_NAME) as table:
+        overwritten_table_df: pd.DataFrame = await table.to_pandas()
+    assert len(overwritten_table_df) == 3 * NUMBER_EXPECTED_ROWS
+
+
 class TestPrecheck:
     @pytest.mark.tags(CONNECTOR_TYPE, DESTINATION_TAG)
     @pytest.mark.parametrize("connection_with_uri", ["local", "s3", "gcs", "az"], indirect=True)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 import uuid
@@ -18,6 +19,7 @@ from unstructured_ingest.v2.interfaces.file_data import (
     FileDataSourceMetadata,
     SourceIdentifiers,
 )
+from unstructured_ingest.v2.interfaces.uploader import UploadContent
 from unstructured_ingest.v2.processes.connectors.neo4j import (
     CONNECTOR_TYPE,
     Label,
@@ -104,6 +106,40 @@ async def test_neo4j_destination(upload_file: Path, tmp_path: Path):
     await validate_uploaded_graph(modified_upload_file)
 
 
+@pytest.mark.asyncio
+@pytest.mark.tags(DESTINATION_TAG, CONNECTOR_TYPE)
+async def test_neo4j_destination_batch(upload_file: Path, tmp_path: Path):
+    stager = Neo4jUploadStager()
+    uploader = Neo4jUploader(
+        connection_config=Neo4jConnectionConfig(
+            access_config=Neo4jAccessConfig(password=PASSWORD),  # type: ignore
+            username=USERNAME,
+            uri=URI,
+            database=DATABASE,
+        ),
+        upload_config=Neo4jUploaderConfig(batch_size=10, max_concurrent_requests=2),
+    )
+    file_data = FileData(
+        identifier="mock-file-data",
+        connector_type="neo4j",
+        source_identifiers=SourceIdentifiers(
+            filename=upload_file.name,
+            fullpath=upload_file.name,
+        ),
+    )
+    staged_filepath = stager.run(
+        upload_file,
+        file_data=file_data,
+        output_dir=tmp_path,
+        output_filename=f"batch-{upload_file.name}",
+    )
+
+    # Re-uploading the same record within a batch must not duplicate its graph
+    contents = [UploadContent(path=staged_filepath, file_data=file_data)] * 2
+    await asyncio.to_thread(uploader.run_batch, contents=contents)
+    await validate_uploaded_graph(upload_file)
+
+
 @pytest.mark.tags(DESTINATION_TAG, CONNECTOR_TYPE)
 class TestPrecheck:
     @pytest.fixture
@@ -13,6 +13,7 @@ from unstructured_ingest.utils.string_and_date_utils import (
     json_to_dict,
     truncate_string_bytes,
 )
+from unstructured_ingest.utils.table import get_element_columns
 
 
 @dataclass
@@ -182,3 +183,27 @@ def test_truncate_string_bytes_return_untouched_string():
     result = truncate_string_bytes(test_string, max_bytes)
     assert result == "abcdef"
     assert len(result.encode("utf-8")) <= max_bytes
+
+
+def test_get_element_columns():
+    elements = [
+        {
+            "element_id": "1",
+            "text": "first",
+            "metadata": {
+                "page_number": 1,
+                "data_source": {"version": "v1"},
+                "coordinates": {"points": [[0, 0]]},
+                "not_a_column": True,
+            },
+        },
+        {"element_id": "2", "text": "second", "metadata": {}},
+    ]
+    df = get_element_columns(
+        elements_dict=elements, columns=["element_id", "text", "page_number", "version", "points"]
+    )
+    assert list(df.columns) == ["element_id", "text", "page_number", "version", "points"]
+    assert df["version"][0] == "v1"
+    assert df["points"][0] == [[0, 0]]
+    assert df[["version", "points"]].iloc[1].isna().all()
+    assert "metadata" in elements[0]
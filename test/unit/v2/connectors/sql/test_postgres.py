@@ -0,0 +1,111 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from unstructured_ingest.error import WriteError
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers, UploadContent
+from unstructured_ingest.v2.processes.connectors.sql.postgres import (
+    PostgresConnectionConfig,
+    PostgresUploader,
+    PostgresUploaderConfig,
+    get_copy_formatter,
+)
+
+
+@pytest.mark.parametrize(
+    ("column_type", "value", "expected"),
+    [
+        ("character varying[]", ["eng", 'q"u', None], '{"eng","q\\"u",NULL}'),
+        ("vector(3)", [0.1, 0.2, 0.3], "[0.1,0.2,0.3]"),
+        ("integer", 1.0, 1),
+        ("text", {"a": 1}, '{"a":1}'),
+        ("text", "text", "text"),
+    ],
+)
+def test_postgres_copy_formatter(column_type: str, value, expected):
+    format_value = get_copy_formatter(column="column", column_type=column_type)
+    assert format_value(value) == expected
+
+
+def test_postgres_copy_formatter_vector_dimensions():
+    format_value = get_copy_formatter(column="embeddings", column_type="vector(3)")
+    with pytest.raises(WriteError):
+        format_value([0.1, 0.2])
+
+
+@pytest.fixture
+def uploader() -> PostgresUploader:
+    uploader = PostgresUploader(
+        connection_config=PostgresConnectionConfig(),
+        upload_config=PostgresUploaderConfig(rebuild_vector_indexes=True),
+    )
+    uploader._table_columns = ["id", "record_id", "text", "embeddings"]
+    uploader._column_types = {
+        "id": "text",
+        "record_id": "text",
+        "text": "text",
+        "embeddings": "vector(3)",
+    }
+    uploader._unique_columns = ["id"]
+    return uploader
+
+
+@pytest.fixture
+def cursor() -> Generator[mock.MagicMock, None, None]:
+    cursor = mock.MagicMock()
+    cursor.fetchall.return_value = [
+        ("public", "elements_embeddings_idx", "CREATE INDEX ON elements USING hnsw (embeddings)"),
+    ]
+
+    @contextmanager
+    def get_cursor():
+        yield cursor
+
+    with mock.patch.object(PostgresConnectionConfig, "get_cursor", side_effect=get_cursor):
+        yield cursor
+
+
+def executed_statements(cursor: mock.MagicMock) -> list[str]:
+    return [str(call.args[0]) for call in cursor.execute.call_args_list]
+
+
+def test_postgres_upsert_checks_vectors_before_writing(
+    uploader: PostgresUploader, cursor: mock.MagicMock
+):
+    df = pd.DataFrame([{"id": "1", "record_id": "record", "embeddings": [0.1, 0.2]}])
+    with pytest.raises(WriteError):
+        uploader.upsert_dataframe(df=df, record_ids=["record"])
+    cursor.execute.assert_not_called()
+
+
+def test_postgres_rebuilds_vector_indexes_once_per_batch(
+    uploader: PostgresUploader, cursor: mock.MagicMock
+):
+    file_data = [
+        FileData(
+            identifier=str(i),
+            connector_type="postgres",
+            source_identifiers=SourceIdentifiers(filename=f"{i}.json", fullpath=f"{i}.json"),
+        )
+        for i in range(3)
+    ]
+    contents = [
+        UploadContent(path=Path(fd.source_identifiers.fullpath), file_data=fd) for fd in file_data
+    ]
+    groups = [([{"id": f"{fd.identifier}-0"}], [fd]) for fd in file_data]
+    with mock.patch.object(PostgresUploader, "batch_contents", return_value=groups):
+        with mock.patch.object(PostgresUploader, "upload_dataframe") as upload_dataframe:
+            upload_dataframe.side_effect = [None, WriteError("failed"), None]
+            with pytest.raises(WriteError):
+                uploader.run_batch(contents=contents)
+
+    statements = executed_statements(cursor)
+    # Only the indexes of the table in the current schema are dropped
+    assert "schemaname = current_schema()" in statements[0]
+    assert len([stmt for stmt in statements if "DROP INDEX" in stmt]) == 1
+    # The index is rebuilt even though the load failed
+    assert statements[-1] == "CREATE INDEX ON elements USING hnsw (embeddings)"
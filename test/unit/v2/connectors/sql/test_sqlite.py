@@ -0,0 +1,208 @@
+import sqlite3
+from pathlib import Path
+
+import ndjson
+import pandas as pd
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers, upload_stager
+from unstructured_ingest.v2.processes.connectors.sql import sql
+from unstructured_ingest.v2.processes.connectors.sql.sql import SqlBatchFileData
+from unstructured_ingest.v2.processes.connectors.sql.sqlite import (
+    SQLiteConnectionConfig,
+    SQLiteDownloader,
+    SQLiteDownloaderConfig,
+    SQLiteIndexer,
+    SQLiteIndexerConfig,
+    SQLiteUploader,
+    SQLiteUploaderConfig,
+    SQLiteUploadStager,
+)
+
+SEED_DATA_ROWS = 10
+
+
+@pytest.fixture
+def database_path(tmp_path: Path) -> Path:
+    db_path = tmp_path / "mock_database.db"
+    with sqlite3.connect(database=db_path) as connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            "CREATE TABLE cars (car_id INTEGER PRIMARY KEY, brand TEXT NOT NULL, price INTEGER)"
+        )
+        cursor.executemany(
+            "INSERT INTO cars (brand, price) VALUES (?, ?)",
+            [(f"brand{i}", i) for i in range(SEED_DATA_ROWS)],
+        )
+        connection.commit()
+    return db_path
+
+
+def get_file_data(database_path: Path) -> SqlBatchFileData:
+    indexer = SQLiteIndexer(
+        connection_config=SQLiteConnectionConfig(database_path=database_path),
+        index_config=SQLiteIndexerConfig(
+            table_name="cars", id_column="car_id", batch_size=SEED_DATA_ROWS
+        ),
+    )
+    file_data = list(indexer.run())
+    assert len(file_data) == 1
+    return file_data[0]
+
+
+def test_sqlite_downloader_row_files(database_path: Path, tmp_path: Path):
+    downloader = SQLiteDownloader(
+        connection_config=SQLiteConnectionConfig(database_path=database_path),
+        download_config=SQLiteDownloaderConfig(download_dir=tmp_path / "downloads", fetch_size=3),
+    )
+    responses = downloader.run(file_data=get_file_data(database_path=database_path))
+    assert len(responses) == SEED_DATA_ROWS
+    for response in responses:
+        df = pd.read_csv(response["path"])
+        assert list(df.columns) == ["car_id", "brand", "price"]
+        assert len(df) == 1
+        assert response["file_data"].identifier == f"cars-{df['car_id'][0]}"
+
+
+@pytest.mark.parametrize("batch_file_format", ["csv", "parquet"])
+def test_sqlite_downloader_batch_file(database_path: Path, tmp_path: Path, batch_file_format: str):
+    downloader = SQLiteDownloader(
+        connection_config=SQLiteConnectionConfig(database_path=database_path),
+        download_config=SQLiteDownloaderConfig(
+            download_dir=tmp_path / "downloads",
+            fetch_size=3,
+            batch_file_format=batch_file_format,
+        ),
+    )
+    file_data = get_file_data(database_path=database_path)
+    responses = downloader.run(file_data=file_data)
+    assert len(responses) == 1
+    path = responses[0]["path"]
+    assert path.suffix == f".{batch_file_format}"
+    df = pd.read_parquet(path) if batch_file_format == "parquet" else pd.read_csv(path)
+    assert sorted(df["car_id"].tolist()) == list(range(1, SEED_DATA_ROWS + 1))
+    assert responses[0]["file_data"].identifier == f"cars-{file_data.identifier}"
+
+
+def get_upload_data(record_id: str, num_elements: int) -> tuple[list[dict], FileData]:
+    file_data = FileData(
+        identifier=record_id,
+        connector_type="sqlite",
+        source_identifiers=SourceIdentifiers(filename=record_id, fullpath=record_id),
+    )
+    data = [
+        {
+            "id": f"{record_id}-{i}",
+            "record_id": record_id,
+            "text": f"text {i}",
+            "languages": ["eng"],
+            "date_processed": "1734443134.787072",
+        }
+        for i in range(num_elements)
+    ]
+    return data, file_data
+
+
+def test_sqlite_uploader_batch(tmp_path: Path):
+    db_path = tmp_path / "elements.db"
+    with sqlite3.connect(database=db_path) as connection:
+        connection.execute(
+            "CREATE TABLE elements (id TEXT PRIMARY KEY, record_id TEXT, text TEXT, "
+            "languages TEXT, date_processed TEXT)"
+        )
+    uploader = SQLiteUploader(
+        connection_config=SQLiteConnectionConfig(database_path=db_path),
+        upload_config=SQLiteUploaderConfig(batch_size=2),
+    )
+    first_data, first_file_data = get_upload_data(record_id="doc-1", num_elements=3)
+    second_data, second_file_data = get_upload_data(record_id="doc-2", num_elements=2)
+    uploader.run_batch_data(
+        data=first_data + second_data, file_data=[first_file_data, second_file_data]
+    )
+    # Previous rows of a record get replaced
+    data, file_data = get_upload_data(record_id="doc-1", num_elements=1)
+    uploader.run_data(data=data, file_data=file_data)
+
+    with sqlite3.connect(database=db_path) as connection:
+        rows = connection.execute(
+            "SELECT id, languages, date_processed FROM elements ORDER BY id"
+        ).fetchall()
+    assert [row[0] for row in rows] == ["doc-1-0", "doc-2-0", "doc-2-1"]
+    assert all(row[1] == '["eng"]' for row in rows)
+    assert all(row[2].startswith("2024-12-17") for row in rows)
+
+
+def test_sqlite_stream_ndjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(upload_stager, "STREAM_BATCH_SIZE", 2)
+    monkeypatch.setattr(sql, "MAX_BATCH_ELEMENTS", 2)
+    db_path = tmp_path / "elements.db"
+    with sqlite3.connect(database=db_path) as connection:
+        connection.execute(
+            "CREATE TABLE elements (id TEXT PRIMARY KEY, record_id TEXT, element_id TEXT, "
+            "text TEXT, languages TEXT, date_processed TEXT)"
+        )
+    _, file_data = get_upload_data(record_id="doc-1", num_elements=0)
+    elements_path = tmp_path / "elements.ndjson"
+    with elements_path.open("w") as f:
+        ndjson.dump(
+            [
+                {
+                    "element_id": str(i),
+                    "text": f"text {i}",
+                    "metadata": {
+                        "languages": ["eng"],
+                        "data_source": {"date_processed": "1734443134.787072"},
+                    },
+                }
+                for i in range(5)
+            ],
+            f,
+        )
+    staged_path = SQLiteUploadStager().run(
+        elements_filepath=elements_path,
+        file_data=file_data,
+        output_dir=tmp_path / "staged",
+        output_filename=elements_path.name,
+    )
+    assert staged_path.suffix == ".ndjson"
+    uploader = SQLiteUploader(
+        connection_config=SQLiteConnectionConfig(database_path=db_path),
+        upload_config=SQLiteUploaderConfig(),
+    )
+    # Streaming the same document twice replaces its previous rows
+    uploader.run(path=staged_path, file_data=file_data)
+    uploader.run(path=staged_path, file_data=file_data)
+
+    with sqlite3.connect(database=db_path) as connection:
+        rows = connection.execute(
+            "SELECT element_id, record_id, languages FROM elements ORDER BY element_id"
+        ).fetchall()
+    assert rows == [(str(i), "doc-1", '["eng"]') for i in range(5)]
+
+
+def test_sqlite_downloader_parquet_sparse_first_chunk(tmp_path: Path):
+    db_path = tmp_path / "sparse.db"
+    with sqlite3.connect(database=db_path) as connection:
+        connection.execute("CREATE TABLE cars (car_id INTEGER PRIMARY KEY, price, label)")
+        # The first fetched chunk only has null prices and integer labels, the second one
+        # has float and integer prices and string labels
+        connection.executemany(
+            "INSERT INTO cars (price, label) VALUES (?, ?)",
+            [(None, 1), (None, 2), (None, 3), (1.5, "four"), (2, "five")],
+        )
+    indexer = SQLiteIndexer(
+        connection_config=SQLiteConnectionConfig(database_path=db_path),
+        index_config=SQLiteIndexerConfig(table_name="cars", id_column="car_id", batch_size=5),
+    )
+    downloader = SQLiteDownloader(
+        connection_config=SQLiteConnectionConfig(database_path=db_path),
+        download_config=SQLiteDownloaderConfig(
+            download_dir=tmp_path / "downloads", fetch_size=3, batch_file_format="parquet"
+        ),
+    )
+    (file_data,) = list(indexer.run())
+    (response,) = downloader.run(file_data=file_data)
+
+    df = pd.read_parquet(response["path"]).sort_values("car_id")
+    assert df["price"].tolist()[3:] == [1.5, 2.0]
+    assert df["label"].tolist() == ["1", "2", "3", "four", "five"]
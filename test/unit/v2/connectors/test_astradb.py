@@ -0,0 +1,53 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from unstructured_ingest.v2.processes.connectors.astradb import (
+    MAX_DELETE_IDS,
+    AstraDBAccessConfig,
+    AstraDBConnectionConfig,
+    AstraDBUploader,
+    AstraDBUploaderConfig,
+)
+
+
+@pytest.fixture
+def uploader() -> AstraDBUploader:
+    return AstraDBUploader(
+        connection_config=AstraDBConnectionConfig(
+            access_config=AstraDBAccessConfig(token="token", api_endpoint="http://localhost")
+        ),
+        upload_config=AstraDBUploaderConfig(collection_name="elements"),
+    )
+
+
+@pytest.fixture
+def record_ids() -> list[str]:
+    return [f"record-{i}" for i in range(2 * MAX_DELETE_IDS + 1)]
+
+
+def get_deleted_ids(delete_many: mock.Mock) -> list[list[str]]:
+    return [call.kwargs["filter"]["record_id"]["$in"] for call in delete_many.call_args_list]
+
+
+def test_delete_by_record_ids_in_chunks(uploader: AstraDBUploader, record_ids: list[str]):
+    collection = mock.MagicMock()
+    collection.delete_many.return_value = mock.MagicMock(deleted_count=1)
+
+    uploader.delete_by_record_ids(collection=collection, record_ids=record_ids)
+
+    deleted_ids = get_deleted_ids(collection.delete_many)
+    assert [len(ids) for ids in deleted_ids] == [MAX_DELETE_IDS, MAX_DELETE_IDS, 1]
+    assert sum(deleted_ids, []) == record_ids
+
+
+def test_delete_by_record_ids_async_in_chunks(uploader: AstraDBUploader, record_ids: list[str]):
+    collection = mock.MagicMock()
+    collection.delete_many = mock.AsyncMock(return_value=mock.MagicMock(deleted_count=1))
+
+    asyncio.run(uploader.delete_by_record_ids_async(collection=collection, record_ids=record_ids))
+
+    deleted_ids = get_deleted_ids(collection.delete_many)
+    assert [len(ids) for ids in deleted_ids] == [MAX_DELETE_IDS, MAX_DELETE_IDS, 1]
+    assert sum(deleted_ids, []) == record_ids
@@ -1,9 +1,14 @@
 import pytest
 from pydantic import ValidationError
 
+from unstructured_ingest.v2.interfaces import BatchFileData, BatchItem
 from unstructured_ingest.v2.processes.connectors.confluence import (
     ConfluenceAccessConfig,
     ConfluenceConnectionConfig,
+    ConfluenceDownloader,
+    ConfluenceDownloaderConfig,
+    ConfluenceIndexer,
+    ConfluenceIndexerConfig,
 )
 
 
@@ -37,3 +42,56 @@ def test_connection_config_pat_auth():
         access_config=ConfluenceAccessConfig(access_token="access_token"),
         url="url",
     )
+
+
+def get_connection_config() -> ConfluenceConnectionConfig:
+    return ConfluenceConnectionConfig(
+        access_config=ConfluenceAccessConfig(access_token="access_token"),
+        url="https://confluence.example.com",
+    )
+
+
+def test_indexer_batches_pages_per_space(mocker):
+    client = mocker.MagicMock()
+    client.get_all_pages_from_space.side_effect = lambda space, **kwargs: [
+        {"id": f"{space}-{i}"} for i in range(5)
+    ]
+    mocker.patch.object(ConfluenceConnectionConfig, "get_client", return_value=client)
+    indexer = ConfluenceIndexer(
+        connection_config=get_connection_config(),
+        index_config=ConfluenceIndexerConfig(spaces=["A", "B"], batch_size=2),
+    )
+    file_data = list(indexer.run())
+    assert all(isinstance(fd, BatchFileData) for fd in file_data)
+    assert [fd.additional_metadata["space_id"] for fd in file_data] == ["A"] * 3 + ["B"] * 3
+    assert [len(fd.batch_items) for fd in file_data] == [2, 2, 1] * 2
+
+
+def test_downloader_batch(mocker, tmp_path):
+    pages = [
+        {
+            "id": doc_id,
+            "title": f"title {doc_id}",
+            "body": {"view": {"value": f"<p>{doc_id}</p>"}},
+            "history": {"createdDate": "2024-01-01T00:00:00.000Z"},
+            "version": {"when": "2024-01-02T00:00:00.000Z", "number": 3},
+        }
+        for doc_id in ["1", "2"]
+    ]
+    client = mocker.MagicMock()
+    client.get.return_value = {"results": pages}
+    mocker.patch.object(ConfluenceConnectionConfig, "get_client", return_value=client)
+    downloader = ConfluenceDownloader(
+        connection_config=get_connection_config(),
+        download_config=ConfluenceDownloaderConfig(download_dir=tmp_path),
+    )
+    file_data = BatchFileData(
+        connector_type="confluence",
+        additional_metadata={"space_id": "A"},
+        batch_items=[BatchItem(identifier="1"), BatchItem(identifier="2")],
+    )
+    responses = downloader.run(file_data=file_data)
+    client.get.assert_called_once()
+    assert [r["file_data"].identifier for r in responses] == ["1", "2"]
+    assert (tmp_path / "A" / "2.html").read_text() == "<p>2</p>"
+    assert responses[0]["file_data"].metadata.version == "3"
@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+from deltalake import DeltaTable
+
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers, UploadContent
+from unstructured_ingest.v2.processes.connectors.delta_table import (
+    CONNECTOR_TYPE,
+    DeltaTableConnectionConfig,
+    DeltaTableUploader,
+    DeltaTableUploaderConfig,
+    DeltaTableUploadStager,
+)
+
+
+def stage_elements(tmp_path: Path, record_id: str, elements: list[dict]) -> UploadContent:
+    elements_path = tmp_path / f"{record_id}.json"
+    elements_path.write_text(json.dumps(elements))
+    staged_path = DeltaTableUploadStager().run(
+        elements_filepath=elements_path, output_dir=tmp_path, output_filename=record_id
+    )
+    return UploadContent(
+        path=staged_path,
+        file_data=FileData(
+            identifier=record_id,
+            connector_type=CONNECTOR_TYPE,
+            source_identifiers=SourceIdentifiers(filename=elements_path.name, fullpath=record_id),
+        ),
+    )
+
+
+def get_elements(record_id: str, count: int, **metadata) -> list[dict]:
+    return [
+        {
+            "element_id": f"{record_id}-{i}",
+            "type": "NarrativeText",
+            "text": f"{record_id} text {i}",
+            "metadata": {"filename": f"{record_id}.pdf", "page_number": i + 1, **metadata},
+        }
+        for i in range(count)
+    ]
+
+
+def test_delta_table_single_table_replaces_records(tmp_path: Path):
+    table_uri = str(tmp_path / "table")
+    uploader = DeltaTableUploader(
+        connection_config=DeltaTableConnectionConfig(table_uri=table_uri),
+        upload_config=DeltaTableUploaderConfig(single_table=True),
+    )
+    assert uploader.is_batch()
+    uploader.run_batch(
+        contents=[
+            stage_elements(tmp_path, record_id="first", elements=get_elements("first", 3)),
+            stage_elements(tmp_path, record_id="second", elements=get_elements("second", 2)),
+        ]
+    )
+
+    # Rerunning a record replaces its rows, new metadata columns get added to the table
+    uploader.run_batch(
+        contents=[
+            stage_elements(
+                tmp_path, record_id="first", elements=get_elements("first", 1, languages=["eng"])
+            )
+        ]
+    )
+
+    df = DeltaTable(table_uri).to_pandas()
+    assert sorted(df["element_id"]) == ["first-0", "second-0", "second-1"]
+    assert df.groupby("record_id").size().to_dict() == {"first": 1, "second": 2}
+    assert "languages" in df.columns
@@ -0,0 +1,25 @@
+from unstructured_ingest.v2.processes.connectors.elasticsearch.elasticsearch import (
+    MAX_DELETE_RECORD_IDS,
+    ElasticsearchAccessConfig,
+    ElasticsearchConnectionConfig,
+    ElasticsearchUploader,
+    ElasticsearchUploaderConfig,
+)
+
+
+def test_delete_queries_match_exact_record_ids():
+    uploader = ElasticsearchUploader(
+        connection_config=ElasticsearchConnectionConfig(
+            hosts=["http://localhost:9200"], access_config=ElasticsearchAccessConfig()
+        ),
+        upload_config=ElasticsearchUploaderConfig(index_name="elements"),
+    )
+    record_ids = [f"00000000-0000-0000-0000-{i:012}" for i in range(MAX_DELETE_RECORD_IDS + 1)]
+
+    queries = list(uploader.get_delete_queries(record_ids=record_ids))
+
+    clauses = [query["query"]["bool"]["should"] for query in queries]
+    assert [len(should) for should in clauses] == [MAX_DELETE_RECORD_IDS, 1]
+    assert [clause["match_phrase"]["record_id"] for should in clauses for clause in should] == (
+        record_ids
+    )
@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+from unittest import mock
+
+from fsspec.implementations.memory import MemoryFileSystem
+
+from test.unit.v2.connectors.test_local import write_elements
+from unstructured_ingest.v2.processes.connectors.fsspec.fsspec import (
+    FsspecAccessConfig,
+    FsspecConnectionConfig,
+    FsspecUploader,
+    FsspecUploaderConfig,
+)
+
+
+def test_fsspec_uploader_aggregated_output(tmp_path: Path):
+    contents = [
+        write_elements(path=tmp_path / f"doc{i}.json", record_id=f"record{i}", count=5)
+        for i in range(4)
+    ]
+    uploader = FsspecUploader(
+        connection_config=FsspecConnectionConfig(access_config=FsspecAccessConfig()),
+        upload_config=FsspecUploaderConfig(
+            remote_url="memory://bucket/output", aggregate_output="ndjson", shard_size_bytes=1024
+        ),
+    )
+    assert uploader.is_batch()
+
+    with mock.patch.object(FsspecUploader, "put_files", wraps=uploader.put_files) as put_files:
+        uploader.run_batch(contents=contents)
+
+    # All shards are put before any manifest, so no manifest points to a missing shard
+    shard_paths, manifest_paths = [call.kwargs["rpaths"] for call in put_files.call_args_list]
+    assert len(shard_paths) == len(manifest_paths) > 1
+    assert all(path.endswith(".ndjson") for path in shard_paths)
+    assert all(path.endswith(".manifest.json") for path in manifest_paths)
+
+    fs = MemoryFileSystem()
+    record_ids = []
+    for manifest_path in manifest_paths:
+        manifest = json.loads(fs.cat_file(manifest_path))
+        assert f"bucket/output/{manifest['file']}" in shard_paths
+        record_ids.extend(record["record_id"] for record in manifest["records"])
+    assert sorted(record_ids) == [f"record{i}" for i in range(4)]
@@ -0,0 +1,131 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from confluent_kafka import TopicPartition
+
+from unstructured_ingest.v2.processes.connectors.kafka.local import (
+    LocalKafkaConnectionConfig,
+    LocalKafkaDownloader,
+    LocalKafkaDownloaderConfig,
+    LocalKafkaIndexer,
+    LocalKafkaIndexerConfig,
+)
+
+TOPIC = "topic"
+
+
+def get_message(offset: int) -> mock.MagicMock:
+    message = mock.MagicMock()
+    message.error.return_value = None
+    message.topic.return_value = TOPIC
+    message.partition.return_value = 0
+    message.offset.return_value = offset
+    message.value.return_value = f"message {offset}".encode()
+    return message
+
+
+@pytest.fixture
+def consumer() -> mock.MagicMock:
+    consumer = mock.MagicMock()
+    consumer.list_topics.return_value.topics = {
+        TOPIC: mock.MagicMock(partitions={0: None, 1: None})
+    }
+    consumer.committed.side_effect = lambda partitions, timeout: [
+        TopicPartition(TOPIC, partition.partition, -1001) for partition in partitions
+    ]
+    consumer.get_watermark_offsets.return_value = (0, 5)
+    return consumer
+
+
+@pytest.fixture
+def connection_config(consumer: mock.MagicMock) -> LocalKafkaConnectionConfig:
+    connection_config = LocalKafkaConnectionConfig(bootstrap_server="localhost", port=29092)
+    with mock.patch.object(LocalKafkaConnectionConfig, "get_consumer") as get_consumer:
+        get_consumer.return_value.__enter__.return_value = consumer
+        yield connection_config
+
+
+def test_indexer_reads_up_to_high_watermark_without_committing(
+    connection_config: LocalKafkaConnectionConfig, consumer: mock.MagicMock
+):
+    indexer = LocalKafkaIndexer(
+        connection_config=connection_config,
+        index_config=LocalKafkaIndexerConfig(
+            topic=TOPIC, num_messages_to_consume=None, batch_size=3
+        ),
+    )
+
+    batches = [
+        (
+            file_data.additional_metadata.partition,
+            [item.identifier for item in file_data.batch_items],
+        )
+        for file_data in indexer.run()
+    ]
+
+    assert batches == [
+        (0, ["0", "1", "2"]),
+        (0, ["3", "4"]),
+        (1, ["0", "1", "2"]),
+        (1, ["3", "4"]),
+    ]
+    consumer.commit.assert_not_called()
+
+
+def get_batches(connection_config: LocalKafkaConnectionConfig) -> list:
+    indexer = LocalKafkaIndexer(
+        connection_config=connection_config,
+        index_config=LocalKafkaIndexerConfig(topic=TOPIC, num_messages_to_consume=5, batch_size=3),
+    )
+    return list(indexer.run())
+
+
+@pytest.fixture
+def downloader(connection_config: LocalKafkaConnectionConfig, tmp_path: Path):
+    return LocalKafkaDownloader(
+        connection_config=connection_config,
+        download_config=LocalKafkaDownloaderConfig(download_dir=tmp_path),
+    )
+
+
+def test_downloader_commits_batch_once_on_disk(
+    connection_config: LocalKafkaConnectionConfig,
+    downloader: LocalKafkaDownloader,
+    consumer: mock.MagicMock,
+):
+    first_batch, _ = get_batches(connection_config)
+    consumer.consume.return_value = [get_message(offset) for offset in range(3)]
+
+    responses = downloader.run(file_data=first_batch)
+
+    assert [response["path"].read_text() for response in responses] == [
+        f"message {offset}" for offset in range(3)
+    ]
+    (committed,) = consumer.commit.call_args.kwargs["offsets"]
+    assert (committed.topic, committed.partition, committed.offset) == (TOPIC, 0, 3)
+
+
+def test_downloader_leaves_later_batch_uncommitted(
+    connection_config: LocalKafkaConnectionConfig,
+    downloader: LocalKafkaDownloader,
+    consumer: mock.MagicMock,
+):
+    # The first batch was not committed, committing the second one would skip it
+    _, second_batch = get_batches(connection_config)
+    consumer.consume.return_value = [get_message(offset) for offset in range(3, 5)]
+
+    assert len(downloader.run(file_data=second_batch)) == 2
+    consumer.commit.assert_not_called()
+
+
+def test_downloader_timeout_leaves_batch_uncommitted(
+    connection_config: LocalKafkaConnectionConfig,
+    downloader: LocalKafkaDownloader,
+    consumer: mock.MagicMock,
+):
+    first_batch, _ = get_batches(connection_config)
+    consumer.consume.side_effect = [[get_message(0)], []]
+
+    assert len(downloader.run(file_data=first_batch)) == 1
+    consumer.commit.assert_not_called()
@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers, UploadContent
+from unstructured_ingest.v2.processes.connectors.local import (
+    LocalUploader,
+    LocalUploaderConfig,
+)
+from unstructured_ingest.v2.processes.connectors.utils import write_parquet_shard
+
+
+def write_elements(path: Path, record_id: str, count: int) -> UploadContent:
+    elements = [{"element_id": f"{record_id}-{i}", "text": "text " * 20} for i in range(count)]
+    path.write_text(json.dumps(elements))
+    return UploadContent(
+        path=path,
+        file_data=FileData(
+            identifier=record_id,
+            connector_type="local",
+            source_identifiers=SourceIdentifiers(filename=path.name, fullpath=str(path)),
+        ),
+    )
+
+
+def test_local_uploader_aggregated_ndjson(tmp_path: Path):
+    contents = [
+        write_elements(path=tmp_path / f"doc{i}.json", record_id=f"record{i}", count=5)
+        for i in range(4)
+    ]
+    output_dir = tmp_path / "output"
+    uploader = LocalUploader(
+        upload_config=LocalUploaderConfig(
+            output_dir=str(output_dir), aggregate_output="ndjson", shard_size_bytes=1024
+        )
+    )
+    assert uploader.is_batch()
+    uploader.run_batch(contents=contents)
+
+    manifests = list(output_dir.glob("*.manifest.json"))
+    assert 1 < len(manifests) < len(contents)
+    record_ids = []
+    for manifest_path in manifests:
+        manifest = json.loads(manifest_path.read_text())
+        shard = (output_dir / manifest["file"]).read_bytes()
+        for record in manifest["records"]:
+            record_ids.append(record["record_id"])
+            offset = record["byte_offset"]
+            rows = shard[offset : offset + record["byte_length"]].decode().splitlines()
+            assert len(rows) == record["row_count"] == 5
+            assert all(
+                json.loads(row)["element_id"].startswith(record["record_id"]) for row in rows
+            )
+    assert sorted(record_ids) == [f"record{i}" for i in range(4)]
+
+
+def test_local_uploader_aggregated_parquet(tmp_path: Path):
+    contents = [
+        write_elements(path=tmp_path / f"doc{i}.json", record_id=f"record{i}", count=i + 1)
+        for i in range(3)
+    ]
+    output_dir = tmp_path / "output"
+    uploader = LocalUploader(
+        upload_config=LocalUploaderConfig(output_dir=str(output_dir), aggregate_output="parquet")
+    )
+    # Outside of batches every document is written to its own shard
+    uploader.run(path=contents[0].path, file_data=contents[0].file_data)
+    uploader.run_batch(contents=contents[1:])
+
+    manifests = [json.loads(path.read_text()) for path in output_dir.glob("*.manifest.json")]
+    assert sorted(len(manifest["records"]) for manifest in manifests) == [1, 2]
+    for manifest in manifests:
+        table = pq.read_table(output_dir / manifest["file"])
+        for record in manifest["records"]:
+            rows = table.slice(record["row_offset"], record["row_count"]).to_pylist()
+            assert [row["element_id"] for row in rows] == [
+                f"{record['record_id']}-{i}" for i in range(record["row_count"])
+            ]
+
+
+def test_write_parquet_shard(tmp_path: Path):
+    path = tmp_path / "shard.parquet"
+    rows = [
+        json.dumps({"element_id": "1", "metadata": {"filename": "a.pdf"}}) + "\n",
+        json.dumps({"element_id": "2", "metadata": {"page_number": 1}, "text": "text"}) + "\n",
+    ]
+
+    write_parquet_shard(rows=rows, path=path)
+
+    # Nested metadata is kept as json so both rows share one schema
+    assert pq.read_table(path).to_pylist() == [
+        {"element_id": "1", "metadata": '{"filename": "a.pdf"}', "text": None},
+        {"element_id": "2", "metadata": '{"page_number": 1}', "text": "text"},
+    ]
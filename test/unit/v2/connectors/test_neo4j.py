@@ -0,0 +1,135 @@
+import base64
+import csv
+import json
+import zlib
+from pathlib import Path
+
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers
+from unstructured_ingest.v2.processes.connectors.neo4j import (
+    Label,
+    Neo4jAccessConfig,
+    Neo4jConnectionConfig,
+    Neo4jUploader,
+    Neo4jUploaderConfig,
+    Neo4jUploadStager,
+    Relationship,
+    _GraphData,
+)
+
+
+def to_orig_elements(elements: list[dict]) -> str:
+    return base64.b64encode(zlib.compress(json.dumps(elements).encode("utf-8"))).decode("utf-8")
+
+
+@pytest.fixture
+def file_data() -> FileData:
+    return FileData(
+        identifier="document",
+        connector_type="neo4j",
+        source_identifiers=SourceIdentifiers(filename="document.pdf", fullpath="document.pdf"),
+    )
+
+
+@pytest.fixture
+def graph_data(file_data: FileData) -> _GraphData:
+    stager = Neo4jUploadStager()
+    shared_element = {"element_id": "shared", "text": "shared text"}
+    # The shared element is split across both chunks, it yields the same edges twice
+    chunks = [
+        {
+            "element_id": f"chunk-{i}",
+            "text": f"chunk {i}",
+            "embeddings": [0.1, 0.2],
+            "metadata": {
+                "orig_elements": to_orig_elements(
+                    [shared_element, {"element_id": f"element-{i}", "text": f"line 1\nline {i}"}]
+                )
+            },
+        }
+        for i in range(2)
+    ]
+    return stager._create_lexical_graph(chunks, stager._create_document_node(file_data=file_data))
+
+
+def get_edges(graph_data: _GraphData) -> list[tuple[str, str, str]]:
+    return [(edge.source_id, edge.relationship, edge.destination_id) for edge in graph_data.edges]
+
+
+def test_lexical_graph_deduplicates_nodes_and_edges(graph_data: _GraphData):
+    assert sorted(node.id_ for node in graph_data.nodes) == [
+        "chunk-0",
+        "chunk-1",
+        "document",
+        "element-0",
+        "element-1",
+        "shared",
+    ]
+    assert sorted(get_edges(graph_data)) == [
+        ("chunk-0", Relationship.PART_OF_DOCUMENT, "document"),
+        ("chunk-1", Relationship.NEXT_CHUNK, "chunk-0"),
+        ("chunk-1", Relationship.PART_OF_DOCUMENT, "document"),
+        ("element-0", Relationship.PART_OF_CHUNK, "chunk-0"),
+        ("element-0", Relationship.PART_OF_DOCUMENT, "document"),
+        ("element-1", Relationship.PART_OF_CHUNK, "chunk-1"),
+        ("element-1", Relationship.PART_OF_DOCUMENT, "document"),
+        ("shared", Relationship.PART_OF_CHUNK, "chunk-0"),
+        ("shared", Relationship.PART_OF_CHUNK, "chunk-1"),
+        ("shared", Relationship.PART_OF_DOCUMENT, "document"),
+    ]
+    next_chunk = next(
+        edge for edge in graph_data.edges if edge.relationship == Relationship.NEXT_CHUNK
+    )
+    assert (next_chunk.source_label, next_chunk.destination_label) == (Label.CHUNK, Label.CHUNK)
+
+
+def test_graph_data_merge_deduplicates(graph_data: _GraphData):
+    merged = _GraphData.merge([graph_data, graph_data])
+    assert len(merged.nodes) == len(graph_data.nodes)
+    assert sorted(get_edges(merged)) == sorted(get_edges(graph_data))
+
+
+def read_csv(path: Path) -> list[list[str]]:
+    with path.open(newline="") as file:
+        return list(csv.reader(file))
+
+
+def test_write_import_files(graph_data: _GraphData, tmp_path: Path):
+    uploader = Neo4jUploader(
+        connection_config=Neo4jConnectionConfig(
+            access_config=Neo4jAccessConfig(password="password"),
+            username="neo4j",
+            uri="neo4j://localhost:7687",
+            database="neo4j",
+        ),
+        upload_config=Neo4jUploaderConfig(import_dir=tmp_path),
+    )
+    # Files are appended to across batches, with a single header
+    uploader._write_import_files(graph_data=graph_data)
+    uploader._write_import_files(graph_data=graph_data)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "nodes-Chunk.csv",
+        "nodes-Document.csv",
+        "nodes-UnstructuredElement.csv",
+        "relationships-NEXT_CHUNK.csv",
+        "relationships-PART_OF_CHUNK.csv",
+        "relationships-PART_OF_DOCUMENT.csv",
+    ]
+    assert read_csv(tmp_path / "nodes-Document.csv") == [
+        ["id:ID", "name", "date_created", "date_modified", ":LABEL"],
+        ["document", "document.pdf", "", "", "Document"],
+        ["document", "document.pdf", "", "", "Document"],
+    ]
+    chunk_rows = read_csv(tmp_path / "nodes-Chunk.csv")
+    assert chunk_rows[0] == ["id:ID", "text", "embeddings:float[]", ":LABEL"]
+    assert chunk_rows[1] == ["chunk-0", "chunk 0", "0.1;0.2", "Chunk"]
+    element_rows = read_csv(tmp_path / "nodes-UnstructuredElement.csv")
+    # Multiline texts stay in a single quoted field
+    assert ["element-1", "line 1\nline 1", "", "UnstructuredElement"] in element_rows
+    assert read_csv(tmp_path / "relationships-NEXT_CHUNK.csv") == [
+        [":START_ID", ":END_ID", ":TYPE"],
+        ["chunk-1", "chunk-0", "NEXT_CHUNK"],
+        ["chunk-1", "chunk-0", "NEXT_CHUNK"],
+    ]
@@ -0,0 +1,46 @@
+import builtins
+from unittest import mock
+
+import grpc
+import pytest
+
+from unstructured_ingest.error import DestinationConnectionError
+from unstructured_ingest.v2.processes.connectors.pinecone import (
+    PineconeAccessConfig,
+    PineconeConnectionConfig,
+    PineconeUploader,
+    PineconeUploaderConfig,
+)
+
+
+@pytest.fixture
+def uploader() -> PineconeUploader:
+    return PineconeUploader(
+        connection_config=PineconeConnectionConfig(
+            index_name="index", access_config=PineconeAccessConfig(api_key="api-key")
+        ),
+        upload_config=PineconeUploaderConfig(),
+    )
+
+
+def test_use_grpc_falls_back_to_http_without_grpc_client(uploader: PineconeUploader):
+    import_module = builtins.__import__
+
+    def import_without_grpc_client(name, *args, **kwargs):
+        if name == "pinecone.grpc":
+            raise ImportError("No module named 'lz4'")
+        return import_module(name, *args, **kwargs)
+
+    with mock.patch.object(builtins, "__import__", side_effect=import_without_grpc_client):
+        assert not uploader.use_grpc
+
+
+def test_upsert_grpc_error_raises_destination_error(uploader: PineconeUploader):
+    uploader._use_grpc = True
+    future = mock.MagicMock()
+    future.result.side_effect = grpc.RpcError("unavailable")
+    uploader._index = mock.MagicMock()
+    uploader._index.upsert.return_value = future
+
+    with pytest.raises(DestinationConnectionError, match="grpc error"):
+        uploader.upsert_batches_async(elements_dict=[{"id": "1", "values": [0.1]}])
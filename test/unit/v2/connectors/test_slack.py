@@ -0,0 +1,121 @@
+import asyncio
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData, FileDataSourceMetadata, SourceIdentifiers
+from unstructured_ingest.v2.processes.connectors.slack import (
+    SlackAccessConfig,
+    SlackConnectionConfig,
+    SlackDownloader,
+    SlackDownloaderConfig,
+)
+
+
+@pytest.fixture
+def downloader(tmp_path: Path) -> SlackDownloader:
+    return SlackDownloader(
+        connection_config=SlackConnectionConfig(
+            access_config=SlackAccessConfig(token="xoxb-token"),
+        ),
+        download_config=SlackDownloaderConfig(download_dir=tmp_path),
+    )
+
+
+class AsyncPages:
+    def __init__(self, pages: list[dict]):
+        self.pages = pages
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for page in self.pages:
+            yield page
+
+
+def test_get_thread_skips_messages_without_replies(downloader: SlackDownloader):
+    client = mock.MagicMock()
+    message = {"ts": "1.0", "text": "hello", "reply_count": 0}
+
+    thread = asyncio.run(
+        downloader._get_thread(
+            client=client, channel="C1", message=message, semaphore=asyncio.Semaphore(1)
+        )
+    )
+
+    assert thread == [message]
+    client.conversations_replies.assert_not_called()
+
+
+def test_get_thread_fetches_replies(downloader: SlackDownloader):
+    message = {"ts": "1.0", "text": "hello", "reply_count": 2}
+    replies = [message, {"ts": "2.0", "text": "first"}, {"ts": "3.0", "text": "second"}]
+    client = mock.MagicMock()
+    client.conversations_replies = mock.AsyncMock(
+        return_value=AsyncPages([{"messages": replies[:2]}, {"messages": replies[2:]}])
+    )
+
+    thread = asyncio.run(
+        downloader._get_thread(
+            client=client, channel="C1", message=message, semaphore=asyncio.Semaphore(1)
+        )
+    )
+
+    assert thread == replies
+    client.conversations_replies.assert_awaited_once_with(channel="C1", ts="1.0", limit=200)
+
+
+def test_thread_to_xml(downloader: SlackDownloader):
+    xml = downloader._thread_to_xml(
+        [{"text": "question & <answer>"}, {"text": "first"}, {"text": "second"}]
+    )
+
+    message = ET.fromstring(xml)
+    assert message.tag == "message"
+    assert message.find("text").text == "question & <answer> <reply> first <reply> second"
+
+
+@pytest.fixture
+def file_data() -> FileData:
+    return FileData(
+        identifier="conversation",
+        connector_type="slack",
+        source_identifiers=SourceIdentifiers(filename="conversation.xml", fullpath="conv.xml"),
+        metadata=FileDataSourceMetadata(
+            record_locator={"channel": "C1", "oldest": "1.0", "latest": "2.0"},
+        ),
+    )
+
+
+def test_download_conversation(downloader: SlackDownloader, file_data: FileData):
+    client = mock.MagicMock()
+    client.conversations_history = mock.AsyncMock(
+        return_value=AsyncPages([{"messages": [{"ts": "1.0", "text": "hi"}]}])
+    )
+    download_path = downloader.get_download_path(file_data)
+
+    with mock.patch.object(SlackConnectionConfig, "get_async_client", return_value=client):
+        asyncio.run(downloader._download_conversation(file_data, download_path))
+
+    messages = ET.parse(download_path).getroot()
+    assert [message.find("text").text for message in messages] == ["hi"]
+    assert list(download_path.parent.iterdir()) == [download_path]
+
+
+def test_download_failure_leaves_no_file(downloader: SlackDownloader, file_data: FileData):
+    client = mock.MagicMock()
+    client.conversations_history = mock.AsyncMock(
+        return_value=AsyncPages([{"messages": [{"ts": "1.0", "text": "hi", "reply_count": 1}]}])
+    )
+    client.conversations_replies = mock.AsyncMock(side_effect=ConnectionError("rate limited"))
+    download_path = downloader.get_download_path(file_data)
+
+    with mock.patch.object(SlackConnectionConfig, "get_async_client", return_value=client):
+        with pytest.raises(ConnectionError):
+            asyncio.run(downloader._download_conversation(file_data, download_path))
+
+    assert not download_path.exists()
+    assert not list(download_path.parent.iterdir())
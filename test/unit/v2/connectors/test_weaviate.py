@@ -0,0 +1,32 @@
+from unittest import mock
+
+from unstructured_ingest.v2.processes.connectors.weaviate.local import (
+    LocalWeaviateConnectionConfig,
+    LocalWeaviateUploader,
+    LocalWeaviateUploaderConfig,
+)
+from unstructured_ingest.v2.processes.connectors.weaviate.weaviate import DELETE_BATCH_SIZE
+
+
+def test_delete_by_record_ids_matches_exact_ids_in_chunks():
+    uploader = LocalWeaviateUploader(
+        upload_config=LocalWeaviateUploaderConfig(collection="elements"),
+        connection_config=LocalWeaviateConnectionConfig(),
+    )
+    client = mock.MagicMock()
+    collection = client.collections.get.return_value
+    collection.data.delete_many.return_value = mock.MagicMock(failed=0, successful=0)
+    record_ids = [f"00000000-0000-0000-0000-{i:012}" for i in range(DELETE_BATCH_SIZE + 1)]
+
+    uploader.delete_by_record_ids(client=client, record_ids=record_ids)
+
+    first_filter, last_filter = [
+        call.kwargs["where"] for call in collection.data.delete_many.call_args_list
+    ]
+    # A single filter is passed as is rather than wrapped in an "or" filter
+    assert len(first_filter.filters) == DELETE_BATCH_SIZE
+    matched = [
+        (record_filter.operator.value, record_filter.value)
+        for record_filter in [*first_filter.filters, last_filter]
+    ]
+    assert matched == [("Equal", record_id) for record_id in record_ids]
@@ -1,7 +1,18 @@
+import json
+from pathlib import Path
+
 import pytest
 from pydantic import Secret, ValidationError
 
-from unstructured_ingest.v2.interfaces import AccessConfig, ConnectionConfig
+from unstructured_ingest.v2.interfaces import (
+    AccessConfig,
+    ConnectionConfig,
+    FileData,
+    SourceIdentifiers,
+    UploadContent,
+    Uploader,
+    UploaderConfig,
+)
 
 
 def test_failing_connection_config():
@@ -24,3 +35,29 @@ def test_happy_path_connection_config():
 
     connection_config = MyConnectionConfig(access_config=MyAccessConfig(sensitive_value="this"))
     assert connection_config
+
+
+def test_uploader_batch_contents(tmp_path: Path):
+    contents = []
+    for i, num_elements in enumerate([2, 3, 1]):
+        path = tmp_path / f"doc-{i}.json"
+        with path.open("w") as f:
+            json.dump([{"text": f"{i}-{j}"} for j in range(num_elements)], f)
+        file_data = FileData(
+            identifier=f"doc-{i}",
+            connector_type="fake",
+            source_identifiers=SourceIdentifiers(filename=path.name, fullpath=path.name),
+        )
+        contents.append(UploadContent(path=path, file_data=file_data))
+
+    uploader = Uploader(
+        upload_config=UploaderConfig(), connector_type="fake", connection_config=None
+    )
+    batches = list(uploader.batch_contents(contents=contents, max_elements=4))
+
+    # Documents are never split across batches
+    assert [[fd.identifier for fd in file_data] for _, file_data in batches] == [
+        ["doc-0", "doc-1"],
+        ["doc-2"],
+    ]
+    assert [len(data) for data, _ in batches] == [5, 1]
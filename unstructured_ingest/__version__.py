@@ -1 +1 @@
-__version__ = "0.3.12-dev2"  # pragma: no cover
+__version__ = "0.3.12-dev27"  # pragma: no cover
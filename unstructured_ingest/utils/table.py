@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 import pandas as pd
 
@@ -71,3 +71,27 @@ def convert_to_pandas_dataframe(
     if drop_empty_cols:
         df.dropna(axis=1, how="all", inplace=True)
     return df
+
+
+def get_element_columns(
+    elements_dict: list[dict[str, Any]], columns: Iterable[str], fill_value: Any = None
+) -> pd.DataFrame:
+    """Build a dataframe of the given columns out of the fields of each element, its metadata,
+    data source and coordinates, without copying and merging every element dict."""
+    columns = set(columns)
+    data: dict[str, list[Any]] = {}
+    for i, element in enumerate(elements_dict):
+        metadata = element.get("metadata") or {}
+        for source in (
+            element,
+            metadata,
+            metadata.get("data_source") or {},
+            metadata.get("coordinates") or {},
+        ):
+            for key, value in source.items():
+                if key not in columns:
+                    continue
+                if key not in data:
+                    data[key] = [fill_value] * len(elements_dict)
+                data[key][i] = value
+    return pd.DataFrame(data=data, index=pd.RangeIndex(len(elements_dict)))
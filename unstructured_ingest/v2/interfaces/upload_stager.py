@@ -7,6 +7,7 @@ from typing import Any, TypeVar
 import ndjson
 from pydantic import BaseModel
 
+from unstructured_ingest.utils.data_prep import batch_generator
 from unstructured_ingest.v2.interfaces.file_data import FileData
 from unstructured_ingest.v2.interfaces.process import BaseProcess
 
@@ -17,6 +18,9 @@ class UploadStagerConfig(BaseModel):
 
 UploadStagerConfigT = TypeVar("UploadStagerConfigT", bound=UploadStagerConfig)
 
+# Number of elements read, conformed and written at a time when streaming ndjson content
+STREAM_BATCH_SIZE = 1000
+
 
 @dataclass
 class UploadStager(BaseProcess, ABC):
@@ -45,6 +49,11 @@ class UploadStager(BaseProcess, ABC):
     def conform_dict(self, element_dict: dict, file_data: FileData) -> dict:
         return element_dict
 
+    def conform_batch(self, elements: list[dict], file_data: FileData) -> list[dict]:
+        return [
+            self.conform_dict(element_dict=element, file_data=file_data) for element in elements
+        ]
+
     def get_output_path(self, output_filename: str, output_dir: Path) -> Path:
         output_path = Path(output_filename)
         output_filename = f"{Path(output_filename).stem}{output_path.suffix}"
@@ -53,23 +62,20 @@ class UploadStager(BaseProcess, ABC):
         return output_path
 
     def stream_update(self, input_file: Path, output_file: Path, file_data: FileData) -> None:
-        with input_file.open() as in_f:
-            reader = ndjson.reader(in_f)
-            with output_file.open("w") as out_f:
-                writer = ndjson.writer(out_f)
-                for element in reader:
-                    conformed_element = self.conform_dict(element_dict=element, file_data=file_data)
+        # Only STREAM_BATCH_SIZE elements are held in memory at a time
+        with input_file.open() as in_f, output_file.open("w") as out_f:
+            writer = ndjson.writer(out_f)
+            for elements in batch_generator(ndjson.reader(in_f), batch_size=STREAM_BATCH_SIZE):
+                for conformed_element in self.conform_batch(
+                    elements=list(elements), file_data=file_data
+                ):
                     writer.writerow(row=conformed_element)
-                    writer.f.flush()
 
     def process_whole(self, input_file: Path, output_file: Path, file_data: FileData) -> None:
         with input_file.open() as in_f:
             elements_contents = json.load(in_f)
 
-        conformed_elements = [
-            self.conform_dict(element_dict=element, file_data=file_data)
-            for element in elements_contents
-        ]
+        conformed_elements = self.conform_batch(elements=elements_contents, file_data=file_data)
 
         with open(output_file, "w") as out_f:
             json.dump(conformed_elements, out_f, indent=2)
@@ -1,8 +1,9 @@
 from abc import ABC
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Generator, Iterable, TypeVar
 
+import ndjson
 from pydantic import BaseModel
 
 from unstructured_ingest.utils.data_prep import get_data
@@ -17,6 +18,9 @@ class UploaderConfig(BaseModel):
 
 UploaderConfigT = TypeVar("UploaderConfigT", bound=UploaderConfig)
 
+# Number of elements after which documents grouped by Uploader.run_batch are flushed
+MAX_BATCH_ELEMENTS = 10_000
+
 
 @dataclass
 class UploadContent:
@@ -35,13 +39,44 @@ class Uploader(BaseProcess, BaseConnector, ABC):
     def is_batch(self) -> bool:
         return False
 
+    def get_content_data(self, content: UploadContent) -> list[dict]:
+        return get_data(path=content.path)
+
+    def batch_contents(
+        self, contents: list[UploadContent], max_elements: int = MAX_BATCH_ELEMENTS
+    ) -> Generator[tuple[list[dict], list[FileData]], None, None]:
+        """Group the elements of whole documents together until a group holds at least
+        max_elements elements, so each group can be sent with as few requests as possible."""
+        data, file_data = [], []
+        for content in contents:
+            data.extend(self.get_content_data(content=content))
+            file_data.append(content.file_data)
+            if len(data) >= max_elements:
+                yield data, file_data
+                data, file_data = [], []
+        if file_data:
+            yield data, file_data
+
     def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        for data, file_data in self.batch_contents(contents=contents):
+            self.run_batch_data(data=data, file_data=file_data, **kwargs)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         raise NotImplementedError()
 
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if path.suffix == ".ndjson":
+            with path.open() as f:
+                return self.run_stream(data=ndjson.reader(f), file_data=file_data, **kwargs)
         data = get_data(path=path)
         self.run_data(data=data, file_data=file_data, **kwargs)
 
+    def run_stream(self, data: Iterable[dict], file_data: FileData, **kwargs: Any) -> None:
+        """Upload the elements of a single document as they are read. By default all of them are
+        collected and passed to run_data, uploaders that can write a document in several parts
+        override this to only hold a bounded number of elements in memory."""
+        self.run_data(data=list(data), file_data=file_data, **kwargs)
+
     async def run_async(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
         data = get_data(path=path)
         await self.run_data_async(data=data, file_data=file_data, **kwargs)
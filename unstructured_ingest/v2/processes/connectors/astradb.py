@@ -52,6 +52,8 @@ if TYPE_CHECKING:
 CONNECTOR_TYPE = "astradb"
 
 MAX_CONTENT_PARAM_BYTE_SIZE = 8000
+# The Data API rejects $in filters with more values
+MAX_DELETE_IDS = 100
 
 
 class AstraDBAdditionalMetadata(BaseModel):
@@ -162,6 +164,9 @@ class AstraDBUploaderConfig(UploaderConfig):
         examples=['{"deny": ["metadata"]}'],
     )
     batch_size: int = Field(default=20, description="Number of records per batch")
+    max_concurrent_requests: int = Field(
+        default=20, ge=1, description="Number of insert requests sent concurrently"
+    )
     record_id_key: str = Field(
         default=RECORD_ID_LABEL,
         description="searchable key to find entries for the same record on previous runs",
@@ -334,6 +339,8 @@ class AstraDBUploader(Uploader):
     connection_config: AstraDBConnectionConfig
     upload_config: AstraDBUploaderConfig
     connector_type: str = CONNECTOR_TYPE
+    _collection: Optional["AstraDBCollection"] = field(init=False, default=None)
+    _async_collection: Optional["AstraDBAsyncCollection"] = field(init=False, default=None)
 
     def precheck(self) -> None:
         try:
@@ -348,42 +355,103 @@ class AstraDBUploader(Uploader):
 
     @requires_dependencies(["astrapy"], extras="astradb")
     def get_collection(self) -> "AstraDBCollection":
-        return get_astra_collection(
-            connection_config=self.connection_config,
-            collection_name=self.upload_config.collection_name,
-            keyspace=self.upload_config.keyspace,
-        )
+        # The collection handle is reused for every document of the run
+        if self._collection is None:
+            self._collection = get_astra_collection(
+                connection_config=self.connection_config,
+                collection_name=self.upload_config.collection_name,
+                keyspace=self.upload_config.keyspace,
+            )
+        return self._collection
 
-    def delete_by_record_id(self, collection: "AstraDBCollection", file_data: FileData):
+    @requires_dependencies(["astrapy"], extras="astradb")
+    async def get_async_collection(self) -> "AstraDBAsyncCollection":
+        if self._async_collection is None:
+            self._async_collection = await get_async_astra_collection(
+                connection_config=self.connection_config,
+                collection_name=self.upload_config.collection_name,
+                keyspace=self.upload_config.keyspace,
+            )
+        return self._async_collection
+
+    def get_delete_filters(self, record_ids: list[str]) -> Generator[dict, None, None]:
+        for ids in batch_generator(record_ids, batch_size=MAX_DELETE_IDS):
+            yield {self.upload_config.record_id_key: {"$in": list(ids)}}
+
+    def get_insert_kwargs(self) -> dict:
+        # Unordered inserts let astrapy send the chunks concurrently
+        return {
+            "ordered": False,
+            "chunk_size": self.upload_config.batch_size,
+            "concurrency": self.upload_config.max_concurrent_requests,
+        }
+
+    def delete_by_record_ids(self, collection: "AstraDBCollection", record_ids: list[str]):
         logger.debug(
             f"deleting records from collection {collection.name} "
             f"with {self.upload_config.record_id_key} "
-            f"set to {file_data.identifier}"
+            f"in {record_ids}"
         )
-        delete_filter = {self.upload_config.record_id_key: {"$eq": file_data.identifier}}
-        delete_resp = collection.delete_many(filter=delete_filter)
+        deleted_count = 0
+        for delete_filter in self.get_delete_filters(record_ids=record_ids):
+            deleted_count += collection.delete_many(filter=delete_filter).deleted_count
+        logger.debug(f"deleted {deleted_count} records from collection {collection.name}")
+
+    async def delete_by_record_ids_async(
+        self, collection: "AstraDBAsyncCollection", record_ids: list[str]
+    ):
         logger.debug(
-            f"deleted {delete_resp.deleted_count} records from collection {collection.name}"
+            f"deleting records from collection {collection.name} "
+            f"with {self.upload_config.record_id_key} "
+            f"in {record_ids}"
         )
+        deleted_count = 0
+        for delete_filter in self.get_delete_filters(record_ids=record_ids):
+            delete_resp = await collection.delete_many(filter=delete_filter)
+            deleted_count += delete_resp.deleted_count
+        logger.debug(f"deleted {deleted_count} records from collection {collection.name}")
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def is_async(self) -> bool:
+        return True
+
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(data)} objects to destination "
+            f"writing {len(data)} objects from {len(file_data)} documents to destination "
             f"collection {self.upload_config.collection_name}"
         )
 
-        astra_db_batch_size = self.upload_config.batch_size
         collection = self.get_collection()
 
-        self.delete_by_record_id(collection=collection, file_data=file_data)
+        self.delete_by_record_ids(
+            collection=collection, record_ids=[fd.identifier for fd in file_data]
+        )
+
+        collection.insert_many(data, **self.get_insert_kwargs())
 
-        for chunk in batch_generator(data, astra_db_batch_size):
-            collection.insert_many(chunk)
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
 
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
         data = get_data(path=path)
         self.run_data(data=data, file_data=file_data, **kwargs)
 
+    async def run_data_async(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        logger.info(
+            f"writing {len(data)} objects from {file_data.identifier} to destination "
+            f"collection {self.upload_config.collection_name}"
+        )
+
+        collection = await self.get_async_collection()
+
+        await self.delete_by_record_ids_async(
+            collection=collection, record_ids=[file_data.identifier]
+        )
+
+        await collection.insert_many(data, **self.get_insert_kwargs())
+
 
 astra_db_source_entry = SourceRegistryEntry(
     indexer=AstraDBIndexer,
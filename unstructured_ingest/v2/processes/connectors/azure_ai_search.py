@@ -1,7 +1,8 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generator
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
 from pydantic import Field, Secret
 
@@ -13,6 +14,7 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -26,7 +28,7 @@ from unstructured_ingest.v2.processes.connectors.utils import parse_datetime
 from unstructured_ingest.v2.utils import get_enhanced_element_id
 
 if TYPE_CHECKING:
-    from azure.search.documents import SearchClient
+    from azure.search.documents import IndexDocumentsBatch, SearchClient
     from azure.search.documents.indexes import SearchIndexClient
 
 CONNECTOR_TYPE = "azure_ai_search"
@@ -84,6 +86,9 @@ class AzureAISearchUploadStagerConfig(UploadStagerConfig):
 
 class AzureAISearchUploaderConfig(UploaderConfig):
     batch_size: int = Field(default=100, description="Number of records per batch")
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, description="Number of batches uploaded concurrently"
+    )
     record_id_key: str = Field(
         default=RECORD_ID_LABEL,
         description="searchable key to find entries for the same record on previous runs",
@@ -105,42 +110,31 @@ class AzureAISearchUploadStager(UploadStager):
         data = element_dict.copy()
         data["id"] = get_enhanced_element_id(element_dict=data, file_data=file_data)
         data[RECORD_ID_LABEL] = file_data.identifier
-
-        if points := data.get("metadata", {}).get("coordinates", {}).get("points"):
-            data["metadata"]["coordinates"]["points"] = json.dumps(points)
-        if version := data.get("metadata", {}).get("data_source", {}).get("version"):
-            data["metadata"]["data_source"]["version"] = str(version)
-        if record_locator := data.get("metadata", {}).get("data_source", {}).get("record_locator"):
-            data["metadata"]["data_source"]["record_locator"] = json.dumps(record_locator)
-        if permissions_data := (
-            data.get("metadata", {}).get("data_source", {}).get("permissions_data")
+        metadata = data.get("metadata", {})
+        data_source = metadata.get("data_source", {})
+
+        if points := metadata.get("coordinates", {}).get("points"):
+            metadata["coordinates"]["points"] = json.dumps(points)
+        if version := data_source.get("version"):
+            data_source["version"] = str(version)
+        if record_locator := data_source.get("record_locator"):
+            data_source["record_locator"] = json.dumps(record_locator)
+        if permissions_data := data_source.get("permissions_data"):
+            data_source["permissions_data"] = json.dumps(permissions_data)
+        if links := metadata.get("links"):
+            metadata["links"] = [json.dumps(link) for link in links]
+        for date_field, container in (
+            ("last_modified", metadata),
+            ("date_created", data_source),
+            ("date_modified", data_source),
+            ("date_processed", data_source),
         ):
-            data["metadata"]["data_source"]["permissions_data"] = json.dumps(permissions_data)
-        if links := data.get("metadata", {}).get("links"):
-            data["metadata"]["links"] = [json.dumps(link) for link in links]
-        if last_modified := data.get("metadata", {}).get("last_modified"):
-            data["metadata"]["last_modified"] = parse_datetime(last_modified).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-        if date_created := data.get("metadata", {}).get("data_source", {}).get("date_created"):
-            data["metadata"]["data_source"]["date_created"] = parse_datetime(date_created).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-
-        if date_modified := data.get("metadata", {}).get("data_source", {}).get("date_modified"):
-            data["metadata"]["data_source"]["date_modified"] = parse_datetime(
-                date_modified
-            ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        if date_processed := data.get("metadata", {}).get("data_source", {}).get("date_processed"):
-            data["metadata"]["data_source"]["date_processed"] = parse_datetime(
-                date_processed
-            ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        if regex_metadata := data.get("metadata", {}).get("regex_metadata"):
-            data["metadata"]["regex_metadata"] = json.dumps(regex_metadata)
-        if page_number := data.get("metadata", {}).get("page_number"):
-            data["metadata"]["page_number"] = str(page_number)
+            if date_value := container.get(date_field):
+                container[date_field] = parse_datetime(date_value).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        if regex_metadata := metadata.get("regex_metadata"):
+            metadata["regex_metadata"] = json.dumps(regex_metadata)
+        if page_number := metadata.get("page_number"):
+            metadata["page_number"] = str(page_number)
         return data
 
 
@@ -149,55 +143,67 @@ class AzureAISearchUploader(Uploader):
     upload_config: AzureAISearchUploaderConfig
     connection_config: AzureAISearchConnectionConfig
     connector_type: str = CONNECTOR_TYPE
-
-    def query_docs(self, record_id: str, index_key: str) -> list[str]:
-        with self.connection_config.get_search_client() as search_client:
-            results = list(
-                search_client.search(filter=f"record_id eq '{record_id}'", select=[index_key])
-            )
+    _index_key: Optional[str] = field(init=False, default=None)
+    _can_delete: Optional[bool] = field(init=False, default=None)
+
+    def query_docs(
+        self, search_client: "SearchClient", record_ids: list[str], index_key: str
+    ) -> list[str]:
+        # search.in matches against any of the delimited values in a single filter
+        record_id_filter = "search.in({}, '{}', '|')".format(
+            self.upload_config.record_id_key, "|".join(record_ids)
+        )
+        results = list(search_client.search(filter=record_id_filter, select=[index_key]))
         return [result[index_key] for result in results]
 
-    def delete_by_record_id(self, file_data: FileData, index_key: str) -> None:
-        logger.debug(
-            f"deleting any content with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
-            f"from azure cognitive search index: {self.connection_config.index}"
-        )
-        doc_ids_to_delete = self.query_docs(record_id=file_data.identifier, index_key=index_key)
-        if not doc_ids_to_delete:
-            return
-        with self.connection_config.get_search_client() as search_client:
-            results = search_client.delete_documents(
-                documents=[{index_key: doc_id} for doc_id in doc_ids_to_delete]
-            )
-        errors = []
-        success = []
-        for result in results:
-            if result.succeeded:
-                success.append(result)
-            else:
-                errors.append(result)
-        logger.debug(f"results: {len(success)} successes, {len(errors)} failures")
-        if errors:
-            raise WriteError(
-                ", ".join(
-                    [f"[{error.status_code}] {error.error_message}" for error in errors],
-                ),
+    @requires_dependencies(["azure.search"], extras="azure-ai-search")
+    def get_index_batch(
+        self, search_client: "SearchClient", data: list[dict], file_data: list[FileData]
+    ) -> Generator["IndexDocumentsBatch", None, None]:
+        """Yield batches of up to batch_size actions. Documents left over from previous runs of
+        the records are deleted through delete actions sent along the uploads, while the
+        documents with the same key are replaced by the uploads themselves."""
+        from azure.search.documents import IndexDocumentsBatch
+
+        index_key = self.get_index_key()
+        stale_doc_ids = []
+        if self.can_delete():
+            record_ids = [fd.identifier for fd in file_data]
+            logger.debug(
+                f"deleting any content with metadata "
+                f"{self.upload_config.record_id_key} in {record_ids} "
+                f"from azure cognitive search index: {self.connection_config.index}"
             )
+            new_doc_ids = {element.get(index_key) for element in data}
+            stale_doc_ids = [
+                doc_id
+                for doc_id in self.query_docs(
+                    search_client=search_client, record_ids=record_ids, index_key=index_key
+                )
+                if doc_id not in new_doc_ids
+            ]
+        else:
+            logger.warning("criteria for deleting previous content not met, skipping")
+
+        actions = [("delete", {index_key: doc_id}) for doc_id in stale_doc_ids]
+        actions.extend(("upload", element) for element in data)
+        for chunk in batch_generator(actions, self.upload_config.batch_size):
+            batch = IndexDocumentsBatch()
+            batch.add_delete_actions([document for action, document in chunk if action == "delete"])
+            batch.add_upload_actions([document for action, document in chunk if action == "upload"])
+            yield batch
 
     @DestinationConnectionError.wrap
     @requires_dependencies(["azure"], extras="azure-ai-search")
-    def write_dict(
-        self, elements_dict: list[dict[str, Any]], search_client: "SearchClient"
-    ) -> None:
+    def write_batch(self, batch: "IndexDocumentsBatch", search_client: "SearchClient") -> None:
         import azure.core.exceptions
 
         logger.info(
-            f"writing {len(elements_dict)} documents to destination "
+            f"writing {len(batch.actions)} documents to destination "
             f"index at {self.connection_config.index}",
         )
         try:
-            results = search_client.upload_documents(documents=elements_dict)
+            results = search_client.index_documents(batch=batch)
         except azure.core.exceptions.HttpResponseError as http_error:
             raise WriteError(f"http error: {http_error}") from http_error
 
@@ -219,26 +225,29 @@ class AzureAISearchUploader(Uploader):
                 ),
             )
 
-    def can_delete(self) -> bool:
+    def load_index_schema(self) -> None:
+        # The index schema is only fetched once per run
+        if self._index_key is not None:
+            return
         with self.connection_config.get_search_index_client() as search_index_client:
             index = search_index_client.get_index(name=self.connection_config.index)
         index_fields = index.fields
+        key_fields = [field for field in index_fields if field.key]
+        if not key_fields:
+            raise ValueError("no key field found in index fields")
         record_id_fields = [
             field for field in index_fields if field.name == self.upload_config.record_id_key
         ]
-        if not record_id_fields:
-            return False
-        record_id_field = record_id_fields[0]
-        return record_id_field.filterable
+        self._can_delete = bool(record_id_fields) and bool(record_id_fields[0].filterable)
+        self._index_key = key_fields[0].name
+
+    def can_delete(self) -> bool:
+        self.load_index_schema()
+        return self._can_delete
 
     def get_index_key(self) -> str:
-        with self.connection_config.get_search_index_client() as search_index_client:
-            index = search_index_client.get_index(name=self.connection_config.index)
-        index_fields = index.fields
-        key_fields = [field for field in index_fields if field.key]
-        if not key_fields:
-            raise ValueError("no key field found in index fields")
-        return key_fields[0].name
+        self.load_index_schema()
+        return self._index_key
 
     def precheck(self) -> None:
         try:
@@ -248,23 +257,50 @@ class AzureAISearchUploader(Uploader):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def is_batch(self) -> bool:
+        return True
+
+    def write_data(
+        self,
+        search_client: "SearchClient",
+        executor: ThreadPoolExecutor,
+        data: list[dict],
+        file_data: list[FileData],
+    ) -> None:
         logger.info(
-            f"writing document batches to destination"
+            f"writing document batches of {len(file_data)} documents to destination"
             f" endpoint at {str(self.connection_config.endpoint)}"
             f" index at {str(self.connection_config.index)}"
             f" with batch size {str(self.upload_config.batch_size)}"
         )
-        if self.can_delete():
-            index_key = self.get_index_key()
-            self.delete_by_record_id(file_data=file_data, index_key=index_key)
-        else:
-            logger.warning("criteria for deleting previous content not met, skipping")
+        # Consuming the results waits for every batch and raises the first error
+        list(
+            executor.map(
+                lambda batch: self.write_batch(batch=batch, search_client=search_client),
+                self.get_index_batch(search_client=search_client, data=data, file_data=file_data),
+            )
+        )
 
-        batch_size = self.upload_config.batch_size
-        with self.connection_config.get_search_client() as search_client:
-            for chunk in batch_generator(data, batch_size):
-                self.write_dict(elements_dict=chunk, search_client=search_client)  # noqa: E203
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        # The search client and thread pool are shared by all documents of the batch
+        with self.connection_config.get_search_client() as search_client, ThreadPoolExecutor(
+            max_workers=self.upload_config.max_concurrent_requests
+        ) as executor:
+            for data, file_data in self.batch_contents(contents=contents):
+                self.write_data(
+                    search_client=search_client, executor=executor, data=data, file_data=file_data
+                )
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
+        with self.connection_config.get_search_client() as search_client, ThreadPoolExecutor(
+            max_workers=self.upload_config.max_concurrent_requests
+        ) as executor:
+            self.write_data(
+                search_client=search_client, executor=executor, data=data, file_data=file_data
+            )
+
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
 
 
 azure_ai_search_destination_entry = DestinationRegistryEntry(
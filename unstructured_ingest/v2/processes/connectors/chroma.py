@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Annotated, Any, Optional
@@ -13,6 +14,7 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -121,6 +123,9 @@ class ChromaUploadStager(UploadStager):
 class ChromaUploaderConfig(UploaderConfig):
     collection_name: str = Field(description="The name of the Chroma collection to write into.")
     batch_size: int = Field(default=100, description="Number of records per batch")
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, description="Number of batches upserted concurrently"
+    )
 
 
 @dataclass
@@ -169,17 +174,53 @@ class ChromaUploader(Uploader):
         )
         return chroma_dict
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def is_batch(self) -> bool:
+        return True
+
+    def get_collection(self):
+        client = self.connection_config.get_client()
+        return client.get_or_create_collection(name=self.upload_config.collection_name)
+
+    def write_data(
+        self, collection, executor: ThreadPoolExecutor, data: list[dict], file_data: list[FileData]
+    ) -> None:
         logger.info(
-            f"writing {len(data)} objects to destination "
+            f"writing {len(data)} objects from {len(file_data)} documents to destination "
             f"collection {self.upload_config.collection_name} "
             f"at {self.connection_config.host}",
         )
-        client = self.connection_config.get_client()
+        # Consuming the results waits for every upsert and raises the first error
+        list(
+            executor.map(
+                lambda chunk: self.upsert_batch(collection, self.prepare_chroma_list(chunk)),
+                batch_generator(data, self.upload_config.batch_size),
+            )
+        )
 
-        collection = client.get_or_create_collection(name=self.upload_config.collection_name)
-        for chunk in batch_generator(data, self.upload_config.batch_size):
-            self.upsert_batch(collection, self.prepare_chroma_list(chunk))
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        # The collection and the thread pool are shared by all documents of the batch
+        collection = self.get_collection()
+        with ThreadPoolExecutor(
+            max_workers=self.upload_config.max_concurrent_requests,
+            thread_name_prefix="chroma-uploader",
+        ) as executor:
+            for data, file_data in self.batch_contents(contents=contents):
+                self.write_data(
+                    collection=collection, executor=executor, data=data, file_data=file_data
+                )
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
+        collection = self.get_collection()
+        with ThreadPoolExecutor(
+            max_workers=self.upload_config.max_concurrent_requests,
+            thread_name_prefix="chroma-uploader",
+        ) as executor:
+            self.write_data(
+                collection=collection, executor=executor, data=data, file_data=file_data
+            )
+
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
 
 
 chroma_destination_entry = DestinationRegistryEntry(
@@ -1,6 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, List, Optional
+from time import time
+from typing import TYPE_CHECKING, Any, Generator, List, Optional
 
 from pydantic import Field, Secret
 
@@ -8,6 +11,8 @@ from unstructured_ingest.error import SourceConnectionError
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
+    BatchFileData,
+    BatchItem,
     ConnectionConfig,
     Downloader,
     DownloaderConfig,
@@ -17,6 +22,7 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    download_responses,
 )
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connector_registry import (
@@ -27,6 +33,43 @@ if TYPE_CHECKING:
     from atlassian import Confluence
 
 CONNECTOR_TYPE = "confluence"
+PAGE_EXPAND = "history.lastUpdated,version,body.view"
+
+
+def create_page_file_data(
+    url: str, space_id: str, doc_id: str, date_processed: Optional[str] = None
+) -> FileData:
+    # Build metadata
+    metadata = FileDataSourceMetadata(
+        date_processed=date_processed or str(time()),
+        url=f"{url}/pages/{doc_id}",
+        record_locator={
+            "space_id": space_id,
+            "document_id": doc_id,
+        },
+    )
+    additional_metadata = {
+        "space_id": space_id,
+        "document_id": doc_id,
+    }
+
+    # Construct relative path and filename
+    filename = f"{doc_id}.html"
+    relative_path = str(Path(space_id) / filename)
+
+    source_identifiers = SourceIdentifiers(
+        filename=filename,
+        fullpath=relative_path,
+        rel_path=relative_path,
+    )
+
+    return FileData(
+        identifier=doc_id,
+        connector_type=CONNECTOR_TYPE,
+        metadata=metadata,
+        additional_metadata=additional_metadata,
+        source_identifiers=source_identifiers,
+    )
 
 
 class ConfluenceAccessConfig(AccessConfig):
@@ -70,6 +113,14 @@ class ConfluenceIndexerConfig(IndexerConfig):
         100, description="Maximum number of documents to fetch from each space"
     )
     spaces: Optional[List[str]] = Field(None, description="List of specific space keys to index")
+    max_concurrent_requests: int = Field(
+        10, description="Maximum number of spaces to list pages from concurrently"
+    )
+    batch_size: int = Field(
+        1,
+        description="Number of pages from the same space to group together "
+        "and download with a single request",
+    )
 
 
 @dataclass
@@ -114,46 +165,35 @@ class ConfluenceIndexer(Indexer):
         doc_ids = [{"space_id": space_id, "doc_id": page["id"]} for page in pages]
         return doc_ids
 
-    def run(self) -> Generator[FileData, None, None]:
-        from time import time
+    def _create_batch_file_data(self, space_id: str, doc_ids: list[str]) -> BatchFileData:
+        return BatchFileData(
+            connector_type=self.connector_type,
+            metadata=FileDataSourceMetadata(date_processed=str(time())),
+            additional_metadata={"space_id": space_id},
+            batch_items=[BatchItem(identifier=doc_id) for doc_id in doc_ids],
+        )
 
+    def run(self) -> Generator[FileData, None, None]:
         space_ids = self._get_space_ids()
-        for space_id in space_ids:
-            doc_ids = self._get_docs_ids_within_one_space(space_id)
-            for doc in doc_ids:
-                doc_id = doc["doc_id"]
-                # Build metadata
-                metadata = FileDataSourceMetadata(
-                    date_processed=str(time()),
-                    url=f"{self.connection_config.url}/pages/{doc_id}",
-                    record_locator={
-                        "space_id": space_id,
-                        "document_id": doc_id,
-                    },
-                )
-                additional_metadata = {
-                    "space_id": space_id,
-                    "document_id": doc_id,
-                }
-
-                # Construct relative path and filename
-                filename = f"{doc_id}.html"
-                relative_path = str(Path(space_id) / filename)
-
-                source_identifiers = SourceIdentifiers(
-                    filename=filename,
-                    fullpath=relative_path,
-                    rel_path=relative_path,
-                )
-
-                file_data = FileData(
-                    identifier=doc_id,
-                    connector_type=self.connector_type,
-                    metadata=metadata,
-                    additional_metadata=additional_metadata,
-                    source_identifiers=source_identifiers,
-                )
-                yield file_data
+        batch_size = self.index_config.batch_size
+        with ThreadPoolExecutor(
+            max_workers=self.index_config.max_concurrent_requests,
+            thread_name_prefix="confluence-indexer",
+        ) as executor:
+            for space_id, doc_ids in zip(
+                space_ids, executor.map(self._get_docs_ids_within_one_space, space_ids)
+            ):
+                if batch_size > 1:
+                    for i in range(0, len(doc_ids), batch_size):
+                        yield self._create_batch_file_data(
+                            space_id=space_id,
+                            doc_ids=[doc["doc_id"] for doc in doc_ids[i : i + batch_size]],
+                        )
+                    continue
+                for doc in doc_ids:
+                    yield create_page_file_data(
+                        url=self.connection_config.url, space_id=space_id, doc_id=doc["doc_id"]
+                    )
 
 
 class ConfluenceDownloaderConfig(DownloaderConfig):
@@ -166,21 +206,7 @@ class ConfluenceDownloader(Downloader):
     download_config: ConfluenceDownloaderConfig = field(default_factory=ConfluenceDownloaderConfig)
     connector_type: str = CONNECTOR_TYPE
 
-    def run(self, file_data: FileData, **kwargs) -> DownloadResponse:
-        doc_id = file_data.identifier
-        try:
-            client = self.connection_config.get_client()
-            page = client.get_page_by_id(
-                page_id=doc_id,
-                expand="history.lastUpdated,version,body.view",
-            )
-        except Exception as e:
-            logger.error(f"Failed to retrieve page with ID {doc_id}: {e}", exc_info=True)
-            raise SourceConnectionError(f"Failed to retrieve page with ID {doc_id}: {e}")
-
-        if not page:
-            raise ValueError(f"Page with ID {doc_id} does not exist.")
-
+    def write_page(self, page: dict, file_data: FileData) -> DownloadResponse:
         content = page["body"]["view"]["value"]
 
         filepath = file_data.source_identifiers.relative_path
@@ -197,6 +223,74 @@ class ConfluenceDownloader(Downloader):
 
         return self.generate_download_response(file_data=file_data, download_path=download_path)
 
+    def get_pages(self, doc_ids: list[str]) -> list[dict]:
+        # The content search endpoint expands the bodies of many pages in a single request
+        client = self.connection_config.get_client()
+        cql = "id in ({})".format(",".join(doc_ids))
+        pages = []
+        while len(pages) < len(doc_ids):
+            response = client.get(
+                "rest/api/content/search",
+                params={
+                    "cql": cql,
+                    "expand": PAGE_EXPAND,
+                    "start": len(pages),
+                    "limit": len(doc_ids) - len(pages),
+                },
+            )
+            results = response.get("results", []) if response else []
+            if not results:
+                break
+            pages.extend(results)
+        return pages
+
+    def run_batch(self, file_data: BatchFileData) -> list[DownloadResponse]:
+        space_id = file_data.additional_metadata["space_id"]
+        doc_ids = [item.identifier for item in file_data.batch_items]
+        try:
+            pages = self.get_pages(doc_ids=doc_ids)
+        except Exception as e:
+            logger.error(f"Failed to retrieve pages with IDs {doc_ids}: {e}", exc_info=True)
+            raise SourceConnectionError(f"Failed to retrieve pages with IDs {doc_ids}: {e}")
+
+        if missing := set(doc_ids) - {page["id"] for page in pages}:
+            logger.warning(f"Pages with IDs {sorted(missing)} do not exist, skipping")
+
+        responses = []
+        for page in pages:
+            page_file_data = create_page_file_data(
+                url=self.connection_config.url,
+                space_id=space_id,
+                doc_id=page["id"],
+                date_processed=file_data.metadata.date_processed,
+            )
+            responses.append(self.write_page(page=page, file_data=page_file_data))
+        return responses
+
+    def run(self, file_data: FileData, **kwargs) -> download_responses:
+        if isinstance(file_data, BatchFileData):
+            return self.run_batch(file_data=file_data)
+        doc_id = file_data.identifier
+        try:
+            client = self.connection_config.get_client()
+            page = client.get_page_by_id(
+                page_id=doc_id,
+                expand=PAGE_EXPAND,
+            )
+        except Exception as e:
+            logger.error(f"Failed to retrieve page with ID {doc_id}: {e}", exc_info=True)
+            raise SourceConnectionError(f"Failed to retrieve page with ID {doc_id}: {e}")
+
+        if not page:
+            raise ValueError(f"Page with ID {doc_id} does not exist.")
+
+        return self.write_page(page=page, file_data=file_data)
+
+    async def run_async(self, file_data: FileData, **kwargs: Any) -> download_responses:
+        # The atlassian client is blocking, offload it so downloads run concurrently,
+        # bounded by the pipeline's max_connections
+        return await asyncio.to_thread(self.run, file_data=file_data, **kwargs)
+
 
 confluence_source_entry = SourceRegistryEntry(
     connection_config=ConfluenceConnectionConfig,
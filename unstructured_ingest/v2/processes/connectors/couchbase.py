@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import time
 from contextlib import contextmanager
@@ -134,9 +135,15 @@ class CouchbaseUploader(Uploader):
             logger.error(f"Failed to validate connection {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
+    def is_batch(self) -> bool:
+        return True
+
     def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(data)} objects to destination "
+            f"writing {len(data)} objects from {len(file_data)} documents to destination "
             f"bucket, {self.connection_config.bucket} "
             f"at {self.connection_config.connection_string}",
         )
@@ -222,9 +229,6 @@ class CouchbaseDownloader(Downloader):
     download_config: CouchbaseDownloaderConfig
     connector_type: str = CONNECTOR_TYPE
 
-    def is_async(self) -> bool:
-        return False
-
     def get_identifier(self, bucket: str, record_id: str) -> str:
         f = f"{bucket}-{record_id}"
         if self.download_config.fields:
@@ -291,18 +295,6 @@ class CouchbaseDownloader(Downloader):
             download_resp = self.process_all_doc_ids(ids, collection, bucket_name, file_data)
             return list(download_resp)
 
-    def process_doc_id(
-        self,
-        doc_id: str,
-        collection: "Collection",
-        bucket_name: str,
-        file_data: CouchbaseBatchFileData,
-    ):
-        result = collection.get(doc_id)
-        return self.generate_download_response(
-            result=result.content_as[dict], bucket=bucket_name, file_data=file_data
-        )
-
     def process_all_doc_ids(
         self,
         ids: list[str],
@@ -310,11 +302,26 @@ class CouchbaseDownloader(Downloader):
         bucket_name: str,
         file_data: CouchbaseBatchFileData,
     ):
+        # Fetch the whole batch with a single multi-get rather than one round trip per id
+        multi_result = collection.get_multi(ids)
+        if not multi_result.all_ok:
+            raise SourceConnectionNetworkError(
+                "failed to get documents {}: {}".format(
+                    ", ".join(multi_result.exceptions.keys()),
+                    ", ".join(str(e) for e in multi_result.exceptions.values()),
+                )
+            )
         for doc_id in ids:
-            yield self.process_doc_id(doc_id, collection, bucket_name, file_data)
+            yield self.generate_download_response(
+                result=multi_result.results[doc_id].content_as[dict],
+                bucket=bucket_name,
+                file_data=file_data,
+            )
 
     async def run_async(self, file_data: FileData, **kwargs: Any) -> download_responses:
-        raise NotImplementedError()
+        # The couchbase client is blocking, offload it so batches are downloaded concurrently,
+        # bounded by the pipeline's max_connections
+        return await asyncio.to_thread(self.run, file_data=file_data, **kwargs)
 
 
 couchbase_destination_entry = DestinationRegistryEntry(
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from abc import ABC
 from dataclasses import dataclass
 from pathlib import Path
@@ -24,10 +25,15 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
 )
 from unstructured_ingest.v2.logger import logger
+from unstructured_ingest.v2.processes.connectors.utils import (
+    AggregatedOutputConfig,
+    write_output_shards,
+)
 
 if TYPE_CHECKING:
     from databricks.sdk import WorkspaceClient
@@ -152,7 +158,7 @@ class DatabricksVolumesDownloader(Downloader, ABC):
         return self.generate_download_response(file_data=file_data, download_path=download_path)
 
 
-class DatabricksVolumesUploaderConfig(UploaderConfig, DatabricksPathMixin):
+class DatabricksVolumesUploaderConfig(UploaderConfig, DatabricksPathMixin, AggregatedOutputConfig):
     pass
 
 
@@ -168,13 +174,40 @@ class DatabricksVolumesUploader(Uploader, ABC):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
-        output_path = os.path.join(
-            self.upload_config.path, f"{file_data.source_identifiers.filename}.json"
-        )
+    def is_batch(self) -> bool:
+        return self.upload_config.aggregate_output is not None
+
+    def upload_file(self, client: "WorkspaceClient", path: Path, output_path: str) -> None:
         with open(path, "rb") as elements_file:
-            self.connection_config.get_client().files.upload(
+            client.files.upload(
                 file_path=output_path,
                 contents=elements_file,
                 overwrite=True,
             )
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        client = self.connection_config.get_client()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for shard in write_output_shards(
+                contents=contents,
+                output_dir=Path(temp_dir),
+                file_format=self.upload_config.aggregate_output,
+                shard_size_bytes=self.upload_config.shard_size_bytes,
+            ):
+                # The manifest goes last so it only shows up once its shard is complete
+                for shard_path in [shard.path, shard.manifest_path]:
+                    self.upload_file(
+                        client=client,
+                        path=shard_path,
+                        output_path=os.path.join(self.upload_config.path, shard_path.name),
+                    )
+
+    def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if self.upload_config.aggregate_output:
+            return self.run_batch(contents=[UploadContent(path=path, file_data=file_data)])
+        output_path = os.path.join(
+            self.upload_config.path, f"{file_data.source_identifiers.filename}.json"
+        )
+        self.upload_file(
+            client=self.connection_config.get_client(), path=path, output_path=output_path
+        )
@@ -4,7 +4,7 @@ import traceback
 from dataclasses import dataclass, field
 from multiprocessing import Process, Queue
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -14,15 +14,18 @@ from unstructured_ingest.error import DestinationConnectionError
 from unstructured_ingest.utils.data_prep import get_data_df
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.utils.table import convert_to_pandas_dataframe
+from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
     UploadStagerConfig,
 )
+from unstructured_ingest.v2.interfaces.uploader import MAX_BATCH_ELEMENTS
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connector_registry import DestinationRegistryEntry
 
@@ -39,6 +42,55 @@ def write_deltalake_with_error_handling(queue, **kwargs):
         queue.put(traceback.format_exc())
 
 
+@requires_dependencies(["deltalake", "pyarrow"], extras="delta-table")
+def replace_records_with_error_handling(
+    queue,
+    table_or_uri: str,
+    data: pd.DataFrame,
+    delete_predicate: str,
+    storage_options: dict[str, str],
+):
+    """Replace the rows matching delete_predicate with data in a single commit, so the previous
+    content of the records is never lost without the new content being written."""
+    import pyarrow as pa
+    from deltalake import DeltaTable, Field
+    from deltalake.writer import write_deltalake
+
+    try:
+        if not DeltaTable.is_deltatable(table_or_uri, storage_options=storage_options):
+            write_deltalake(
+                table_or_uri=table_or_uri,
+                data=data,
+                mode="append",
+                storage_options=storage_options,
+                engine="rust",
+            )
+            return
+        table = DeltaTable(table_or_uri, storage_options=storage_options)
+        source = pa.Table.from_pandas(data, preserve_index=False)
+        # Merges don't evolve the schema, new columns are added beforehand. Columns without
+        # any value have no delta type and are left out.
+        table_columns = set(table.schema().to_pyarrow().names)
+        new_fields = [
+            Field.from_pyarrow(source_field)
+            for source_field in source.schema
+            if source_field.name not in table_columns and not pa.types.is_null(source_field.type)
+        ]
+        if new_fields:
+            table.alter.add_columns(new_fields)
+        # The join never matches: every row of the records gets deleted, every new row inserted
+        (
+            table.merge(
+                source=source, predicate="FALSE", source_alias="source", target_alias="target"
+            )
+            .when_not_matched_by_source_delete(predicate=delete_predicate)
+            .when_not_matched_insert_all()
+            .execute()
+        )
+    except Exception:
+        queue.put(traceback.format_exc())
+
+
 class DeltaTableAccessConfig(AccessConfig):
     aws_access_key_id: Optional[str] = Field(default=None, description="AWS Access Key Id")
     aws_secret_access_key: Optional[str] = Field(default=None, description="AWS Secret Access Key")
@@ -98,7 +150,15 @@ class DeltaTableUploadStager(UploadStager):
 
 
 class DeltaTableUploaderConfig(UploaderConfig):
-    pass
+    single_table: bool = Field(
+        default=False,
+        description="Write the elements of all documents to a single table at table_uri, "
+        "replacing the previous content of each record, instead of one table per document",
+    )
+    record_id_key: str = Field(
+        default=RECORD_ID_LABEL,
+        description="column added to find entries for the same record in the single table",
+    )
 
 
 @dataclass
@@ -138,34 +198,22 @@ class DeltaTableUploader(Uploader):
                 logger.error(f"failed to validate connection: {e}", exc_info=True)
                 raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def upload_dataframe(self, df: pd.DataFrame, file_data: FileData) -> None:
-        updated_upload_path = os.path.join(
-            self.connection_config.table_uri, file_data.source_identifiers.relative_path
-        )
-        logger.info(
-            f"writing {len(df)} rows to destination table "
-            f"at {updated_upload_path}\ndtypes: {df.dtypes}",
-        )
+    def write_dataframe(
+        self,
+        writer: Callable[..., None] = write_deltalake_with_error_handling,
+        **writer_kwargs: Any,
+    ) -> None:
         storage_options = {}
         self.connection_config.update_storage_options(storage_options=storage_options)
-
-        writer_kwargs = {
-            "table_or_uri": updated_upload_path,
-            "data": df,
-            "mode": "overwrite",
-            "storage_options": storage_options,
-        }
+        writer_kwargs["storage_options"] = storage_options
         queue = Queue()
         # NOTE: deltalake writer on Linux sometimes can finish but still trigger a SIGABRT and cause
         # ingest to fail, even though all tasks are completed normally. Putting the writer into a
         # process mitigates this issue by ensuring python interpreter waits properly for deltalake's
         # rust backend to finish
-        writer = Process(
-            target=write_deltalake_with_error_handling,
-            kwargs={"queue": queue, **writer_kwargs},
-        )
-        writer.start()
-        writer.join()
+        writer_process = Process(target=writer, kwargs={"queue": queue, **writer_kwargs})
+        writer_process.start()
+        writer_process.join()
 
         # Check if the queue has any exception message
         if not queue.empty():
@@ -173,6 +221,54 @@ class DeltaTableUploader(Uploader):
             logger.error(f"Exception occurred in write_deltalake: {error_message}")
             raise RuntimeError(f"Error in write_deltalake: {error_message}")
 
+    def upload_dataframe(self, df: pd.DataFrame, file_data: FileData) -> None:
+        if self.upload_config.single_table:
+            df[self.upload_config.record_id_key] = file_data.identifier
+            return self.upload_single_table(df=df, record_ids=[file_data.identifier])
+        updated_upload_path = os.path.join(
+            self.connection_config.table_uri, file_data.source_identifiers.relative_path
+        )
+        logger.info(
+            f"writing {len(df)} rows to destination table "
+            f"at {updated_upload_path}\ndtypes: {df.dtypes}",
+        )
+        self.write_dataframe(table_or_uri=updated_upload_path, data=df, mode="overwrite")
+
+    def upload_single_table(self, df: pd.DataFrame, record_ids: list[str]) -> None:
+        logger.info(
+            f"writing {len(df)} rows from {len(record_ids)} documents to destination table "
+            f"at {self.connection_config.table_uri}",
+        )
+        record_id_values = ", ".join(
+            "'{}'".format(record_id.replace("'", "''")) for record_id in record_ids
+        )
+        self.write_dataframe(
+            writer=replace_records_with_error_handling,
+            table_or_uri=self.connection_config.table_uri,
+            data=df,
+            delete_predicate=f"target.{self.upload_config.record_id_key} IN ({record_id_values})",
+        )
+
+    def is_batch(self) -> bool:
+        return self.upload_config.single_table
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        dfs, record_ids, num_rows = [], [], 0
+        for content in contents:
+            df = get_data_df(content.path)
+            df[self.upload_config.record_id_key] = content.file_data.identifier
+            dfs.append(df)
+            record_ids.append(content.file_data.identifier)
+            num_rows += len(df)
+            # Documents are buffered to write fewer, larger files in fewer commits
+            if num_rows >= MAX_BATCH_ELEMENTS:
+                self.upload_single_table(
+                    df=pd.concat(dfs, ignore_index=True), record_ids=record_ids
+                )
+                dfs, record_ids, num_rows = [], [], 0
+        if dfs:
+            self.upload_single_table(df=pd.concat(dfs, ignore_index=True), record_ids=record_ids)
+
     def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
         df = pd.DataFrame(data=data)
         self.upload_dataframe(df=df, file_data=file_data)
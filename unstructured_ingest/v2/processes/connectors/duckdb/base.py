@@ -1,12 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
+import numpy as np
 import pandas as pd
+from pydantic import Field
 
-from unstructured_ingest.v2.interfaces import FileData, UploadStager
+from unstructured_ingest.error import DestinationConnectionError
+from unstructured_ingest.utils.data_prep import get_data_df
+from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.utils.table import get_element_columns
+from unstructured_ingest.v2.interfaces import (
+    FileData,
+    UploadContent,
+    Uploader,
+    UploaderConfig,
+    UploadStager,
+)
+from unstructured_ingest.v2.interfaces.uploader import MAX_BATCH_ELEMENTS
+from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.utils import get_enhanced_element_id
 
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
 _COLUMNS = (
     "id",
     "element_id",
@@ -50,50 +70,146 @@ _COLUMNS = (
 )
 
 # _DATE_COLUMNS = ("date_created", "date_modified", "date_processed", "last_modified")
+_STRING_COLUMNS = ("version", "page_number", "regex_metadata")
 
 
 @dataclass
 class BaseDuckDBUploadStager(UploadStager):
 
-    def conform_dict(self, element_dict: dict, file_data: FileData) -> dict:
-        data = element_dict.copy()
-        metadata: dict[str, Any] = data.pop("metadata", {})
-        data_source = metadata.pop("data_source", {})
-        coordinates = metadata.pop("coordinates", {})
-
-        data.update(metadata)
-        data.update(data_source)
-        data.update(coordinates)
-
-        data["id"] = get_enhanced_element_id(element_dict=data, file_data=file_data)
-
-        # remove extraneous, not supported columns
-        data = {k: v for k, v in data.items() if k in _COLUMNS}
-        return data
-
-    def run(
-        self,
-        elements_filepath: Path,
-        file_data: FileData,
-        output_dir: Path,
-        output_filename: str,
-        **kwargs: Any,
-    ) -> Path:
-        elements_contents = self.get_data(elements_filepath=elements_filepath)
-        output_path = self.get_output_path(output_filename=output_filename, output_dir=output_dir)
-
-        output = [
-            self.conform_dict(element_dict=element_dict, file_data=file_data)
-            for element_dict in elements_contents
+    def conform_elements(self, elements: list[dict], file_data: FileData) -> pd.DataFrame:
+        df = get_element_columns(elements_dict=elements, columns=_COLUMNS, fill_value=np.nan)
+        df["id"] = [
+            get_enhanced_element_id(element_dict=element, file_data=file_data)
+            for element in elements
         ]
-        df = pd.DataFrame(data=output)
+        for column in filter(lambda x: x in df.columns, _STRING_COLUMNS):
+            df[column] = df[column].astype(str)
+        return df
+
+    def conform_batch(self, elements: list[dict], file_data: FileData) -> list[dict]:
+        df = self.conform_elements(elements=elements, file_data=file_data)
+        return df.to_dict(orient="records")
+
+
+class BaseDuckDBUploaderConfig(UploaderConfig):
+    batch_size: int = Field(default=50, description="[Not-used] Number of records per batch")
+    parquet_shards: bool = Field(
+        default=False,
+        description="Convert the staged files of a batch into parquet shards in parallel and "
+        "load each of them as soon as it is written",
+    )
+    max_shard_workers: Optional[int] = Field(
+        default=None,
+        description="Number of threads writing parquet shards, defaults to the "
+        "ThreadPoolExecutor default",
+    )
+
+
+@dataclass
+class BaseDuckDBUploader(Uploader):
+    upload_config: BaseDuckDBUploaderConfig
+
+    def precheck(self) -> None:
+        try:
+            with self.connection_config.get_cursor() as cursor:
+                cursor.execute("SELECT 1;")
+        except Exception as e:
+            logger.error(f"failed to validate connection: {e}", exc_info=True)
+            raise DestinationConnectionError(f"failed to validate connection: {e}")
+
+    @property
+    def table_name(self) -> str:
+        return f"{self.connection_config.db_schema}.{self.connection_config.table}"
+
+    @contextmanager
+    def transaction(self, conn: "DuckDBPyConnection") -> Generator[None, None, None]:
+        conn.begin()
+        try:
+            yield
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    @requires_dependencies(["pyarrow"], extras="duckdb")
+    def insert_dataframe(self, conn: "DuckDBPyConnection", df: pd.DataFrame) -> None:
+        import pyarrow as pa
+
+        logger.debug(f"uploading {len(df)} entries to {self.connection_config.database} ")
+        # Registering the arrow table lets duckdb scan the columns without converting rows
+        conn.register("staged_elements", pa.Table.from_pandas(df, preserve_index=False))
+        try:
+            conn.execute(f"INSERT INTO {self.table_name} BY NAME SELECT * FROM staged_elements")
+        finally:
+            conn.unregister("staged_elements")
+
+    def upload_dataframe(self, df: pd.DataFrame) -> None:
+        with self.connection_config.get_client() as conn:
+            self.insert_dataframe(conn=conn, df=df)
+
+    def is_batch(self) -> bool:
+        return True
+
+    def insert_contents(self, conn: "DuckDBPyConnection", contents: list[UploadContent]) -> None:
+        # Elements of several documents are inserted with each statement
+        dfs, num_rows = [], 0
+        for content in contents:
+            df = get_data_df(path=content.path)
+            dfs.append(df)
+            num_rows += len(df)
+            if num_rows >= MAX_BATCH_ELEMENTS:
+                self.insert_dataframe(conn=conn, df=pd.concat(dfs, ignore_index=True))
+                dfs, num_rows = [], 0
+        if dfs:
+            self.insert_dataframe(conn=conn, df=pd.concat(dfs, ignore_index=True))
+
+    @requires_dependencies(["pyarrow"], extras="duckdb")
+    def write_shard(self, content: UploadContent, shard_path: Path) -> Path:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        df = get_data_df(path=content.path)
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), shard_path)
+        return shard_path
+
+    def insert_shards(self, conn: "DuckDBPyConnection", contents: list[UploadContent]) -> None:
+        with TemporaryDirectory() as shard_dir, ThreadPoolExecutor(
+            max_workers=self.upload_config.max_shard_workers
+        ) as executor:
+            shard_paths = executor.map(
+                lambda i: self.write_shard(
+                    content=contents[i], shard_path=Path(shard_dir) / f"{i}.parquet"
+                ),
+                range(len(contents)),
+            )
+            # Every document infers its own column types, a column can be all null in one
+            # shard and hold values in another. Each shard is inserted on its own so duckdb
+            # casts it to the table types instead of unifying the shards with each other.
+            for shard_path in shard_paths:
+                logger.debug(f"loading parquet shard {shard_path} into {self.table_name}")
+                conn.execute(
+                    f"INSERT INTO {self.table_name} BY NAME SELECT * FROM read_parquet(?)",
+                    [str(shard_path)],
+                )
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        if not contents:
+            return
+        # A single connection and transaction are used for all documents of the batch
+        with self.connection_config.get_client() as conn, self.transaction(conn=conn):
+            if self.upload_config.parquet_shards:
+                self.insert_shards(conn=conn, contents=contents)
+            else:
+                self.insert_contents(conn=conn, contents=contents)
+        logger.info(
+            f"uploaded the elements of {len(contents)} documents to "
+            f"{self.connection_config.database}"
+        )
 
-        for column in filter(
-            lambda x: x in df.columns,
-            ("version", "page_number", "regex_metadata"),
-        ):
-            df[column] = df[column].apply(str)
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        df = pd.DataFrame(data=data)
+        self.upload_dataframe(df=df)
 
-        data = df.to_dict(orient="records")
-        self.write_output(output_path=output_path, data=data)
-        return output_path
+    def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        df = get_data_df(path)
+        self.upload_dataframe(df=df)
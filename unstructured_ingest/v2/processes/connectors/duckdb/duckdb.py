@@ -1,25 +1,21 @@
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional
 
-import pandas as pd
 from pydantic import Field, Secret
 
-from unstructured_ingest.error import DestinationConnectionError
-from unstructured_ingest.utils.data_prep import get_data_df
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
-    FileData,
-    Uploader,
-    UploaderConfig,
     UploadStagerConfig,
 )
-from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connector_registry import DestinationRegistryEntry
-from unstructured_ingest.v2.processes.connectors.duckdb.base import BaseDuckDBUploadStager
+from unstructured_ingest.v2.processes.connectors.duckdb.base import (
+    BaseDuckDBUploader,
+    BaseDuckDBUploaderConfig,
+    BaseDuckDBUploadStager,
+)
 
 if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection as DuckDBConnection
@@ -83,40 +79,16 @@ class DuckDBUploadStager(BaseDuckDBUploadStager):
     )
 
 
-class DuckDBUploaderConfig(UploaderConfig):
-    batch_size: int = Field(default=50, description="[Not-used] Number of records per batch")
+class DuckDBUploaderConfig(BaseDuckDBUploaderConfig):
+    pass
 
 
 @dataclass
-class DuckDBUploader(Uploader):
+class DuckDBUploader(BaseDuckDBUploader):
     connector_type: str = CONNECTOR_TYPE
     upload_config: DuckDBUploaderConfig
     connection_config: DuckDBConnectionConfig
 
-    def precheck(self) -> None:
-        try:
-            with self.connection_config.get_cursor() as cursor:
-                cursor.execute("SELECT 1;")
-        except Exception as e:
-            logger.error(f"failed to validate connection: {e}", exc_info=True)
-            raise DestinationConnectionError(f"failed to validate connection: {e}")
-
-    def upload_dataframe(self, df: pd.DataFrame) -> None:
-        logger.debug(f"uploading {len(df)} entries to {self.connection_config.database} ")
-
-        with self.connection_config.get_client() as conn:
-            conn.query(
-                f"INSERT INTO {self.connection_config.db_schema}.{self.connection_config.table} BY NAME SELECT * FROM df"  # noqa: E501
-            )
-
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
-        df = pd.DataFrame(data=data)
-        self.upload_dataframe(df=df)
-
-    def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
-        df = get_data_df(path)
-        self.upload_dataframe(df=df)
-
 
 duckdb_destination_entry = DestinationRegistryEntry(
     connection_config=DuckDBConnectionConfig,
@@ -4,7 +4,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from time import time
-from typing import TYPE_CHECKING, Any, Generator, Optional, Union
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Optional, Union
 
 from pydantic import BaseModel, Field, Secret, SecretStr
 
@@ -14,11 +14,7 @@ from unstructured_ingest.error import (
     SourceConnectionNetworkError,
     WriteError,
 )
-from unstructured_ingest.utils.data_prep import (
-    batch_generator,
-    flatten_dict,
-    generator_batching_wbytes,
-)
+from unstructured_ingest.utils.data_prep import batch_generator, flatten_dict
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces import (
@@ -34,6 +30,7 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -52,6 +49,10 @@ if TYPE_CHECKING:
 
 CONNECTOR_TYPE = "elasticsearch"
 
+# Number of record ids matched by each delete_by_query, kept below the default limit of
+# 1024 clauses in a bool query
+MAX_DELETE_RECORD_IDS = 1_000
+
 
 class ElastisearchAdditionalMetadata(BaseModel):
     index_name: str
@@ -320,20 +321,19 @@ class ElasticsearchUploadStager(UploadStager):
     upload_stager_config: ElasticsearchUploadStagerConfig
 
     def conform_dict(self, element_dict: dict, file_data: FileData) -> dict:
-        data = element_dict.copy()
         resp = {
             "_index": self.upload_stager_config.index_name,
-            "_id": get_enhanced_element_id(element_dict=data, file_data=file_data),
+            "_id": get_enhanced_element_id(element_dict=element_dict, file_data=file_data),
             "_source": {
-                "element_id": data.pop("element_id", None),
-                "embeddings": data.pop("embeddings", None),
-                "text": data.pop("text", None),
-                "type": data.pop("type", None),
+                "element_id": element_dict.get("element_id"),
+                "embeddings": element_dict.get("embeddings"),
+                "text": element_dict.get("text"),
+                "type": element_dict.get("type"),
                 RECORD_ID_LABEL: file_data.identifier,
             },
         }
-        if "metadata" in data and isinstance(data["metadata"], dict):
-            resp["_source"]["metadata"] = flatten_dict(data["metadata"], separator="-")
+        if isinstance(metadata := element_dict.get("metadata"), dict):
+            resp["_source"]["metadata"] = flatten_dict(metadata, separator="-")
         return resp
 
 
@@ -354,6 +354,11 @@ class ElasticsearchUploaderConfig(UploaderConfig):
         default=RECORD_ID_LABEL,
         description="searchable key to find entries for the same record on previous runs",
     )
+    disable_refresh: bool = Field(
+        default=False,
+        description="Set the refresh interval of the index to -1 while a batch of documents is "
+        "uploaded and restore it afterwards. Only applied to batch uploads.",
+    )
 
 
 @dataclass
@@ -382,15 +387,36 @@ class ElasticsearchUploader(Uploader):
 
         return parallel_bulk
 
-    def delete_by_record_id(self, client, file_data: FileData) -> None:
-        logger.debug(
-            f"deleting any content with metadata {RECORD_ID_LABEL}={file_data.identifier} "
-            f"from {self.upload_config.index_name} index"
-        )
-        delete_resp = client.delete_by_query(
-            index=self.upload_config.index_name,
-            body={"query": {"match": {self.upload_config.record_id_key: file_data.identifier}}},
-        )
+    @requires_dependencies(["elasticsearch"], extras="elasticsearch")
+    def load_async(self):
+        from elasticsearch import AsyncElasticsearch
+        from elasticsearch.helpers import async_streaming_bulk
+
+        return AsyncElasticsearch, async_streaming_bulk
+
+    @requires_dependencies(["elasticsearch"], extras="elasticsearch")
+    def load_bulk_index_error(self):
+        from elasticsearch.helpers.errors import BulkIndexError
+
+        return BulkIndexError
+
+    def get_delete_queries(self, record_ids: list[str]) -> Generator[dict, None, None]:
+        # Phrase matches find the exact record id whether the field is mapped as a keyword or
+        # as analyzed text (the dynamic mapping), where a terms query would match nothing
+        for ids in batch_generator(record_ids, batch_size=MAX_DELETE_RECORD_IDS):
+            yield {
+                "query": {
+                    "bool": {
+                        "should": [
+                            {"match_phrase": {self.upload_config.record_id_key: record_id}}
+                            for record_id in ids
+                        ],
+                        "minimum_should_match": 1,
+                    }
+                }
+            }
+
+    def log_deleted(self, delete_resp: dict) -> None:
         logger.info(
             "deleted {} records from index {}".format(
                 delete_resp["deleted"], self.upload_config.index_name
@@ -399,49 +425,164 @@ class ElasticsearchUploader(Uploader):
         if failures := delete_resp.get("failures"):
             raise WriteError(f"failed to delete records: {failures}")
 
-    @requires_dependencies(["elasticsearch"], extras="elasticsearch")
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:  # noqa: E501
-        from elasticsearch.helpers.errors import BulkIndexError
+    def delete_by_record_ids(self, client, record_ids: list[str]) -> None:
+        logger.debug(
+            f"deleting any content with metadata {RECORD_ID_LABEL} in {record_ids} "
+            f"from {self.upload_config.index_name} index"
+        )
+        for query in self.get_delete_queries(record_ids=record_ids):
+            delete_resp = client.delete_by_query(index=self.upload_config.index_name, body=query)
+            self.log_deleted(delete_resp=delete_resp)
 
-        parallel_bulk = self.load_parallel_bulk()
-        upload_destination = self.connection_config.hosts or self.connection_config.cloud_id
+    async def delete_by_record_ids_async(self, client, record_ids: list[str]) -> None:
+        logger.debug(
+            f"deleting any content with metadata {RECORD_ID_LABEL} in {record_ids} "
+            f"from {self.upload_config.index_name} index"
+        )
+        for query in self.get_delete_queries(record_ids=record_ids):
+            delete_resp = await client.delete_by_query(
+                index=self.upload_config.index_name, body=query
+            )
+            self.log_deleted(delete_resp=delete_resp)
+
+    def warn_missing_index(self) -> None:
+        logger.warning(
+            f"{(self.__class__.__name__).replace('Uploader', '')} index does not exist: "
+            f"{self.upload_config.index_name}. "
+            f"This may cause issues when uploading."
+        )
+
+    @contextmanager
+    def disabled_refresh(self, client) -> Generator[None, None, None]:
+        if not self.upload_config.disable_refresh:
+            yield
+            return
+        index_name = self.upload_config.index_name
+        settings = client.indices.get_settings(index=index_name, name="index.refresh_interval")
+        # A missing value means the index uses the default interval, which None restores
+        refresh_interval = None
+        for index_settings in dict(settings).values():
+            refresh_interval = index_settings["settings"].get("index", {}).get("refresh_interval")
+        logger.debug(f"disabling refresh of index {index_name} during the upload")
+        client.indices.put_settings(index=index_name, body={"index": {"refresh_interval": "-1"}})
+        try:
+            yield
+        finally:
+            client.indices.put_settings(
+                index=index_name, body={"index": {"refresh_interval": refresh_interval}}
+            )
+
+    def is_batch(self) -> bool:
+        return True
+
+    def is_async(self) -> bool:
+        return True
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        # One client, delete and index check serve the whole batch, and the elements of all
+        # documents are read one file at a time as the bulk helper consumes them
+        logger.info(
+            f"writing elements from {len(contents)} documents via document batches to "
+            f"destination index named {self.upload_config.index_name} at "
+            f"{self.upload_destination} with batch size (in bytes) "
+            f"{self.upload_config.batch_size_bytes} with "
+            f"{self.upload_config.num_threads} (number of) threads"
+        )
+        data = (
+            element for content in contents for element in self.get_content_data(content=content)
+        )
+        with self.connection_config.get_client() as client, self.disabled_refresh(client=client):
+            self.write_elements(
+                client=client,
+                data=data,
+                record_ids=[content.file_data.identifier for content in contents],
+            )
 
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(data)} elements via document batches to destination "
-            f"index named {self.upload_config.index_name} at {upload_destination} with "
+            f"writing {len(data)} elements from {len(file_data)} documents via document "
+            f"batches to destination "
+            f"index named {self.upload_config.index_name} at {self.upload_destination} with "
             f"batch size (in bytes) {self.upload_config.batch_size_bytes} with "
             f"{self.upload_config.num_threads} (number of) threads"
         )
+        with self.connection_config.get_client() as client:
+            self.write_elements(
+                client=client, data=data, record_ids=[fd.identifier for fd in file_data]
+            )
 
+    def run_stream(self, data: Iterable[dict], file_data: FileData, **kwargs: Any) -> None:
+        # Bulk requests are built from the iterator, so only one batch is held in memory
+        logger.info(
+            f"streaming elements from {file_data.identifier} to destination "
+            f"index named {self.upload_config.index_name} at {self.upload_destination} with "
+            f"batch size (in bytes) {self.upload_config.batch_size_bytes} with "
+            f"{self.upload_config.num_threads} (number of) threads"
+        )
         with self.connection_config.get_client() as client:
-            self.delete_by_record_id(client=client, file_data=file_data)
-            if not client.indices.exists(index=self.upload_config.index_name):
-                logger.warning(
-                    f"{(self.__class__.__name__).replace('Uploader', '')} index does not exist: "
-                    f"{self.upload_config.index_name}. "
-                    f"This may cause issues when uploading."
+            self.write_elements(client=client, data=data, record_ids=[file_data.identifier])
+
+    async def run_data_async(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        AsyncClient, async_streaming_bulk = self.load_async()
+        BulkIndexError = self.load_bulk_index_error()
+
+        logger.info(
+            f"writing {len(data)} elements from {file_data.identifier} to destination "
+            f"index named {self.upload_config.index_name} at {self.upload_destination} with "
+            f"batch size (in bytes) {self.upload_config.batch_size_bytes}"
+        )
+        async with AsyncClient(**self.connection_config.get_client_kwargs()) as client:
+            await self.delete_by_record_ids_async(client=client, record_ids=[file_data.identifier])
+            if not await client.indices.exists(index=self.upload_config.index_name):
+                self.warn_missing_index()
+            try:
+                async for _ in async_streaming_bulk(
+                    client=client,
+                    actions=data,
+                    max_chunk_bytes=self.upload_config.batch_size_bytes,
+                ):
+                    pass
+            except BulkIndexError as e:
+                sanitized_errors = [self._sanitize_bulk_index_error(error) for error in e.errors]
+                logger.error(
+                    f"Batch upload failed - {e} - with following errors: {sanitized_errors}"
                 )
-            for batch in generator_batching_wbytes(
-                data, batch_size_limit_bytes=self.upload_config.batch_size_bytes
-            ):
-                try:
-                    iterator = parallel_bulk(
-                        client=client,
-                        actions=batch,
-                        thread_count=self.upload_config.num_threads,
-                    )
-                    collections.deque(iterator, maxlen=0)
-                except BulkIndexError as e:
-                    sanitized_errors = [
-                        self._sanitize_bulk_index_error(error) for error in e.errors
-                    ]
-                    logger.error(
-                        f"Batch upload failed - {e} - with following errors: {sanitized_errors}"
-                    )
-                    raise e
-                except Exception as e:
-                    logger.error(f"Batch upload failed - {e}")
-                    raise e
+                raise e
+            except Exception as e:
+                logger.error(f"Batch upload failed - {e}")
+                raise e
+
+    @property
+    def upload_destination(self) -> Any:
+        return self.connection_config.hosts or self.connection_config.cloud_id
+
+    def write_elements(self, client, data: Iterable[dict], record_ids: list[str]) -> None:
+        parallel_bulk = self.load_parallel_bulk()
+        BulkIndexError = self.load_bulk_index_error()
+
+        self.delete_by_record_ids(client=client, record_ids=record_ids)
+        if not client.indices.exists(index=self.upload_config.index_name):
+            self.warn_missing_index()
+        try:
+            # The bulk helper splits the actions into requests of at most max_chunk_bytes
+            # while serializing them, so their size is not measured separately
+            iterator = parallel_bulk(
+                client=client,
+                actions=data,
+                thread_count=self.upload_config.num_threads,
+                max_chunk_bytes=self.upload_config.batch_size_bytes,
+            )
+            collections.deque(iterator, maxlen=0)
+        except BulkIndexError as e:
+            sanitized_errors = [self._sanitize_bulk_index_error(error) for error in e.errors]
+            logger.error(f"Batch upload failed - {e} - with following errors: {sanitized_errors}")
+            raise e
+        except Exception as e:
+            logger.error(f"Batch upload failed - {e}")
+            raise e
 
     def _sanitize_bulk_index_error(self, error: dict[str, dict]) -> dict:
         """Remove data uploaded to index from the log, leave only error information.
@@ -167,6 +167,19 @@ class OpenSearchUploader(ElasticsearchUploader):
 
         return parallel_bulk
 
+    @requires_dependencies(["opensearchpy"], extras="opensearch")
+    def load_async(self):
+        from opensearchpy import AsyncOpenSearch
+        from opensearchpy.helpers import async_streaming_bulk
+
+        return AsyncOpenSearch, async_streaming_bulk
+
+    @requires_dependencies(["opensearchpy"], extras="opensearch")
+    def load_bulk_index_error(self):
+        from opensearchpy.helpers import BulkIndexError
+
+        return BulkIndexError
+
 
 class OpenSearchUploadStagerConfig(ElasticsearchUploadStagerConfig):
     pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import random
 import shutil
@@ -28,11 +29,16 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
 )
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connectors.fsspec.utils import sterilize_dict
+from unstructured_ingest.v2.processes.connectors.utils import (
+    AggregatedOutputConfig,
+    write_output_shards,
+)
 
 if TYPE_CHECKING:
     from fsspec import AbstractFileSystem
@@ -257,8 +263,13 @@ class FsspecDownloader(Downloader):
         return self.generate_download_response(file_data=file_data, download_path=download_path)
 
 
-class FsspecUploaderConfig(FileConfig, UploaderConfig):
-    pass
+class FsspecUploaderConfig(FileConfig, UploaderConfig, AggregatedOutputConfig):
+    max_concurrent_requests: int = Field(
+        default=32,
+        ge=1,
+        description="Number of files uploaded concurrently when a batch of files is written "
+        "to a filesystem with an async implementation",
+    )
 
 
 FsspecUploaderConfigT = TypeVar("FsspecUploaderConfigT", bound=FsspecUploaderConfig)
@@ -269,19 +280,39 @@ class FsspecUploader(Uploader):
     connector_type: str = CONNECTOR_TYPE
     upload_config: FsspecUploaderConfigT = field(default=None)
     connection_config: FsspecConnectionConfigT
+    _fs: Optional[AbstractFileSystem] = field(init=False, default=None)
 
     def is_async(self) -> bool:
-        with self.connection_config.get_client(protocol=self.upload_config.protocol) as client:
-            return client.async_impl
+        from fsspec import get_filesystem_class
+
+        return get_filesystem_class(self.upload_config.protocol).async_impl
+
+    def is_batch(self) -> bool:
+        # Sync filesystems upload one file at a time, so they are better spread across processes,
+        # unless the documents are packed together into shards
+        return self.is_async() or self.upload_config.aggregate_output is not None
 
     @property
     def fs(self) -> "AbstractFileSystem":
         from fsspec import get_filesystem_class
 
-        fs_kwargs = self.connection_config.get_access_config() if self.connection_config else {}
-        return get_filesystem_class(self.upload_config.protocol)(
-            **fs_kwargs,
-        )
+        # Built once so every upload goes through the same sessions and event loop
+        if self._fs is None:
+            fs_kwargs = self.connection_config.get_access_config() if self.connection_config else {}
+            self._fs = get_filesystem_class(self.upload_config.protocol)(
+                **fs_kwargs,
+            )
+        return self._fs
+
+    @contextmanager
+    def get_client(self) -> Generator["AbstractFileSystem", None, None]:
+        # Async filesystems are reused, others like sftp hold a connection that is closed
+        # once the client is no longer needed
+        if self.is_async():
+            yield self.fs
+        else:
+            with self.connection_config.get_client(protocol=self.upload_config.protocol) as client:
+                yield client
 
     def __post_init__(self):
         # TODO once python3.9 no longer supported and kw_only is allowed in dataclasses, remove:
@@ -312,17 +343,67 @@ class FsspecUploader(Uploader):
         updated_upload_path = upload_path.parent / f"{upload_path.name}.json"
         return updated_upload_path
 
+    def put_files(self, lpaths: list[str], rpaths: list[str]) -> None:
+        logger.debug(f"writing {len(lpaths)} local files to {self.upload_config.remote_url}")
+        if not self.is_async():
+            with self.get_client() as client:
+                client.put(lpath=lpaths, rpath=rpaths)
+            return
+        # A single async put sends the files concurrently, batch_size at a time
+        self.fs.put(
+            lpath=lpaths, rpath=rpaths, batch_size=self.upload_config.max_concurrent_requests
+        )
+
+    def upload_shards(self, contents: list[UploadContent]) -> None:
+        upload_dir = Path(self.upload_config.path_without_protocol)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            shards = list(
+                write_output_shards(
+                    contents=contents,
+                    output_dir=Path(temp_dir),
+                    file_format=self.upload_config.aggregate_output,
+                    shard_size_bytes=self.upload_config.shard_size_bytes,
+                )
+            )
+            # Manifests are put after all shards so they only show up once their shard is complete
+            for lpaths in [
+                [shard.path for shard in shards],
+                [shard.manifest_path for shard in shards],
+            ]:
+                self.put_files(
+                    lpaths=[str(lpath) for lpath in lpaths],
+                    rpaths=[(upload_dir / lpath.name).as_posix() for lpath in lpaths],
+                )
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        if self.upload_config.aggregate_output:
+            return self.upload_shards(contents=contents)
+        lpaths = [str(content.path.resolve()) for content in contents]
+        rpaths = [
+            self.get_upload_path(file_data=content.file_data).as_posix() for content in contents
+        ]
+        self.put_files(lpaths=lpaths, rpaths=rpaths)
+
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if self.upload_config.aggregate_output:
+            return self.upload_shards(contents=[UploadContent(path=path, file_data=file_data)])
         path_str = str(path.resolve())
         upload_path = self.get_upload_path(file_data=file_data)
         logger.debug(f"writing local file {path_str} to {upload_path}")
-        with self.connection_config.get_client(protocol=self.upload_config.protocol) as client:
+        with self.get_client() as client:
             client.upload(lpath=path_str, rpath=upload_path.as_posix())
 
     async def run_async(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if not self.is_async() or self.upload_config.aggregate_output:
+            return self.run(path=path, file_data=file_data, **kwargs)
         upload_path = self.get_upload_path(file_data=file_data)
         path_str = str(path.resolve())
-        # Odd that fsspec doesn't run exists() as async even when client support async
         logger.debug(f"writing local file {path_str} to {upload_path}")
-        with self.connection_config.get_client(protocol=self.upload_config.protocol) as client:
-            client.upload(lpath=path_str, rpath=upload_path.as_posix())
+        fs = self.fs
+        # The filesystem's sessions are bound to its own event loop, the upload runs there and
+        # is awaited without blocking the loop of the caller
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                fs._put_file(path_str, upload_path.as_posix()), fs.loop
+            )
+        )
@@ -1,22 +1,24 @@
+import asyncio
 import json
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from time import time
-from typing import TYPE_CHECKING, Any, ContextManager, Generator, Optional
+from typing import TYPE_CHECKING, Any, ContextManager, Generator, Iterable, Literal, Optional
 
-from pydantic import Field, Secret
+from pydantic import BaseModel, Field, Secret
 
 from unstructured_ingest.error import (
     DestinationConnectionError,
     SourceConnectionError,
     SourceConnectionNetworkError,
 )
-from unstructured_ingest.utils.data_prep import batch_generator
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
+    BatchFileData,
+    BatchItem,
     ConnectionConfig,
     Downloader,
     DownloaderConfig,
@@ -26,13 +28,24 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
+    download_responses,
 )
 from unstructured_ingest.v2.logger import logger
 
 if TYPE_CHECKING:
-    from confluent_kafka import Consumer, Producer
+    from confluent_kafka import Consumer, Message, Producer, TopicPartition
+
+
+class KafkaAdditionalMetadata(BaseModel):
+    topic: str
+    partition: int
+
+
+class KafkaBatchFileData(BatchFileData):
+    additional_metadata: KafkaAdditionalMetadata
 
 
 class KafkaAccessConfig(AccessConfig, ABC):
@@ -70,10 +83,10 @@ class KafkaConnectionConfig(ConnectionConfig, ABC):
             consumer.close()
 
     @requires_dependencies(["confluent_kafka"], extras="kafka")
-    def get_producer(self) -> "Producer":
+    def get_producer(self, **configuration: Any) -> "Producer":
         from confluent_kafka import Producer
 
-        producer = Producer(self.get_producer_configuration())
+        producer = Producer({**self.get_producer_configuration(), **configuration})
         return producer
 
 
@@ -81,6 +94,10 @@ class KafkaIndexerConfig(IndexerConfig):
     topic: str = Field(description="which topic to consume from")
     num_messages_to_consume: Optional[int] = 100
     timeout: Optional[float] = Field(default=3.0, description="polling timeout", ge=3.0)
+    batch_size: int = Field(
+        default=100,
+        description="Number of consecutive messages of a partition downloaded together",
+    )
 
     def update_consumer(self, consumer: "Consumer") -> None:
         consumer.subscribe([self.topic])
@@ -98,63 +115,56 @@ class KafkaIndexer(Indexer, ABC):
             yield consumer
 
     @requires_dependencies(["confluent_kafka"], extras="kafka")
-    def generate_messages(self) -> Generator[Any, None, None]:
-        from confluent_kafka import KafkaError, KafkaException
-
-        messages_consumed = 0
-        max_empty_polls = 10
-        empty_polls = 0
-        num_messages_to_consume = self.index_config.num_messages_to_consume
-        with self.get_consumer() as consumer:
-            while messages_consumed < num_messages_to_consume and empty_polls < max_empty_polls:
-                msg = consumer.poll(timeout=self.index_config.timeout)
-                if msg is None:
-                    logger.debug("No Kafka messages found")
-                    empty_polls += 1
-                    continue
-                if msg.error():
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
-                        logger.info(
-                            "Reached end of partition for topic %s [%d] at offset %d"
-                            % (msg.topic(), msg.partition(), msg.offset())
-                        )
-                        break
-                    else:
-                        raise KafkaException(msg.error())
-                try:
-                    empty_polls = 0
-                    messages_consumed += 1
-                    yield msg
-                finally:
-                    consumer.commit(asynchronous=False)
-
-    def generate_file_data(self, msg) -> FileData:
-        msg_content = msg.value().decode("utf8")
-        identifier = f"{msg.topic()}_{msg.partition()}_{msg.offset()}"
-        additional_metadata = {
-            "topic": msg.topic(),
-            "partition": msg.partition(),
-            "offset": msg.offset(),
-            "content": msg_content,
-        }
-        filename = f"{identifier}.txt"
-        return FileData(
-            identifier=identifier,
+    def get_offset_ranges(self, consumer: "Consumer") -> list[tuple[int, int, int]]:
+        """Get the (partition, start, end) offsets of messages not yet committed by the group"""
+        from confluent_kafka import TopicPartition
+
+        topic = self.index_config.topic
+        timeout = self.index_config.timeout
+        cluster_meta = consumer.list_topics(topic=topic, timeout=timeout)
+        partitions = [
+            TopicPartition(topic, partition)
+            for partition in sorted(cluster_meta.topics[topic].partitions)
+        ]
+        # Without a limit every partition is read up to its high watermark
+        remaining = self.index_config.num_messages_to_consume
+        offset_ranges = []
+        for committed in consumer.committed(partitions, timeout=timeout):
+            if remaining is not None and remaining <= 0:
+                break
+            low, high = consumer.get_watermark_offsets(committed, timeout=timeout)
+            # No committed offset for the group yet, start from the earliest message
+            start = committed.offset if committed.offset >= 0 else low
+            end = high if remaining is None else min(high, start + remaining)
+            if end > start:
+                offset_ranges.append((committed.partition, start, end))
+                if remaining is not None:
+                    remaining -= end - start
+        return offset_ranges
+
+    def generate_file_data(self, partition: int, offsets: list[int]) -> KafkaBatchFileData:
+        return KafkaBatchFileData(
             connector_type=self.connector_type,
-            source_identifiers=SourceIdentifiers(
-                filename=filename,
-                fullpath=filename,
-            ),
             metadata=FileDataSourceMetadata(
                 date_processed=str(time()),
             ),
-            additional_metadata=additional_metadata,
-            display_name=filename,
+            additional_metadata=KafkaAdditionalMetadata(
+                topic=self.index_config.topic, partition=partition
+            ),
+            batch_items=[BatchItem(identifier=str(offset)) for offset in offsets],
         )
 
-    def run(self) -> Generator[FileData, None, None]:
-        for message in self.generate_messages():
-            yield self.generate_file_data(message)
+    def run(self) -> Generator[KafkaBatchFileData, None, None]:
+        # Offsets are only committed by the downloader, once the payloads are on disk
+        batch_size = self.index_config.batch_size
+        with self.connection_config.get_consumer() as consumer:
+            offset_ranges = self.get_offset_ranges(consumer=consumer)
+        for partition, start, end in offset_ranges:
+            for batch_start in range(start, end, batch_size):
+                yield self.generate_file_data(
+                    partition=partition,
+                    offsets=list(range(batch_start, min(end, batch_start + batch_size))),
+                )
 
     async def run_async(self, file_data: FileData, **kwargs: Any) -> DownloadResponse:
         raise NotImplementedError()
@@ -181,7 +191,7 @@ class KafkaIndexer(Indexer, ABC):
 
 
 class KafkaDownloaderConfig(DownloaderConfig):
-    pass
+    timeout: float = Field(default=3.0, description="polling timeout", ge=3.0)
 
 
 @dataclass
@@ -191,38 +201,158 @@ class KafkaDownloader(Downloader, ABC):
     version: Optional[str] = None
     source_url: Optional[str] = None
 
-    def run(self, file_data: FileData, **kwargs: Any) -> DownloadResponse:
-        source_identifiers = file_data.source_identifiers
-        if source_identifiers is None:
-            raise ValueError("FileData is missing source_identifiers")
-
-        # Build the download path using source_identifiers
-        download_path = Path(self.download_dir) / source_identifiers.relative_path
+    def generate_download_response(
+        self, msg: "Message", file_data: KafkaBatchFileData
+    ) -> DownloadResponse:
+        identifier = f"{msg.topic()}_{msg.partition()}_{msg.offset()}"
+        filename = f"{identifier}.txt"
+        download_path = Path(self.download_dir) / filename
         download_path.parent.mkdir(parents=True, exist_ok=True)
-
         try:
-            content = file_data.additional_metadata["content"]
-            with open(download_path, "w") as file:
-                file.write(content)
+            # The payload goes straight to disk, it is never carried around in the file data
+            with open(download_path, "wb") as file:
+                file.write(msg.value())
         except Exception as e:
-            logger.error(f"Failed to download file {file_data.identifier}: {e}")
-            raise SourceConnectionNetworkError(f"failed to download file {file_data.identifier}")
+            logger.error(f"Failed to download file {identifier}: {e}")
+            raise SourceConnectionNetworkError(f"failed to download file {identifier}")
 
-        return self.generate_download_response(file_data=file_data, download_path=download_path)
+        message_file_data = FileData(
+            identifier=identifier,
+            connector_type=self.connector_type,
+            source_identifiers=SourceIdentifiers(
+                filename=filename,
+                fullpath=filename,
+            ),
+            metadata=FileDataSourceMetadata(
+                date_processed=file_data.metadata.date_processed,
+            ),
+            additional_metadata={
+                "topic": msg.topic(),
+                "partition": msg.partition(),
+                "offset": msg.offset(),
+            },
+            display_name=filename,
+        )
+        return super().generate_download_response(
+            file_data=message_file_data, download_path=download_path
+        )
+
+    @requires_dependencies(["confluent_kafka"], extras="kafka")
+    def run(self, file_data: FileData, **kwargs: Any) -> download_responses:
+        from confluent_kafka import KafkaException, TopicPartition
+
+        kafka_file_data = KafkaBatchFileData.cast(file_data=file_data)
+        topic = kafka_file_data.additional_metadata.topic
+        partition = kafka_file_data.additional_metadata.partition
+        offsets = {int(item.identifier) for item in kafka_file_data.batch_items}
+        first_offset, last_offset = min(offsets), max(offsets)
+
+        download_responses = []
+        reached_last_offset = False
+        with self.connection_config.get_consumer() as consumer:
+            consumer.assign([TopicPartition(topic, partition, first_offset)])
+            while offsets:
+                messages = consumer.consume(
+                    num_messages=len(offsets), timeout=self.download_config.timeout
+                )
+                if not messages:
+                    break
+                for msg in messages:
+                    if msg.error():
+                        raise KafkaException(msg.error())
+                    if msg.offset() in offsets:
+                        offsets.discard(msg.offset())
+                        download_responses.append(
+                            self.generate_download_response(msg=msg, file_data=kafka_file_data)
+                        )
+                if messages[-1].offset() >= last_offset:
+                    reached_last_offset = True
+                    break
+            if offsets and not reached_last_offset:
+                # The poll timed out, the rest of the batch is read again by the next run
+                logger.warning(
+                    f"timed out reading topic {topic} [{partition}] at offsets: {sorted(offsets)}"
+                )
+                return download_responses
+            if offsets:
+                # Offsets can be missing from compacted topics or transactional markers
+                logger.warning(
+                    f"no messages found in topic {topic} [{partition}] at offsets: "
+                    f"{sorted(offsets)}"
+                )
+            self.commit_offsets(
+                consumer=consumer,
+                topic_partition=TopicPartition(topic, partition),
+                start=first_offset,
+                end=last_offset + 1,
+            )
+        return download_responses
+
+    @requires_dependencies(["confluent_kafka"], extras="kafka")
+    def commit_offsets(
+        self, consumer: "Consumer", topic_partition: "TopicPartition", start: int, end: int
+    ) -> None:
+        """Commit the batch once all of its payloads are on disk. A commit moves the group
+        past every earlier offset too, so it only happens when the committed offset is within
+        the batch, otherwise an earlier batch that failed or is still running would be skipped
+        and its messages are read again by the next run."""
+        from confluent_kafka import TopicPartition
+
+        timeout = self.download_config.timeout
+        committed = consumer.committed([topic_partition], timeout=timeout)[0].offset
+        if committed < 0:
+            committed, _ = consumer.get_watermark_offsets(topic_partition, timeout=timeout)
+        if not start <= committed < end:
+            logger.warning(
+                f"not committing offsets {start}-{end - 1} of topic {topic_partition.topic} "
+                f"[{topic_partition.partition}], the group committed offset is {committed}"
+            )
+            return
+        consumer.commit(
+            offsets=[TopicPartition(topic_partition.topic, topic_partition.partition, end)],
+            asynchronous=False,
+        )
+
+    async def run_async(self, file_data: FileData, **kwargs: Any) -> download_responses:
+        return await asyncio.to_thread(self.run, file_data=file_data, **kwargs)
 
 
 class KafkaUploaderConfig(UploaderConfig):
-    batch_size: int = Field(default=100, description="Batch size")
+    batch_size: int = Field(
+        default=100, ge=1, description="Maximum number of messages in a produce request batch"
+    )
+    batch_size_bytes: int = Field(
+        default=1_000_000,
+        ge=1,
+        description="Maximum size in bytes of the messages in a produce request batch",
+    )
+    linger_ms: float = Field(
+        default=50,
+        ge=0,
+        description="Time in milliseconds to wait for more messages before a batch is sent",
+    )
+    compression_type: Literal["none", "gzip", "snappy", "lz4", "zstd"] = Field(
+        default="lz4", description="Compression codec used for the message batches"
+    )
     topic: str = Field(description="which topic to write to")
     timeout: Optional[float] = Field(
         default=10.0, description="Timeout in seconds to flush batch of messages"
     )
 
+    def get_producer_configuration(self) -> dict:
+        return {
+            "batch.num.messages": self.batch_size,
+            "batch.size": self.batch_size_bytes,
+            "linger.ms": self.linger_ms,
+            "compression.type": self.compression_type,
+        }
+
 
 @dataclass
 class KafkaUploader(Uploader, ABC):
     connection_config: KafkaConnectionConfig
     upload_config: KafkaUploaderConfig
+    _producer: Optional["Producer"] = field(init=False, default=None)
 
     def precheck(self):
         try:
@@ -243,31 +373,73 @@ class KafkaUploader(Uploader, ABC):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def produce_batch(self, elements: list[dict]) -> None:
-        from confluent_kafka.error import KafkaException
+    def get_producer(self) -> "Producer":
+        # The producer lives as long as the uploader so its queue batches the messages
+        # of consecutive documents together
+        if self._producer is None:
+            self._producer = self.connection_config.get_producer(
+                **self.upload_config.get_producer_configuration()
+            )
+        return self._producer
 
-        producer = self.connection_config.get_producer()
-        failed_producer = False
+    def produce_elements(
+        self, producer: "Producer", elements: Iterable[dict], errors: list
+    ) -> None:
+        """Queue the elements without waiting for their delivery, any delivery error is
+        appended to errors once the callbacks are served by poll or flush."""
 
         def acked(err, msg):
-            nonlocal failed_producer
             if err is not None:
-                failed_producer = True
-                logger.error("Failed to deliver kafka message: %s: %s" % (str(msg), str(err)))
+                errors.append(err)
 
         for element in elements:
-            producer.produce(
-                topic=self.upload_config.topic,
-                value=json.dumps(element),
-                callback=acked,
-            )
-
+            value = json.dumps(element)
+            while True:
+                try:
+                    producer.produce(topic=self.upload_config.topic, value=value, callback=acked)
+                    break
+                except BufferError:
+                    # The local queue is full, wait for deliveries to free some room
+                    producer.poll(self.upload_config.timeout)
+            producer.poll(0)
+
+    def flush(self, producer: "Producer") -> None:
         while producer_len := len(producer):
             logger.debug(f"another iteration of kafka producer flush. Queue length: {producer_len}")
             producer.flush(timeout=self.upload_config.timeout)
-        if failed_producer:
-            raise KafkaException("failed to produce all messages in batch")
+
+    @requires_dependencies(["confluent_kafka"], extras="kafka")
+    def raise_delivery_errors(self, errors: dict[str, list]) -> None:
+        from confluent_kafka.error import KafkaException
+
+        failed_records = {record_id: errs for record_id, errs in errors.items() if errs}
+        for record_id, errs in failed_records.items():
+            logger.error(f"Failed to deliver {len(errs)} kafka messages of {record_id}: {errs[0]}")
+        if failed_records:
+            raise KafkaException(
+                "failed to produce all messages of {}".format(", ".join(failed_records))
+            )
+
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        producer = self.get_producer()
+        errors = {}
+        for content in contents:
+            errors[content.file_data.identifier] = []
+            self.produce_elements(
+                producer=producer,
+                elements=self.get_content_data(content=content),
+                errors=errors[content.file_data.identifier],
+            )
+        # A single flush waits for the delivery of every document of the batch
+        self.flush(producer=producer)
+        self.raise_delivery_errors(errors=errors)
 
     def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
-        for element_batch in batch_generator(data, batch_size=self.upload_config.batch_size):
-            self.produce_batch(elements=element_batch)
+        producer = self.get_producer()
+        errors = []
+        self.produce_elements(producer=producer, elements=data, errors=errors)
+        self.flush(producer=producer)
+        self.raise_delivery_errors(errors={file_data.identifier: errors})
@@ -71,14 +71,13 @@ class KdbaiUploadStager(UploadStager):
     upload_stager_config: KdbaiUploadStagerConfig = field(default_factory=KdbaiUploadStagerConfig)
 
     def conform_dict(self, element_dict: dict, file_data: FileData) -> dict:
-        data = element_dict.copy()
         return {
-            "id": get_enhanced_element_id(element_dict=data, file_data=file_data),
-            "element_id": data.get("element_id"),
-            "document": data.pop("text", None),
-            "embeddings": data.get("embeddings"),
+            "id": get_enhanced_element_id(element_dict=element_dict, file_data=file_data),
+            "element_id": element_dict.get("element_id"),
+            "document": element_dict.get("text"),
+            "embeddings": element_dict.get("embeddings"),
             "metadata": flatten_dict(
-                dictionary=data.get("metadata"),
+                dictionary=element_dict.get("metadata"),
                 flatten_lists=True,
                 remove_none=True,
             ),
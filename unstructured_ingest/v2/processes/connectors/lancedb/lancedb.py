@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional
 
 import pandas as pd
 from pydantic import Field
@@ -19,13 +19,19 @@ from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces.connector import ConnectionConfig
 from unstructured_ingest.v2.interfaces.file_data import FileData
 from unstructured_ingest.v2.interfaces.upload_stager import UploadStager, UploadStagerConfig
-from unstructured_ingest.v2.interfaces.uploader import Uploader, UploaderConfig
+from unstructured_ingest.v2.interfaces.uploader import (
+    MAX_BATCH_ELEMENTS,
+    UploadContent,
+    Uploader,
+    UploaderConfig,
+)
 
 CONNECTOR_TYPE = "lancedb"
 
 if TYPE_CHECKING:
     from lancedb import AsyncConnection
     from lancedb.table import AsyncTable
+    from pyarrow import Schema
 
 
 class LanceDBConnectionConfig(ConnectionConfig, ABC):
@@ -103,6 +109,17 @@ class LanceDBUploadStager(UploadStager):
 
 class LanceDBUploaderConfig(UploaderConfig):
     table_name: str = Field(description="The name of the table.")
+    batch_size: int = Field(
+        default=MAX_BATCH_ELEMENTS,
+        ge=1,
+        description="Number of rows accumulated across documents before they are written "
+        "to the table at once, each write creates a new fragment and table version",
+    )
+    optimize: bool = Field(
+        default=False,
+        description="Compact the table fragments and update its indices once all documents "
+        "of a batch were written",
+    )
 
 
 @dataclass
@@ -129,20 +146,69 @@ class LanceDBUploader(Uploader):
             finally:
                 table.close()
 
-    async def run_async(self, path, file_data, **kwargs):
-        df = pd.read_feather(path)
+    def is_batch(self) -> bool:
+        return True
+
+    def batch_dataframes(
+        self, contents: list[UploadContent], schema: "Schema"
+    ) -> Generator[tuple[pd.DataFrame, list[FileData]], None, None]:
+        """Concatenate the staged dataframes of whole documents until at least batch_size rows
+        are held, so each group is written as a single fragment."""
+        dfs, file_data = [], []
+        rows = 0
+        for content in contents:
+            df = self._fit_to_schema(pd.read_feather(content.path), schema)
+            dfs.append(df)
+            file_data.append(content.file_data)
+            rows += len(df)
+            if rows >= self.upload_config.batch_size:
+                yield pd.concat(dfs, ignore_index=True), file_data
+                dfs, file_data = [], []
+                rows = 0
+        if file_data:
+            yield pd.concat(dfs, ignore_index=True), file_data
+
+    @staticmethod
+    def get_delete_predicate(record_ids: list[str]) -> str:
+        quoted_ids = ", ".join(
+            "'{}'".format(record_id.replace("'", "''")) for record_id in record_ids
+        )
+        return f"{RECORD_ID_LABEL} IN ({quoted_ids})"
+
+    async def write_dataframe(
+        self, table: "AsyncTable", schema: "Schema", df: pd.DataFrame, file_data: list[FileData]
+    ) -> None:
+        logger.info(
+            f"writing {len(df)} rows from {len(file_data)} documents to "
+            f"lancedb table {self.upload_config.table_name}"
+        )
+        if RECORD_ID_LABEL not in schema.names:
+            logger.warning(
+                f"Designated table doesn't contain {RECORD_ID_LABEL} column of type"
+                " string which is required to support overwriting updates on subsequent"
+                " uploads of the same record. New rows will be appended instead."
+            )
+        else:
+            await table.delete(self.get_delete_predicate([fd.identifier for fd in file_data]))
+        if not df.empty:
+            await table.add(data=df)
+
+    async def write_contents(self, contents: list[UploadContent], optimize: bool = False) -> None:
+        # One table handle is used for the batch, and each group of documents only
+        # costs a single delete and a single append
         async with self.get_table() as table:
             schema = await table.schema()
-            df = self._fit_to_schema(df, schema)
-            if RECORD_ID_LABEL not in schema.names:
-                logger.warning(
-                    f"Designated table doesn't contain {RECORD_ID_LABEL} column of type"
-                    " string which is required to support overwriting updates on subsequent"
-                    " uploads of the same record. New rows will be appended instead."
-                )
-            else:
-                await table.delete(f'{RECORD_ID_LABEL} = "{file_data.identifier}"')
-            await table.add(data=df)
+            for df, file_data in self.batch_dataframes(contents=contents, schema=schema):
+                await self.write_dataframe(table=table, schema=schema, df=df, file_data=file_data)
+            if optimize:
+                logger.info(f"optimizing lancedb table {self.upload_config.table_name}")
+                await table.optimize()
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        asyncio.run(self.write_contents(contents=contents, optimize=self.upload_config.optimize))
+
+    async def run_async(self, path, file_data, **kwargs):
+        await self.write_contents(contents=[UploadContent(path=path, file_data=file_data)])
 
     def _fit_to_schema(self, df: pd.DataFrame, schema) -> pd.DataFrame:
         columns = set(df.columns)
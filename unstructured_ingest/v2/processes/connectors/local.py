@@ -19,6 +19,7 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
 )
@@ -27,6 +28,10 @@ from unstructured_ingest.v2.processes.connector_registry import (
     DestinationRegistryEntry,
     SourceRegistryEntry,
 )
+from unstructured_ingest.v2.processes.connectors.utils import (
+    AggregatedOutputConfig,
+    write_output_shards,
+)
 
 CONNECTOR_TYPE = "local"
 
@@ -151,7 +156,7 @@ class LocalDownloader(Downloader):
         )
 
 
-class LocalUploaderConfig(UploaderConfig):
+class LocalUploaderConfig(UploaderConfig, AggregatedOutputConfig):
     output_dir: str = Field(
         default="structured-output", description="Local path to write partitioned output to"
     )
@@ -176,6 +181,18 @@ class LocalUploader(Uploader):
     def is_async(self) -> bool:
         return False
 
+    def is_batch(self) -> bool:
+        return self.upload_config.aggregate_output is not None
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        for shard in write_output_shards(
+            contents=contents,
+            output_dir=self.upload_config.output_path,
+            file_format=self.upload_config.aggregate_output,
+            shard_size_bytes=self.upload_config.shard_size_bytes,
+        ):
+            logger.debug(f"wrote {len(shard.records)} documents to {shard.path}")
+
     def get_destination_path(self, file_data: FileData) -> Path:
         if source_identifiers := file_data.source_identifiers:
             rel_path = (
@@ -199,6 +216,8 @@ class LocalUploader(Uploader):
             json.dump(data, f)
 
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if self.upload_config.aggregate_output:
+            return self.run_batch(contents=[UploadContent(path=path, file_data=file_data)])
         final_path = self.get_destination_path(file_data=file_data)
         logger.debug(f"copying file from {path} to {final_path}")
         shutil.copy(src=str(path), dst=str(final_path))
@@ -1,19 +1,21 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generator, Optional, Union
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
 from dateutil import parser
 from pydantic import Field, Secret
 
 from unstructured_ingest.error import DestinationConnectionError, WriteError
-from unstructured_ingest.utils.data_prep import flatten_dict
+from unstructured_ingest.utils.data_prep import flatten_dict, generator_batching_wbytes
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -28,6 +30,7 @@ if TYPE_CHECKING:
     from pymilvus import MilvusClient
 
 CONNECTOR_TYPE = "milvus"
+MAX_PAYLOAD_SIZE = 32 * 1024 * 1024  # 32MB, half of the default grpc message limit
 
 
 class MilvusAccessConfig(AccessConfig):
@@ -142,6 +145,15 @@ class MilvusUploadStager(UploadStager):
 class MilvusUploaderConfig(UploaderConfig):
     db_name: Optional[str] = Field(default=None, description="Milvus database name")
     collection_name: str = Field(description="Milvus collections to write to")
+    batch_size: int = Field(default=1000, ge=1, description="Maximum number of rows per insert")
+    batch_size_bytes: int = Field(
+        default=MAX_PAYLOAD_SIZE,
+        description="Size limit (in bytes) for the rows of each insert, which has to stay below "
+        "the grpc message limit of the server",
+    )
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, description="Number of inserts sent concurrently"
+    )
     record_id_key: str = Field(
         default=RECORD_ID_LABEL,
         description="searchable key to find entries for the same record on previous runs",
@@ -169,42 +181,69 @@ class MilvusUploader(Uploader):
                 client.using_database(db_name=db_name)
             yield client
 
-    def delete_by_record_id(self, file_data: FileData) -> None:
+    def delete_by_record_ids(self, client: "MilvusClient", record_ids: list[str]) -> None:
         logger.info(
-            f"deleting any content with metadata {RECORD_ID_LABEL}={file_data.identifier} "
+            f"deleting any content with metadata {RECORD_ID_LABEL} in {record_ids} "
             f"from milvus collection {self.upload_config.collection_name}"
         )
-        with self.get_client() as client:
-            delete_filter = f'{self.upload_config.record_id_key} == "{file_data.identifier}"'
-            resp = client.delete(
-                collection_name=self.upload_config.collection_name, filter=delete_filter
-            )
-            logger.info(
-                "deleted {} records from milvus collection {}".format(
-                    resp["delete_count"], self.upload_config.collection_name
-                )
+        delete_filter = f"{self.upload_config.record_id_key} in {json.dumps(record_ids)}"
+        resp = client.delete(
+            collection_name=self.upload_config.collection_name, filter=delete_filter
+        )
+        logger.info(
+            "deleted {} records from milvus collection {}".format(
+                resp["delete_count"], self.upload_config.collection_name
             )
+        )
 
     @requires_dependencies(["pymilvus"], extras="milvus")
-    def insert_results(self, data: Union[dict, list[dict]]):
+    def insert_batch(self, client: "MilvusClient", data: list[dict]) -> None:
         from pymilvus import MilvusException
 
+        try:
+            res = client.insert(collection_name=self.upload_config.collection_name, data=data)
+        except MilvusException as milvus_exception:
+            raise WriteError("failed to upload records to milvus") from milvus_exception
+        if "err_count" in res and isinstance(res["err_count"], int) and res["err_count"] > 0:
+            err_count = res["err_count"]
+            raise WriteError(f"failed to upload {err_count} docs")
+
+    def insert_results(self, client: "MilvusClient", data: list[dict]) -> None:
+        batches = generator_batching_wbytes(
+            iterable=data,
+            batch_size_limit_bytes=self.upload_config.batch_size_bytes,
+            max_batch_size=self.upload_config.batch_size,
+        )
         logger.info(
             f"uploading {len(data)} entries to {self.connection_config.db_name} "
             f"db in collection {self.upload_config.collection_name}"
         )
+        with ThreadPoolExecutor(
+            max_workers=self.upload_config.max_concurrent_requests,
+            thread_name_prefix="milvus-uploader",
+        ) as executor:
+            # Consuming the results waits for every insert and raises the first error
+            list(executor.map(lambda batch: self.insert_batch(client=client, data=batch), batches))
+
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        # A single client is used for every group of documents in the batch
+        with self.get_client() as client:
+            for data, file_data in self.batch_contents(contents=contents):
+                self.delete_by_record_ids(
+                    client=client, record_ids=[fd.identifier for fd in file_data]
+                )
+                self.insert_results(client=client, data=data)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         with self.get_client() as client:
-            try:
-                res = client.insert(collection_name=self.upload_config.collection_name, data=data)
-            except MilvusException as milvus_exception:
-                raise WriteError("failed to upload records to milvus") from milvus_exception
-            if "err_count" in res and isinstance(res["err_count"], int) and res["err_count"] > 0:
-                err_count = res["err_count"]
-                raise WriteError(f"failed to upload {err_count} docs")
+            self.delete_by_record_ids(client=client, record_ids=[fd.identifier for fd in file_data])
+            self.insert_results(client=client, data=data)
 
     def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
-        self.delete_by_record_id(file_data=file_data)
-        self.insert_results(data=data)
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
 
 
 milvus_destination_entry = DestinationRegistryEntry(
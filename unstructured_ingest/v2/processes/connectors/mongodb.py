@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -24,6 +25,7 @@ from unstructured_ingest.v2.interfaces import (
     Indexer,
     IndexerConfig,
     SourceIdentifiers,
+    UploadContent,
     Uploader,
     UploaderConfig,
     download_responses,
@@ -98,7 +100,9 @@ class MongoDBIndexerConfig(IndexerConfig):
 
 
 class MongoDBDownloaderConfig(DownloaderConfig):
-    pass
+    fetch_size: int = Field(
+        default=1000, description="Number of documents returned per cursor round trip"
+    )
 
 
 @dataclass
@@ -249,20 +253,27 @@ class MongoDBDownloader(Downloader):
                     logger.error(error_message)
                     raise ValueError(error_message) from e
 
+            download_responses = []
             try:
-                docs = list(collection.find({"_id": {"$in": object_ids}}))
+                # All documents of the batch are pulled through a single $in cursor and written
+                # out as they arrive instead of materializing the whole batch first
+                for doc in collection.find(
+                    {"_id": {"$in": object_ids}}, batch_size=self.download_config.fetch_size
+                ):
+                    download_responses.append(
+                        self.generate_download_response(doc=doc, file_data=mongo_file_data)
+                    )
             except Exception as e:
                 logger.error(f"Failed to fetch documents: {e}", exc_info=True)
                 raise e
 
-        download_responses = []
-        for doc in docs:
-            download_responses.append(
-                self.generate_download_response(doc=doc, file_data=mongo_file_data)
-            )
-
         return download_responses
 
+    async def run_async(self, file_data: FileData, **kwargs: Any) -> download_responses:
+        # pymongo is blocking, offload it so batches are downloaded concurrently,
+        # bounded by the pipeline's max_connections
+        return await asyncio.to_thread(self.run, file_data=file_data, **kwargs)
+
 
 class MongoDBUploaderConfig(UploaderConfig):
     batch_size: int = Field(default=100, description="Number of records per batch")
@@ -312,39 +323,55 @@ class MongoDBUploader(Uploader):
             indexed_keys.extend(key_bson.keys())
         return self.upload_config.record_id_key in indexed_keys
 
-    def delete_by_record_id(self, collection: "Collection", file_data: FileData) -> None:
+    def delete_by_record_ids(self, collection: "Collection", record_ids: list[str]) -> None:
         logger.debug(
             f"deleting any content with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from collection: {collection.name}"
         )
-        query = {self.upload_config.record_id_key: file_data.identifier}
+        query = {self.upload_config.record_id_key: {"$in": record_ids}}
         delete_results = collection.delete_many(filter=query)
         logger.info(
             f"deleted {delete_results.deleted_count} records from collection {collection.name}"
         )
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def set_record_id(self, data: list[dict], file_data: FileData) -> list[dict]:
+        # This would typically live in the stager but since no other manipulation
+        # is done, setting the record id field in the uploader
+        for element in data:
+            element[self.upload_config.record_id_key] = file_data.identifier
+        return data
+
+    def is_batch(self) -> bool:
+        return True
+
+    def get_content_data(self, content: UploadContent) -> list[dict]:
+        data = super().get_content_data(content=content)
+        return self.set_record_id(data=data, file_data=content.file_data)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(data)} objects to destination "
+            f"writing {len(data)} objects from {len(file_data)} documents to destination "
             f"db, {self.upload_config.database}, "
             f"collection {self.upload_config.collection} "
             f"at {self.connection_config.host}",
         )
-        # This would typically live in the stager but since no other manipulation
-        # is done, setting the record id field in the uploader
-        for element in data:
-            element[self.upload_config.record_id_key] = file_data.identifier
         with self.connection_config.get_client() as client:
             db = client[self.upload_config.database]
             collection = db[self.upload_config.collection]
             if self.can_delete(collection=collection):
-                self.delete_by_record_id(file_data=file_data, collection=collection)
+                self.delete_by_record_ids(
+                    collection=collection, record_ids=[fd.identifier for fd in file_data]
+                )
             else:
                 logger.warning("criteria for deleting previous content not met, skipping")
             for chunk in batch_generator(data, self.upload_config.batch_size):
                 collection.insert_many(chunk)
 
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        data = self.set_record_id(data=data, file_data=file_data)
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
+
 
 mongodb_destination_entry = DestinationRegistryEntry(
     connection_config=MongoDBConnectionConfig,
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import csv
 import json
 import uuid
 from collections import defaultdict
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, Secret
 
@@ -21,18 +22,19 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
     UploadStagerConfig,
 )
+from unstructured_ingest.v2.interfaces.uploader import MAX_BATCH_ELEMENTS
 from unstructured_ingest.v2.processes.connector_registry import (
     DestinationRegistryEntry,
 )
 
 if TYPE_CHECKING:
     from neo4j import AsyncDriver, Auth
-    from networkx import Graph, MultiDiGraph
 
 CONNECTOR_TYPE = "neo4j"
 
@@ -98,22 +100,35 @@ class Neo4jUploadStager(UploadStager):
         with elements_filepath.open() as file:
             elements = json.load(file)
 
-        nx_graph = self._create_lexical_graph(
+        graph_data = self._create_lexical_graph(
             elements, self._create_document_node(file_data=file_data)
         )
         output_filepath = Path(output_dir) / f"{output_filename}.json"
         output_filepath.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_filepath, "w") as file:
-            json.dump(_GraphData.from_nx(nx_graph).model_dump(), file, indent=4)
+            json.dump(graph_data.model_dump(), file, indent=4)
 
         return output_filepath
 
-    def _create_lexical_graph(self, elements: list[dict], document_node: _Node) -> "Graph":
-        import networkx as nx
-
-        graph = nx.MultiDiGraph()
-        graph.add_node(document_node)
+    def _create_lexical_graph(self, elements: list[dict], document_node: _Node) -> _GraphData:
+        nodes: dict[str, _Node] = {document_node.id_: document_node}
+        edges: dict[tuple[str, str, Relationship], _Edge] = {}
+
+        def add_edge(source: _Node, destination: _Node, relationship: Relationship) -> None:
+            # The first node seen with an id is kept, as later ones describe the same element
+            nodes.setdefault(source.id_, source)
+            nodes.setdefault(destination.id_, destination)
+            edges.setdefault(
+                (source.id_, destination.id_, relationship),
+                _Edge(
+                    source_id=source.id_,
+                    source_label=source.labels[0],
+                    destination_id=destination.id_,
+                    destination_label=destination.labels[0],
+                    relationship=relationship,
+                ),
+            )
 
         previous_node: Optional[_Node] = None
         for element in elements:
@@ -122,32 +137,18 @@ class Neo4jUploadStager(UploadStager):
                 Relationship.NEXT_CHUNK if self._is_chunk(element) else Relationship.NEXT_ELEMENT
             )
             if previous_node:
-                graph.add_edge(element_node, previous_node, relationship=order_relationship)
+                add_edge(element_node, previous_node, order_relationship)
 
             previous_node = element_node
-            graph.add_edge(element_node, document_node, relationship=Relationship.PART_OF_DOCUMENT)
+            add_edge(element_node, document_node, Relationship.PART_OF_DOCUMENT)
 
             if self._is_chunk(element):
-                origin_element_nodes = [
-                    self._create_element_node(origin_element)
-                    for origin_element in self._get_origin_elements(element)
-                ]
-                graph.add_edges_from(
-                    [
-                        (origin_element_node, element_node)
-                        for origin_element_node in origin_element_nodes
-                    ],
-                    relationship=Relationship.PART_OF_CHUNK,
-                )
-                graph.add_edges_from(
-                    [
-                        (origin_element_node, document_node)
-                        for origin_element_node in origin_element_nodes
-                    ],
-                    relationship=Relationship.PART_OF_DOCUMENT,
-                )
+                for origin_element in self._get_origin_elements(element):
+                    origin_element_node = self._create_element_node(origin_element)
+                    add_edge(origin_element_node, element_node, Relationship.PART_OF_CHUNK)
+                    add_edge(origin_element_node, document_node, Relationship.PART_OF_DOCUMENT)
 
-        return graph
+        return _GraphData(nodes=list(nodes.values()), edges=list(edges.values()))
 
     # TODO(Filip Knefel): Ensure _is_chunk is as reliable as possible, consider different checks
     def _is_chunk(self, element: dict) -> bool:
@@ -182,17 +183,15 @@ class _GraphData(BaseModel):
     edges: list[_Edge]
 
     @classmethod
-    def from_nx(cls, nx_graph: "MultiDiGraph") -> _GraphData:
-        nodes = list(nx_graph.nodes())
-        edges = [
-            _Edge(
-                source_id=u.id_,
-                destination_id=v.id_,
-                relationship=Relationship(data_dict["relationship"]),
-            )
-            for u, v, data_dict in nx_graph.edges(data=True)
-        ]
-        return _GraphData(nodes=nodes, edges=edges)
+    def merge(cls, graphs: list[_GraphData]) -> _GraphData:
+        nodes: dict[str, _Node] = {}
+        edges: dict[tuple[str, str, Relationship], _Edge] = {}
+        for graph in graphs:
+            for node in graph.nodes:
+                nodes.setdefault(node.id_, node)
+            for edge in graph.edges:
+                edges.setdefault((edge.source_id, edge.destination_id, edge.relationship), edge)
+        return _GraphData(nodes=list(nodes.values()), edges=list(edges.values()))
 
 
 class _Node(BaseModel):
@@ -210,7 +209,9 @@ class _Edge(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
     source_id: str
+    source_label: Label
     destination_id: str
+    destination_label: Label
     relationship: Relationship
 
 
@@ -219,6 +220,10 @@ class Label(str, Enum):
     CHUNK = "Chunk"
     DOCUMENT = "Document"
 
+    def __str__(self) -> str:
+        # Python 3.11+ formats mixed-in enums with their name, queries need the value
+        return self.value
+
 
 class Relationship(str, Enum):
     PART_OF_DOCUMENT = "PART_OF_DOCUMENT"
@@ -226,11 +231,31 @@ class Relationship(str, Enum):
     NEXT_CHUNK = "NEXT_CHUNK"
     NEXT_ELEMENT = "NEXT_ELEMENT"
 
+    def __str__(self) -> str:
+        return self.value
+
+
+# Property columns of the node files written for `neo4j-admin database import`, they have to
+# cover every property the stager sets on nodes of the label
+IMPORT_NODE_PROPERTIES: dict[str, list[str]] = {
+    Label.DOCUMENT.value: ["name", "date_created", "date_modified"],
+    Label.CHUNK.value: ["text", "embeddings:float[]"],
+    Label.UNSTRUCTURED_ELEMENT.value: ["text", "embeddings:float[]"],
+}
+
 
 class Neo4jUploaderConfig(UploaderConfig):
     batch_size: int = Field(
         default=100, description="Maximal number of nodes/relationships created per transaction."
     )
+    max_concurrent_requests: int = Field(
+        default=8, ge=1, description="Maximal number of node merging transactions run at once."
+    )
+    import_dir: Optional[Path] = Field(
+        default=None,
+        description="If set, the graph is written as CSV files to this directory for an initial "
+        "load with `neo4j-admin database import full` instead of being merged into the database.",
+    )
 
 
 @dataclass
@@ -238,6 +263,7 @@ class Neo4jUploader(Uploader):
     upload_config: Neo4jUploaderConfig
     connection_config: Neo4jConnectionConfig
     connector_type: str = CONNECTOR_TYPE
+    _constraints_created: bool = field(init=False, default=False)
 
     @DestinationConnectionError.wrap
     def precheck(self) -> None:
@@ -250,17 +276,63 @@ class Neo4jUploader(Uploader):
     def is_async(self):
         return True
 
-    async def run_async(self, path: Path, file_data: FileData, **kwargs) -> None:  # type: ignore
+    def is_batch(self) -> bool:
+        return True
+
+    @staticmethod
+    def _get_graph_data(path: Path) -> _GraphData:
         with path.open() as file:
             staged_data = json.load(file)
+        return _GraphData.model_validate(staged_data)
+
+    def _batch_graphs(
+        self, contents: list[UploadContent]
+    ) -> Generator[tuple[_GraphData, list[FileData]], None, None]:
+        """Merge the graphs of whole documents until at least MAX_BATCH_ELEMENTS nodes are held,
+        so the transactions of a group each write the nodes and relationships of many documents."""
+        graphs, file_data = [], []
+        nodes_count = 0
+        for content in contents:
+            graph_data = self._get_graph_data(content.path)
+            graphs.append(graph_data)
+            file_data.append(content.file_data)
+            nodes_count += len(graph_data.nodes)
+            if nodes_count >= MAX_BATCH_ELEMENTS:
+                yield _GraphData.merge(graphs), file_data
+                graphs, file_data = [], []
+                nodes_count = 0
+        if file_data:
+            yield _GraphData.merge(graphs), file_data
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        asyncio.run(self._write_contents(contents=contents))
+
+    async def _write_contents(self, contents: list[UploadContent]) -> None:
+        if self.upload_config.import_dir:
+            for graph_data, _ in self._batch_graphs(contents=contents):
+                self._write_import_files(graph_data=graph_data)
+            return
+        # A single driver, and so a single connection pool, serves every document of the batch
+        async with self.connection_config.get_client() as client:
+            await self._create_uniqueness_constraints(client)
+            for graph_data, file_data in self._batch_graphs(contents=contents):
+                await self._delete_old_data_if_exists(file_data, client=client)
+                await self._merge_graph(graph_data=graph_data, client=client)
 
-        graph_data = _GraphData.model_validate(staged_data)
+    async def run_async(self, path: Path, file_data: FileData, **kwargs) -> None:  # type: ignore
+        graph_data = self._get_graph_data(path)
+        if self.upload_config.import_dir:
+            self._write_import_files(graph_data=graph_data)
+            return
         async with self.connection_config.get_client() as client:
             await self._create_uniqueness_constraints(client)
-            await self._delete_old_data_if_exists(file_data, client=client)
+            await self._delete_old_data_if_exists([file_data], client=client)
             await self._merge_graph(graph_data=graph_data, client=client)
 
     async def _create_uniqueness_constraints(self, client: AsyncDriver) -> None:
+        # The constraints only have to be ensured once per run rather than for every document
+        if self._constraints_created:
+            return
         for label in Label:
             logger.info(
                 f"Adding id uniqueness constraint for nodes labeled '{label}'"
@@ -273,15 +345,20 @@ class Neo4jUploader(Uploader):
                 FOR (n: {label}) REQUIRE n.id IS UNIQUE
                 """
             )
+        self._constraints_created = True
 
-    async def _delete_old_data_if_exists(self, file_data: FileData, client: AsyncDriver) -> None:
-        logger.info(f"Deleting old data for the record '{file_data.identifier}' (if present).")
+    async def _delete_old_data_if_exists(
+        self, file_data: list[FileData], client: AsyncDriver
+    ) -> None:
+        identifiers = [fd.identifier for fd in file_data]
+        logger.info(f"Deleting old data for the records {identifiers} (if present).")
         _, summary, _ = await client.execute_query(
             f"""
-            MATCH (n: {Label.DOCUMENT} {{id: $identifier}})
+            MATCH (n: {Label.DOCUMENT})
+            WHERE n.id IN $identifiers
             MATCH (n)--(m: {Label.CHUNK}|{Label.UNSTRUCTURED_ELEMENT})
             DETACH DELETE m""",
-            identifier=file_data.identifier,
+            identifiers=identifiers,
         )
         logger.info(
             f"Deleted {summary.counters.nodes_deleted} nodes"
@@ -306,43 +383,53 @@ class Neo4jUploader(Uploader):
         )
         logger.info(f"Finished merging {len(graph_data.nodes)} graph nodes.")
 
-        edges_by_relationship: defaultdict[Relationship, list[_Edge]] = defaultdict(list)
+        edges_by_relationship: defaultdict[tuple[Relationship, Label, Label], list[_Edge]] = (
+            defaultdict(list)
+        )
         for edge in graph_data.edges:
-            edges_by_relationship[edge.relationship].append(edge)
+            edges_by_relationship[
+                (edge.relationship, edge.source_label, edge.destination_label)
+            ].append(edge)
 
         logger.info(f"Merging {len(graph_data.edges)} graph relationships (edges).")
         # NOTE: Processed sequentially to avoid queries locking node access to one another
         await self._execute_queries(
             [
-                self._create_edges_query(edges_batch, relationship)
-                for relationship, edges in edges_by_relationship.items()
+                self._create_edges_query(edges_batch, *relationship_and_labels)
+                for relationship_and_labels, edges in edges_by_relationship.items()
                 for edges_batch in batch_generator(edges, batch_size=self.upload_config.batch_size)
             ],
             client=client,
         )
         logger.info(f"Finished merging {len(graph_data.edges)} graph relationships (edges).")
 
-    @staticmethod
     async def _execute_queries(
+        self,
         queries_with_parameters: list[tuple[str, dict]],
         client: AsyncDriver,
         in_parallel: bool = False,
     ) -> None:
         if in_parallel:
-            logger.info(f"Executing {len(queries_with_parameters)} queries in parallel.")
+            logger.info(
+                f"Executing {len(queries_with_parameters)} queries in parallel, "
+                f"at most {self.upload_config.max_concurrent_requests} at a time."
+            )
+            semaphore = asyncio.Semaphore(self.upload_config.max_concurrent_requests)
+
+            async def execute_query(query: str, parameters: dict) -> None:
+                async with semaphore:
+                    await client.execute_query(query, parameters_=parameters)
+
             await asyncio.gather(
-                *[
-                    client.execute_query(query, parameters_=parameters)
-                    for query, parameters in queries_with_parameters
-                ]
+                *[execute_query(query, parameters) for query, parameters in queries_with_parameters]
             )
             logger.info("Finished executing parallel queries.")
         else:
             logger.info(f"Executing {len(queries_with_parameters)} queries sequentially.")
             for i, (query, parameters) in enumerate(queries_with_parameters):
-                logger.info(f"Query #{i} started.")
+                logger.debug(f"Query #{i} started.")
                 await client.execute_query(query, parameters_=parameters)
-                logger.info(f"Query #{i} finished.")
+                logger.debug(f"Query #{i} finished.")
             logger.info(
                 f"Finished executing all ({len(queries_with_parameters)}) sequential queries."
             )
@@ -360,12 +447,18 @@ class Neo4jUploader(Uploader):
         return query_string, parameters
 
     @staticmethod
-    def _create_edges_query(edges: list[_Edge], relationship: Relationship) -> tuple[str, dict]:
+    def _create_edges_query(
+        edges: list[_Edge],
+        relationship: Relationship,
+        source_label: Label,
+        destination_label: Label,
+    ) -> tuple[str, dict]:
         logger.info(f"Preparing MERGE query for {len(edges)} {relationship} relationships.")
+        # Matching on labels lets the lookups use the id uniqueness constraints' indexes
         query_string = f"""
             UNWIND $edges AS edge
-            MATCH (u {{id: edge.source}})
-            MATCH (v {{id: edge.destination}})
+            MATCH (u: {source_label} {{id: edge.source}})
+            MATCH (v: {destination_label} {{id: edge.destination}})
             MERGE (u)-[:{relationship}]->(v)
             """
         parameters = {
@@ -375,6 +468,64 @@ class Neo4jUploader(Uploader):
         }
         return query_string, parameters
 
+    def _write_import_files(self, graph_data: _GraphData) -> None:
+        """Append the graph to CSV files laid out for `neo4j-admin database import full`, one file
+        per node label and relationship type. Texts can span several lines and documents can
+        share elements, so the import needs `--multiline-fields=true --skip-duplicate-nodes=true`.
+        """
+        import_dir = Path(self.upload_config.import_dir)
+        import_dir.mkdir(parents=True, exist_ok=True)
+
+        nodes_by_labels: defaultdict[tuple[Label, ...], list[_Node]] = defaultdict(list)
+        for node in graph_data.nodes:
+            nodes_by_labels[tuple(node.labels)].append(node)
+        for labels, nodes in nodes_by_labels.items():
+            columns = IMPORT_NODE_PROPERTIES[labels[0]]
+            self._append_import_rows(
+                path=import_dir / f"nodes-{'-'.join(labels)}.csv",
+                header=["id:ID", *columns, ":LABEL"],
+                rows=[
+                    [
+                        node.id_,
+                        *[
+                            self._format_import_value(node.properties.get(column.split(":")[0]))
+                            for column in columns
+                        ],
+                        ";".join(labels),
+                    ]
+                    for node in nodes
+                ],
+            )
+
+        edges_by_relationship: defaultdict[Relationship, list[_Edge]] = defaultdict(list)
+        for edge in graph_data.edges:
+            edges_by_relationship[edge.relationship].append(edge)
+        for relationship, edges in edges_by_relationship.items():
+            self._append_import_rows(
+                path=import_dir / f"relationships-{relationship}.csv",
+                header=[":START_ID", ":END_ID", ":TYPE"],
+                rows=[[edge.source_id, edge.destination_id, relationship] for edge in edges],
+            )
+        logger.info(
+            f"Wrote {len(graph_data.nodes)} nodes and {len(graph_data.edges)} relationships "
+            f"to the neo4j-admin import files in {import_dir}."
+        )
+
+    @staticmethod
+    def _append_import_rows(path: Path, header: list[str], rows: list[list]) -> None:
+        write_header = not path.exists()
+        with path.open("a", newline="") as file:
+            writer = csv.writer(file)
+            if write_header:
+                writer.writerow(header)
+            writer.writerows(rows)
+
+    @staticmethod
+    def _format_import_value(value: Any) -> Any:
+        if isinstance(value, list):
+            return ";".join(str(item) for item in value)
+        return "" if value is None else value
+
 
 neo4j_destination_entry = DestinationRegistryEntry(
     connection_config=Neo4jConnectionConfig,
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -6,6 +7,7 @@ from pydantic import Field, Secret
 
 from unstructured_ingest.error import DestinationConnectionError
 from unstructured_ingest.utils.data_prep import (
+    batch_generator,
     flatten_dict,
     generator_batching_wbytes,
 )
@@ -15,6 +17,7 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -34,6 +37,7 @@ MAX_PAYLOAD_SIZE = 2 * 1024 * 1024  # 2MB
 MAX_POOL_THREADS = 100
 MAX_METADATA_BYTES = 40960  # 40KB https://docs.pinecone.io/reference/quotas-and-limits#hard-limits
 MAX_QUERY_RESULTS = 10000
+MAX_DELETE_IDS = 1000  # max number of ids per delete request
 
 
 class PineconeAccessConfig(AccessConfig):
@@ -49,21 +53,27 @@ class PineconeConnectionConfig(ConnectionConfig):
     )
 
     @requires_dependencies(["pinecone"], extras="pinecone")
-    def get_client(self, **index_kwargs) -> "Pinecone":
+    def get_client(self, use_grpc: bool = False) -> "Pinecone":
         from pinecone import Pinecone
 
         from unstructured_ingest import __version__ as unstructured_version
 
-        return Pinecone(
+        client_cls = Pinecone
+        if use_grpc:
+            # The grpc client comes with the grpc extra of pinecone-client
+            from pinecone.grpc import PineconeGRPC
+
+            client_cls = PineconeGRPC
+        return client_cls(
             api_key=self.access_config.get_secret_value().pinecone_api_key,
             source_tag=f"unstructured_ingest=={unstructured_version}",
         )
 
-    def get_index(self, **index_kwargs) -> "PineconeIndex":
-        pc = self.get_client()
+    def get_index(self, use_grpc: bool = False, **index_kwargs) -> "PineconeIndex":
+        pc = self.get_client(use_grpc=use_grpc)
 
         index = pc.Index(name=self.index_name, **index_kwargs)
-        logger.debug(f"connected to index: {pc.describe_index(self.index_name)}")
+        logger.debug(f"connected to index: {self.index_name}")
         return index
 
 
@@ -103,6 +113,10 @@ class PineconeUploaderConfig(UploaderConfig):
     pool_threads: Optional[int] = Field(
         default=1, description="Optional limit on number of threads to use for upload"
     )
+    use_grpc: bool = Field(
+        default=True,
+        description="Upload through the gRPC client when pinecone[grpc] is installed",
+    )
     namespace: Optional[str] = Field(
         default=None,
         description="The namespace to write to. If not specified, the default namespace is used",
@@ -164,6 +178,9 @@ class PineconeUploader(Uploader):
     upload_config: PineconeUploaderConfig
     connection_config: PineconeConnectionConfig
     connector_type: str = CONNECTOR_TYPE
+    _index: Optional["PineconeIndex"] = field(init=False, default=None)
+    _serverless: Optional[bool] = field(init=False, default=None)
+    _use_grpc: Optional[bool] = field(init=False, default=None)
 
     def precheck(self):
         try:
@@ -172,55 +189,108 @@ class PineconeUploader(Uploader):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def pod_delete_by_record_id(self, file_data: FileData) -> None:
+    @property
+    def use_grpc(self) -> bool:
+        if self._use_grpc is None:
+            self._use_grpc = self.upload_config.use_grpc and self.grpc_client_available()
+        return self._use_grpc
+
+    @staticmethod
+    def grpc_client_available() -> bool:
+        # grpcio can come from another package without the rest of the grpc extra of
+        # pinecone-client, so the client itself has to be importable
+        try:
+            import pinecone.grpc  # noqa: F401
+        except ImportError as e:
+            logger.warning(f"pinecone grpc client not available, uploading over http: {e}")
+            return False
+        return True
+
+    def get_index(self) -> "PineconeIndex":
+        # The index handle, and with it the thread pool used for async requests, is kept for
+        # the whole run
+        if self._index is None:
+            if self.use_grpc:
+                self._index = self.connection_config.get_index(use_grpc=True)
+            else:
+                self._index = self.connection_config.get_index(
+                    pool_threads=self.upload_config.pool_threads or MAX_POOL_THREADS
+                )
+        return self._index
+
+    def is_serverless(self) -> bool:
+        if self._serverless is None:
+            pinecone_client = self.connection_config.get_client()
+            index_description = pinecone_client.describe_index(
+                name=self.connection_config.index_name
+            )
+            if "serverless" in index_description.get("spec"):
+                self._serverless = True
+            elif "pod" in index_description.get("spec"):
+                self._serverless = False
+            else:
+                raise ValueError(f"unexpected spec type in index description: {index_description}")
+        return self._serverless
+
+    def pod_delete_by_record_ids(self, record_ids: list[str]) -> None:
         logger.debug(
             f"deleting any content with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from pinecone pod index"
         )
-        index = self.connection_config.get_index(pool_threads=MAX_POOL_THREADS)
-        delete_kwargs = {
-            "filter": {self.upload_config.record_id_key: {"$eq": file_data.identifier}}
-        }
+        index = self.get_index()
+        delete_kwargs = {"filter": {self.upload_config.record_id_key: {"$in": record_ids}}}
         if namespace := self.upload_config.namespace:
             delete_kwargs["namespace"] = namespace
 
         resp = index.delete(**delete_kwargs)
         logger.debug(
             f"deleted any content with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from pinecone index: {resp}"
         )
 
-    def serverless_delete_by_record_id(self, file_data: FileData) -> None:
+    def serverless_delete_by_record_ids(self, record_ids: list[str]) -> None:
         logger.debug(
             f"deleting any content with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from pinecone serverless index"
         )
-        index = self.connection_config.get_index(pool_threads=MAX_POOL_THREADS)
-        list_kwargs = {"prefix": f"{file_data.identifier}#"}
-        deleted_ids = 0
-        if namespace := self.upload_config.namespace:
-            list_kwargs["namespace"] = namespace
-        for ids in index.list(**list_kwargs):
-            deleted_ids += len(ids)
-            delete_kwargs = {"ids": ids}
-            if namespace := self.upload_config.namespace:
-                delete_resp = delete_kwargs["namespace"] = namespace
-                # delete_resp should be an empty dict if there were no errors
-                if delete_resp:
-                    logger.error(f"failed to delete batch of ids: {delete_resp}")
-            index.delete(**delete_kwargs)
+        index = self.get_index()
+        namespace = self.upload_config.namespace
+        # Listing only supports a single prefix, but the ids found for all records
+        # are deleted together in requests of up to MAX_DELETE_IDS ids
+        ids_to_delete = []
+        for record_id in record_ids:
+            list_kwargs = {"prefix": f"{record_id}#"}
+            if namespace:
+                list_kwargs["namespace"] = namespace
+            for ids in index.list(**list_kwargs):
+                ids_to_delete.extend(ids)
+        for ids in batch_generator(ids_to_delete, batch_size=MAX_DELETE_IDS):
+            delete_kwargs = {"ids": list(ids)}
+            if namespace:
+                delete_kwargs["namespace"] = namespace
+            # delete_resp should be an empty dict if there were no errors, the grpc client
+            # raises on errors instead
+            delete_resp = index.delete(**delete_kwargs)
+            if isinstance(delete_resp, dict) and delete_resp:
+                logger.error(f"failed to delete batch of ids: {delete_resp}")
         logger.info(
-            f"deleted {deleted_ids} records with metadata "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"deleted {len(ids_to_delete)} records with metadata "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from pinecone index"
         )
 
+    def delete_by_record_ids(self, record_ids: list[str]) -> None:
+        if self.is_serverless():
+            self.serverless_delete_by_record_ids(record_ids=record_ids)
+        else:
+            self.pod_delete_by_record_ids(record_ids=record_ids)
+
     @requires_dependencies(["pinecone"], extras="pinecone")
     def upsert_batches_async(self, elements_dict: list[dict]):
-        from pinecone.exceptions import PineconeApiException
+        from pinecone.exceptions import PineconeException
 
         chunks = list(
             generator_batching_wbytes(
@@ -231,42 +301,70 @@ class PineconeUploader(Uploader):
         )
         logger.info(f"split doc with {len(elements_dict)} elements into {len(chunks)} batches")
 
-        max_pool_threads = min(len(chunks), MAX_POOL_THREADS)
-        if self.upload_config.pool_threads:
-            pool_threads = min(self.upload_config.pool_threads, max_pool_threads)
-        else:
-            pool_threads = max_pool_threads
-        index = self.connection_config.get_index(pool_threads=pool_threads)
-        with index:
-            upsert_kwargs = [{"vectors": chunk, "async_req": True} for chunk in chunks]
-            if namespace := self.upload_config.namespace:
-                for kwargs in upsert_kwargs:
-                    kwargs["namespace"] = namespace
-            async_results = [index.upsert(**kwarg) for kwarg in upsert_kwargs]
-            # Wait for and retrieve responses (this raises in case of error)
-            try:
-                results = [async_result.get() for async_result in async_results]
-            except PineconeApiException as api_error:
-                raise DestinationConnectionError(f"http error: {api_error}") from api_error
-            logger.debug(f"results: {results}")
+        index = self.get_index()
+        upsert_kwargs = [{"vectors": chunk, "async_req": True} for chunk in chunks]
+        if namespace := self.upload_config.namespace:
+            for kwargs in upsert_kwargs:
+                kwargs["namespace"] = namespace
+        async_results = [index.upsert(**kwarg) for kwarg in upsert_kwargs]
+        api_errors = (PineconeException,)
+        if self.use_grpc:
+            from grpc import RpcError
+
+            api_errors += (RpcError,)
+        # Wait for and retrieve responses (this raises in case of error). The grpc client
+        # returns futures while the http client returns multiprocessing async results.
+        try:
+            results = [
+                async_result.result() if self.use_grpc else async_result.get()
+                for async_result in async_results
+            ]
+        except api_errors as api_error:
+            protocol = "grpc" if self.use_grpc else "http"
+            raise DestinationConnectionError(f"{protocol} error: {api_error}") from api_error
+        logger.debug(f"results: {results}")
+
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        # The previous vectors of the next group of documents are deleted while the current
+        # group is upserted, since the two groups never share a record
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pinecone-delete") as executor:
+            previous = None
+            for data, file_data in self.batch_contents(contents=contents):
+                delete_future = executor.submit(
+                    self.delete_by_record_ids, record_ids=[fd.identifier for fd in file_data]
+                )
+                if previous:
+                    self.upsert_after_delete(*previous)
+                previous = (data, file_data, delete_future)
+            if previous:
+                self.upsert_after_delete(*previous)
+
+    def upsert_after_delete(
+        self, data: list[dict], file_data: list[FileData], delete_future: Future
+    ) -> None:
+        delete_future.result()
+        logger.info(
+            f"writing a total of {len(data)} elements from {len(file_data)} documents via"
+            f" document batches to destination"
+            f" index named {self.connection_config.index_name}"
+        )
+        self.upsert_batches_async(elements_dict=data)
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing a total of {len(data)} elements via"
+            f"writing a total of {len(data)} elements from {len(file_data)} documents via"
             f" document batches to destination"
             f" index named {self.connection_config.index_name}"
         )
-        # Determine if serverless or pod based index
-        pinecone_client = self.connection_config.get_client()
-        index_description = pinecone_client.describe_index(name=self.connection_config.index_name)
-        if "serverless" in index_description.get("spec"):
-            self.serverless_delete_by_record_id(file_data=file_data)
-        elif "pod" in index_description.get("spec"):
-            self.pod_delete_by_record_id(file_data=file_data)
-        else:
-            raise ValueError(f"unexpected spec type in index description: {index_description}")
+        self.delete_by_record_ids(record_ids=[fd.identifier for fd in file_data])
         self.upsert_batches_async(elements_dict=data)
 
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)
+
 
 pinecone_destination_entry = DestinationRegistryEntry(
     connection_config=PineconeConnectionConfig,
@@ -3,7 +3,7 @@ import json
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional, Union
 
 from pydantic import Field, Secret
 
@@ -14,6 +14,7 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -23,7 +24,7 @@ from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.utils import get_enhanced_element_id
 
 if TYPE_CHECKING:
-    from qdrant_client import AsyncQdrantClient, QdrantClient
+    from qdrant_client import AsyncQdrantClient, QdrantClient, models
 
 
 class QdrantAccessConfig(AccessConfig, ABC):
@@ -95,6 +96,14 @@ class QdrantUploadStager(UploadStager, ABC):
 class QdrantUploaderConfig(UploaderConfig):
     collection_name: str = Field(description="Name of the collection.")
     batch_size: int = Field(default=50, description="Number of records per batch.")
+    max_concurrent_requests: int = Field(
+        default=8, ge=1, description="Maximum number of batches being upserted at the same time."
+    )
+    wait: bool = Field(
+        default=True,
+        description="Wait for every batch to be applied. If disabled, only the last batch of each "
+        "upload waits, which makes it a barrier for the batches sent before it.",
+    )
     num_processes: Optional[int] = Field(
         default=1,
         description="Optional limit on number of threads to use for upload.",
@@ -122,35 +131,92 @@ class QdrantUploader(Uploader, ABC):
     def is_async(self):
         return True
 
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        asyncio.run(self.upsert_contents(contents=contents))
+
+    async def upsert_contents(self, contents: list[UploadContent]) -> None:
+        # One client serves every group of documents in the batch
+        async with self.connection_config.get_async_client() as async_client:
+            for data, file_data in self.batch_contents(contents=contents):
+                logger.debug(
+                    "Upserting %i points from %i documents.",
+                    len(data),
+                    len(file_data),
+                )
+                await self.upsert_batches(async_client=async_client, data=data)
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
+        logger.debug(
+            "Upserting %i points from %i documents.",
+            len(data),
+            len(file_data),
+        )
+        asyncio.run(self.upsert_data(data=data))
+
     async def run_data_async(
         self,
         data: list[dict],
         file_data: FileData,
         **kwargs: Any,
     ) -> None:
+        await self.upsert_data(data=data)
+
+    async def upsert_data(self, data: list[dict]) -> None:
+        async with self.connection_config.get_async_client() as async_client:
+            await self.upsert_batches(async_client=async_client, data=data)
 
+    async def upsert_batches(self, async_client: "AsyncQdrantClient", data: list[dict]) -> None:
         batches = list(batch_generator(data, batch_size=self.upload_config.batch_size))
         logger.debug(
             "Elements split into %i batches of size %i.",
             len(batches),
             self.upload_config.batch_size,
         )
-        await asyncio.gather(*[self._upsert_batch(batch) for batch in batches])
-
-    async def _upsert_batch(self, batch: list[dict]) -> None:
+        if not batches:
+            return
+        semaphore = asyncio.Semaphore(self.upload_config.max_concurrent_requests)
+
+        async def upsert_bounded(batch: tuple[dict, ...], wait: bool) -> None:
+            async with semaphore:
+                await self._upsert_batch(async_client=async_client, batch=batch, wait=wait)
+
+        if self.upload_config.wait:
+            await asyncio.gather(*[upsert_bounded(batch, wait=True) for batch in batches])
+            return
+        # Updates are applied in order, so once the last batch is applied the ones sent
+        # before it are as well
+        await asyncio.gather(*[upsert_bounded(batch, wait=False) for batch in batches[:-1]])
+        await upsert_bounded(batches[-1], wait=True)
+
+    @staticmethod
+    def get_points(batch: tuple[dict, ...]) -> Union["models.Batch", list["models.PointStruct"]]:
         from qdrant_client import models
 
-        points: list[models.PointStruct] = [models.PointStruct(**item) for item in batch]
+        vectors = [item["vector"] for item in batch]
+        # Elements without embeddings are staged with an empty named vector, which only
+        # points can hold
+        if not all(isinstance(vector, list) for vector in vectors):
+            return [models.PointStruct(**item) for item in batch]
+        return models.Batch(
+            ids=[item["id"] for item in batch],
+            vectors=vectors,
+            payloads=[item["payload"] for item in batch],
+        )
+
+    async def _upsert_batch(
+        self, async_client: "AsyncQdrantClient", batch: tuple[dict, ...], wait: bool = True
+    ) -> None:
+        points = self.get_points(batch=batch)
         try:
             logger.debug(
                 "Upserting %i points to the '%s' collection.",
-                len(points),
+                len(batch),
                 self.upload_config.collection_name,
             )
-            async with self.connection_config.get_async_client() as async_client:
-                await async_client.upsert(
-                    self.upload_config.collection_name, points=points, wait=True
-                )
+            await async_client.upsert(self.upload_config.collection_name, points=points, wait=wait)
         except Exception as api_error:
             logger.error(
                 "Failed to upsert points to the collection due to the following error %s", api_error
@@ -1,6 +1,7 @@
 import json
+import struct
 from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional
 
 from pydantic import Field, Secret, model_validator
@@ -12,6 +13,7 @@ from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
 )
@@ -58,8 +60,7 @@ class RedisConnectionConfig(ConnectionConfig):
         return self
 
     @requires_dependencies(["redis"], extras="redis")
-    @asynccontextmanager
-    async def create_async_client(self) -> AsyncGenerator["Redis", None]:
+    def get_async_client(self, **kwargs: Any) -> "Redis":
         from redis.asyncio import Redis, from_url
 
         access_config = self.access_config.get_secret_value()
@@ -76,11 +77,13 @@ class RedisConnectionConfig(ConnectionConfig):
             options["password"] = access_config.password
 
         if access_config.uri:
-            async with from_url(access_config.uri) as client:
-                yield client
-        else:
-            async with Redis(**options) as client:
-                yield client
+            return from_url(access_config.uri, **kwargs)
+        return Redis(**options, **kwargs)
+
+    @asynccontextmanager
+    async def create_async_client(self, **kwargs: Any) -> AsyncGenerator["Redis", None]:
+        async with self.get_async_client(**kwargs) as client:
+            yield client
 
     @requires_dependencies(["redis"], extras="redis")
     @contextmanager
@@ -110,6 +113,17 @@ class RedisConnectionConfig(ConnectionConfig):
 
 class RedisUploaderConfig(UploaderConfig):
     batch_size: int = Field(default=100, description="Number of records per batch")
+    max_concurrent_requests: int = Field(
+        default=8,
+        ge=1,
+        description="Number of pipelines sent concurrently, which is also the size of the "
+        "connection pool",
+    )
+    embeddings_as_bytes: bool = Field(
+        default=False,
+        description="Store the elements as hashes with their embeddings packed as float32 "
+        "bytes, the layout RediSearch expects for vector fields of hashes",
+    )
 
 
 @dataclass
@@ -117,10 +131,17 @@ class RedisUploader(Uploader):
     upload_config: RedisUploaderConfig
     connection_config: RedisConnectionConfig
     connector_type: str = CONNECTOR_TYPE
+    _redis_stack: Optional[bool] = field(init=False, default=None)
+    _async_client: Optional["Redis"] = field(init=False, default=None)
+    _semaphore: Optional[asyncio.Semaphore] = field(init=False, default=None)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None)
 
     def is_async(self) -> bool:
         return True
 
+    def is_batch(self) -> bool:
+        return True
+
     def precheck(self) -> None:
         try:
             with self.connection_config.create_client() as client:
@@ -129,49 +150,103 @@ class RedisUploader(Uploader):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    async def run_data_async(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
-        first_element = data[0]
-        redis_stack = await self._check_redis_stack(first_element)
+    def get_async_client(self) -> "Redis":
+        # Connections are bound to the event loop they were opened on, so the client and its
+        # pool are shared by every document written on the same loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._async_client = self.connection_config.get_async_client(
+                max_connections=self.upload_config.max_concurrent_requests
+            )
+            self._semaphore = asyncio.Semaphore(self.upload_config.max_concurrent_requests)
+            self._loop = loop
+        return self._async_client
+
+    @staticmethod
+    def get_hash_mapping(element: dict) -> dict[str, Any]:
+        mapping = {}
+        for key, value in element.items():
+            if value is None:
+                continue
+            if key == "embeddings":
+                mapping[key] = struct.pack(f"<{len(value)}f", *value)
+            elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                mapping[key] = value
+            else:
+                mapping[key] = json.dumps(value)
+        return mapping
+
+    async def write_data(self, data: list[dict]) -> None:
+        if not data:
+            return
+        client = self.get_async_client()
+        redis_stack = False
+        if not self.upload_config.embeddings_as_bytes:
+            redis_stack = await self._check_redis_stack(client=client, element=data[0])
         logger.info(
             f"writing {len(data)} objects to destination asynchronously, "
             f"db, {self.connection_config.database}, "
             f"at {self.connection_config.host}",
         )
 
-        batches = list(batch_generator(data, batch_size=self.upload_config.batch_size))
-        await asyncio.gather(*[self._write_batch(batch, redis_stack) for batch in batches])
+        batches = batch_generator(data, batch_size=self.upload_config.batch_size)
+        await asyncio.gather(
+            *[
+                self._write_batch(client=client, batch=batch, redis_stack=redis_stack)
+                for batch in batches
+            ]
+        )
 
-    async def _write_batch(self, batch: list[dict], redis_stack: bool) -> None:
-        async with self.connection_config.create_async_client() as async_client:
-            async with async_client.pipeline(transaction=True) as pipe:
-                for element in batch:
-                    element_id = element["element_id"]
-                    if redis_stack:
-                        pipe.json().set(element_id, "$", element)
-                    else:
-                        pipe.set(element_id, json.dumps(element))
-                await pipe.execute()
+    async def write_contents(self, contents: list[UploadContent]) -> None:
+        try:
+            for data, _ in self.batch_contents(contents=contents):
+                await self.write_data(data=data)
+        finally:
+            await self.get_async_client().aclose()
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        asyncio.run(self.write_contents(contents=contents))
+
+    async def run_data_async(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        await self.write_data(data=data)
+
+    async def _write_batch(self, client: "Redis", batch: list[dict], redis_stack: bool) -> None:
+        # The semaphore bounds the pipelines in flight to the size of the connection pool
+        async with self._semaphore, client.pipeline(transaction=False) as pipe:
+            for element in batch:
+                element_id = element["element_id"]
+                if self.upload_config.embeddings_as_bytes:
+                    pipe.hset(element_id, mapping=self.get_hash_mapping(element))
+                elif redis_stack:
+                    pipe.json().set(element_id, "$", element)
+                else:
+                    pipe.set(element_id, json.dumps(element))
+            await pipe.execute()
 
     @requires_dependencies(["redis"], extras="redis")
-    async def _check_redis_stack(self, element: dict) -> bool:
+    async def _check_redis_stack(self, client: "Redis", element: dict) -> bool:
         from redis import exceptions as redis_exceptions
 
+        # Whether the server supports JSON only needs to be found out once per run
+        if self._redis_stack is not None:
+            return self._redis_stack
         redis_stack = True
-        async with self.connection_config.create_async_client() as async_client:
-            async with async_client.pipeline(transaction=True) as pipe:
-                element_id = element["element_id"]
-                try:
-                    # Redis with stack extension supports JSON type
-                    await pipe.json().set(element_id, "$", element).execute()
-                except redis_exceptions.ResponseError as e:
-                    message = str(e)
-                    if "unknown command `JSON.SET`" in message:
-                        # if this error occurs, Redis server doesn't support JSON type,
-                        # so save as string type instead
-                        await pipe.set(element_id, json.dumps(element)).execute()
-                        redis_stack = False
-                    else:
-                        raise e
+        async with self._semaphore, client.pipeline(transaction=False) as pipe:
+            element_id = element["element_id"]
+            try:
+                # Redis with stack extension supports JSON type
+                await pipe.json().set(element_id, "$", element).execute()
+            except redis_exceptions.ResponseError as e:
+                # Quoting and casing of the command in the error differ between server versions
+                message = str(e).lower()
+                if "unknown command" in message and "json.set" in message:
+                    # if this error occurs, Redis server doesn't support JSON type,
+                    # so save as string type instead
+                    await pipe.set(element_id, json.dumps(element)).execute()
+                    redis_stack = False
+                else:
+                    raise e
+        self._redis_stack = redis_stack
         return redis_stack
 
 
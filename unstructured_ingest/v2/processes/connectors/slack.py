@@ -1,4 +1,6 @@
+import asyncio
 import hashlib
+import os
 import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
@@ -58,9 +60,13 @@ class SlackConnectionConfig(ConnectionConfig):
     @requires_dependencies(["slack_sdk"], extras="slack")
     @SourceConnectionError.wrap
     def get_async_client(self) -> "AsyncWebClient":
+        from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
         from slack_sdk.web.async_client import AsyncWebClient
 
-        return AsyncWebClient(token=self.access_config.get_secret_value().token)
+        client = AsyncWebClient(token=self.access_config.get_secret_value().token)
+        # Back off on HTTP 429 using the Retry-After header sent by Slack
+        client.retry_handlers.append(AsyncRateLimitErrorRetryHandler(max_retry_count=5))
+        return client
 
 
 class SlackIndexerConfig(IndexerConfig):
@@ -149,7 +155,11 @@ class SlackIndexer(Indexer):
 
 
 class SlackDownloaderConfig(DownloaderConfig):
-    pass
+    max_concurrent_requests: int = Field(
+        default=10,
+        description="Maximum number of thread replies requests in flight at once "
+        "for a single conversation file",
+    )
 
 
 @dataclass
@@ -204,45 +214,75 @@ class SlackDownloader(Downloader):
         ):
             messages += conversation_history.get("messages", [])
 
-        conversation = []
-        for message in messages:
-            thread_messages = []
+        semaphore = asyncio.Semaphore(self.download_config.max_concurrent_requests)
+        threads = [
+            asyncio.create_task(
+                self._get_thread(
+                    client=client,
+                    channel=file_data.metadata.record_locator["channel"],
+                    message=message,
+                    semaphore=semaphore,
+                )
+            )
+            for message in messages
+        ]
+        download_path.parent.mkdir(exist_ok=True, parents=True)
+        # The conversation is streamed to a temporary file that only replaces the download path
+        # once complete, so a failed download never leaves a truncated file to be reused
+        temp_path = download_path.with_name(f"{download_path.name}.partial")
+        try:
+            with temp_path.open("w", encoding="utf-8") as f:
+                f.write("<?xml version='1.0' encoding='utf-8'?>\n<messages>")
+                # Threads are written in order as they complete to avoid holding the
+                # whole conversation in memory
+                for thread in threads:
+                    f.write(self._thread_to_xml(await thread))
+                f.write("</messages>")
+            os.replace(temp_path, download_path)
+        finally:
+            for thread in threads:
+                thread.cancel()
+            temp_path.unlink(missing_ok=True)
+
+    async def _get_thread(
+        self,
+        client: "AsyncWebClient",
+        channel: str,
+        message: dict,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict]:
+        # NOTE: Replies contains the whole thread, including the message references by the `ts`
+        # parameter even if it's the only message (there were no replies).
+        # Reference: https://api.slack.com/methods/conversations.replies#markdown
+        if not message.get("reply_count"):
+            return [message]
+        thread_messages = []
+        async with semaphore:
             async for conversations_replies in await client.conversations_replies(
-                channel=file_data.metadata.record_locator["channel"],
+                channel=channel,
                 ts=message["ts"],
                 limit=PAGINATION_LIMIT,
             ):
                 thread_messages += conversations_replies.get("messages", [])
+        return thread_messages
 
-            # NOTE: Replies contains the whole thread, including the message references by the `ts`
-            # parameter even if it's the only message (there were no replies).
-            # Reference: https://api.slack.com/methods/conversations.replies#markdown
-            conversation.append(thread_messages)
-
-        conversation_xml = self._conversation_to_xml(conversation)
-        download_path.parent.mkdir(exist_ok=True, parents=True)
-        conversation_xml.write(download_path, encoding="utf-8", xml_declaration=True)
-
-    def _conversation_to_xml(self, conversation: list[list[dict]]) -> ET.ElementTree:
-        root = ET.Element("messages")
-
-        for thread in conversation:
-            message, *replies = thread
-            message_elem = ET.SubElement(root, "message")
-            text_elem = ET.SubElement(message_elem, "text")
-            text_elem.text = message.get("text")
+    def _thread_to_xml(self, thread: list[dict]) -> str:
+        message, *replies = thread
+        message_elem = ET.Element("message")
+        text_elem = ET.SubElement(message_elem, "text")
+        text_elem.text = message.get("text")
 
-            for reply in replies:
-                reply_msg = reply.get("text", "")
-                text_elem.text = "".join([str(text_elem.text), " <reply> ", reply_msg])
+        for reply in replies:
+            reply_msg = reply.get("text", "")
+            text_elem.text = "".join([str(text_elem.text), " <reply> ", reply_msg])
 
-        return ET.ElementTree(root)
+        return ET.tostring(message_elem, encoding="unicode")
 
 
 slack_source_entry = SourceRegistryEntry(
     indexer=SlackIndexer,
     indexer_config=SlackIndexerConfig,
     downloader=SlackDownloader,
-    downloader_config=DownloaderConfig,
+    downloader_config=SlackDownloaderConfig,
     connection_config=SlackConnectionConfig,
 )
@@ -1,10 +1,16 @@
+import io
+import json
+import re
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Generator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 
+import pandas as pd
 from pydantic import Field, Secret
 
+from unstructured_ingest.error import WriteError
 from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.v2.interfaces import FileData, UploadContent
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connector_registry import (
     DestinationRegistryEntry,
@@ -29,6 +35,46 @@ if TYPE_CHECKING:
     from psycopg2.extensions import cursor as PostgresCursor
 
 CONNECTOR_TYPE = "postgres"
+# Marker for null values in the csv sent over with COPY, distinct from empty strings
+COPY_NULL = "\\N"
+_INTEGER_TYPES = ("smallint", "integer", "bigint")
+_VECTOR_TYPE_PATTERN = re.compile(r"^vector\((\d+)\)$")
+_VECTOR_INDEX_METHODS = ("hnsw", "ivfflat")
+
+
+def to_array_literal(value: list) -> str:
+    elements = []
+    for element in value:
+        if element is None:
+            elements.append("NULL")
+        else:
+            escaped = str(element).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{escaped}"')
+    return "{" + ",".join(elements) + "}"
+
+
+def get_copy_formatter(column: str, column_type: Optional[str]) -> Callable[[Any], Any]:
+    """Get the function converting values into their COPY text representation for a column,
+    as opposed to parameterized inserts no adaptation is done by the driver."""
+    vector_match = _VECTOR_TYPE_PATTERN.match(column_type or "")
+    dimensions = int(vector_match.group(1)) if vector_match else None
+
+    def format_value(value: Any) -> Any:
+        if column_type and column_type.endswith("[]") and isinstance(value, list):
+            return to_array_literal(value)
+        if column_type in _INTEGER_TYPES and isinstance(value, float):
+            return int(value)
+        if dimensions and isinstance(value, list) and len(value) != dimensions:
+            raise WriteError(
+                f"column {column} of type {column_type} can't hold "
+                f"a vector of {len(value)} dimensions"
+            )
+        if isinstance(value, (list, dict)):
+            # Also the text representation of pgvector values
+            return json.dumps(value, separators=(",", ":"))
+        return value
+
+    return format_value
 
 
 class PostgresAccessConfig(SQLAccessConfig):
@@ -63,8 +109,11 @@ class PostgresConnectionConfig(SQLConnectionConfig):
         )
         try:
             yield connection
-        finally:
             connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
             connection.close()
 
     @contextmanager
@@ -98,31 +147,38 @@ class PostgresDownloader(SQLDownloader):
     download_config: PostgresDownloaderConfig
     connector_type: str = CONNECTOR_TYPE
 
+    @contextmanager
     @requires_dependencies(["psycopg2"], extras="postgres")
-    def query_db(self, file_data: SqlBatchFileData) -> tuple[list[tuple], list[str]]:
+    def query_db_cursor(
+        self, file_data: SqlBatchFileData
+    ) -> Generator["PostgresCursor", None, None]:
         from psycopg2 import sql
 
         table_name = file_data.additional_metadata.table_name
         id_column = file_data.additional_metadata.id_column
         ids = tuple([item.identifier for item in file_data.batch_items])
 
-        with self.connection_config.get_cursor() as cursor:
-            fields = (
-                sql.SQL(",").join(sql.Identifier(field) for field in self.download_config.fields)
-                if self.download_config.fields
-                else sql.SQL("*")
-            )
-
-            query = sql.SQL("SELECT {fields} FROM {table_name} WHERE {id_column} IN %s").format(
-                fields=fields,
-                table_name=sql.Identifier(table_name),
-                id_column=sql.Identifier(id_column),
-            )
-            logger.debug(f"running query: {cursor.mogrify(query, (ids,))}")
-            cursor.execute(query, (ids,))
-            rows = cursor.fetchall()
-            columns = [col[0] for col in cursor.description]
-            return rows, columns
+        fields = (
+            sql.SQL(",").join(sql.Identifier(field) for field in self.download_config.fields)
+            if self.download_config.fields
+            else sql.SQL("*")
+        )
+        query = sql.SQL("SELECT {fields} FROM {table_name} WHERE {id_column} IN %s").format(
+            fields=fields,
+            table_name=sql.Identifier(table_name),
+            id_column=sql.Identifier(id_column),
+        )
+        cursor_name = f"unstructured_{file_data.identifier}".replace("-", "_")
+        with self.connection_config.get_connection() as connection:
+            # Named cursors live server side, rows are only sent over as they are fetched
+            cursor = connection.cursor(name=cursor_name)
+            cursor.itersize = self.download_config.fetch_size
+            try:
+                logger.debug(f"running query: {cursor.mogrify(query, (ids,))}")
+                cursor.execute(query, (ids,))
+                yield cursor
+            finally:
+                cursor.close()
 
 
 class PostgresUploadStagerConfig(SQLUploadStagerConfig):
@@ -134,7 +190,17 @@ class PostgresUploadStager(SQLUploadStager):
 
 
 class PostgresUploaderConfig(SQLUploaderConfig):
-    pass
+    id_column: str = Field(
+        default="id",
+        description="Unique column used to upsert rows, previous content "
+        "of a record is deleted before inserting if the column isn't unique",
+    )
+    rebuild_vector_indexes: bool = Field(
+        default=False,
+        description="Drop the hnsw/ivfflat indexes of the table while loading a batch of "
+        "documents and rebuild them once afterwards, faster for large bulk loads but vector "
+        "queries on the table fall back to scans until the load is done",
+    )
 
 
 @dataclass
@@ -143,6 +209,188 @@ class PostgresUploader(SQLUploader):
     connection_config: PostgresConnectionConfig
     connector_type: str = CONNECTOR_TYPE
     values_delimiter: str = "%s"
+    _column_types: Optional[dict[str, str]] = field(init=False, default=None)
+    _unique_columns: Optional[list[str]] = field(init=False, default=None)
+
+    def get_column_types(self) -> dict[str, str]:
+        if self._column_types is None:
+            with self.connection_config.get_cursor() as cursor:
+                # format_type gives the full types, i.e. vector(384) or character varying[]
+                cursor.execute(
+                    "SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute "
+                    "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+                    (self.upload_config.table_name,),
+                )
+                self._column_types = dict(cursor.fetchall())
+        return self._column_types
+
+    def get_unique_columns(self) -> list[str]:
+        if self._unique_columns is None:
+            with self.connection_config.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT a.attname FROM pg_index i JOIN pg_attribute a "
+                    "ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+                    "WHERE i.indrelid = %s::regclass AND i.indisunique AND i.indnatts = 1",
+                    (self.upload_config.table_name,),
+                )
+                self._unique_columns = [row[0] for row in cursor.fetchall()]
+        return self._unique_columns
+
+    def can_upsert(self) -> bool:
+        return self.can_delete() and self.upload_config.id_column in self.get_unique_columns()
+
+    def to_copy_csv(self, df: pd.DataFrame) -> io.StringIO:
+        column_types = self.get_column_types()
+        copy_columns = {}
+        for column in df.columns:
+            format_value = get_copy_formatter(column=column, column_type=column_types.get(column))
+            # Built as object columns so pandas doesn't infer dtypes (i.e. ints back to floats)
+            copy_columns[column] = pd.Series(
+                [format_value(value) for value in df[column]], index=df.index, dtype=object
+            )
+        copy_df = pd.DataFrame(copy_columns)
+        buffer = io.StringIO()
+        copy_df.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+        buffer.seek(0)
+        return buffer
+
+    @requires_dependencies(["psycopg2"], extras="postgres")
+    def copy_csv(
+        self, cursor: "PostgresCursor", csv: io.StringIO, columns: list[str], table_name: str
+    ) -> None:
+        from psycopg2 import sql
+
+        stmt = sql.SQL("COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL {null})")
+        stmt = stmt.format(
+            table_name=sql.Identifier(table_name),
+            columns=sql.SQL(",").join(sql.Identifier(column) for column in columns),
+            null=sql.Literal(COPY_NULL),
+        )
+        # All rows are streamed in a single COPY rather than batches of inserts
+        cursor.copy_expert(stmt, csv)
+
+    def write_dataframe(self, df: pd.DataFrame) -> None:
+        csv = self.to_copy_csv(df=df)
+        with self.connection_config.get_cursor() as cursor:
+            self.copy_csv(
+                cursor=cursor,
+                csv=csv,
+                columns=list(df.columns),
+                table_name=self.upload_config.table_name,
+            )
+
+    @requires_dependencies(["psycopg2"], extras="postgres")
+    def drop_vector_indexes(self, cursor: "PostgresCursor") -> list[str]:
+        from psycopg2 import sql
+
+        # The table name is not schema qualified, it resolves to the current schema
+        cursor.execute(
+            "SELECT schemaname, indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = %s",
+            (self.upload_config.table_name,),
+        )
+        index_definitions = []
+        for schema_name, index_name, index_definition in cursor.fetchall():
+            if any(f"USING {method} " in index_definition for method in _VECTOR_INDEX_METHODS):
+                logger.debug(f"dropping vector index {index_name} for the duration of the load")
+                cursor.execute(
+                    sql.SQL("DROP INDEX {index}").format(
+                        index=sql.Identifier(schema_name, index_name)
+                    )
+                )
+                index_definitions.append(index_definition)
+        return index_definitions
+
+    @requires_dependencies(["psycopg2"], extras="postgres")
+    def upsert_dataframe(self, df: pd.DataFrame, record_ids: list[str]) -> None:
+        from psycopg2 import sql
+
+        table_name = sql.Identifier(self.upload_config.table_name)
+        staging_table_name = f"{self.upload_config.table_name}_staging"
+        staging_table = sql.Identifier(staging_table_name)
+        id_column = sql.Identifier(self.upload_config.id_column)
+        record_id_column = sql.Identifier(self.upload_config.record_id_key)
+        columns = sql.SQL(",").join(sql.Identifier(column) for column in df.columns)
+        updates = sql.SQL(",").join(
+            sql.SQL("{column} = EXCLUDED.{column}").format(column=sql.Identifier(column))
+            for column in df.columns
+            if column != self.upload_config.id_column
+        )
+        # Values are converted, and vector dimensions checked, before anything is sent over
+        csv = self.to_copy_csv(df=df)
+        # A single connection is used so the whole load runs in one transaction
+        with self.connection_config.get_cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TEMP TABLE {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) "
+                    "ON COMMIT DROP"
+                ).format(staging_table=staging_table, table_name=table_name)
+            )
+            self.copy_csv(
+                cursor=cursor, csv=csv, columns=list(df.columns), table_name=staging_table_name
+            )
+            # Only rows of the records which aren't part of the new content get deleted,
+            # the rest is updated in place
+            cursor.execute(
+                sql.SQL(
+                    "DELETE FROM {table_name} t WHERE t.{record_id_column} = ANY(%s) "
+                    "AND NOT EXISTS (SELECT 1 FROM {staging_table} s "
+                    "WHERE s.{id_column} = t.{id_column})"
+                ).format(
+                    table_name=table_name,
+                    record_id_column=record_id_column,
+                    staging_table=staging_table,
+                    id_column=id_column,
+                ),
+                (record_ids,),
+            )
+            logger.info(
+                f"deleted {cursor.rowcount} stale rows from table {self.upload_config.table_name}"
+            )
+            cursor.execute(
+                sql.SQL(
+                    "INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {staging_table} "
+                    "ON CONFLICT ({id_column}) DO UPDATE SET {updates}"
+                ).format(
+                    table_name=table_name,
+                    columns=columns,
+                    staging_table=staging_table,
+                    id_column=id_column,
+                    updates=updates,
+                )
+            )
+
+    @contextmanager
+    def vector_indexes_dropped(self) -> Generator[None, None, None]:
+        with self.connection_config.get_cursor() as cursor:
+            index_definitions = self.drop_vector_indexes(cursor=cursor)
+        try:
+            yield
+        finally:
+            # Rebuilt even if the load failed, the table keeps its indexes either way
+            if index_definitions:
+                logger.info(f"rebuilding {len(index_definitions)} vector indexes")
+            with self.connection_config.get_cursor() as cursor:
+                for index_definition in index_definitions:
+                    cursor.execute(index_definition)
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        if not self.upload_config.rebuild_vector_indexes:
+            return super().run_batch(contents=contents, **kwargs)
+        # Indexes are dropped and rebuilt once around the whole load rather than per group
+        with self.vector_indexes_dropped():
+            super().run_batch(contents=contents, **kwargs)
+
+    def upload_dataframe(self, df: pd.DataFrame, file_data: list[FileData]) -> None:
+        if not self.can_upsert():
+            return super().upload_dataframe(df=df, file_data=file_data)
+        self._fit_to_schema(df=df, columns=self.get_table_columns())
+        df = self.prepare_dataframe(df=df)
+        logger.info(
+            f"upserting a total of {len(df)} elements from {len(file_data)} documents"
+            f" to destination table named {self.upload_config.table_name}"
+        )
+        self.upsert_dataframe(df=df, record_ids=[fd.identifier for fd in file_data])
 
 
 postgres_source_entry = SourceRegistryEntry(
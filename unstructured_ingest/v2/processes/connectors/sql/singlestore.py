@@ -1,8 +1,11 @@
 import json
+import tempfile
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generator, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator, Optional
 
+import pandas as pd
 from pydantic import Field, Secret
 
 from unstructured_ingest.v2.logger import logger
@@ -11,7 +14,6 @@ from unstructured_ingest.v2.processes.connector_registry import (
     SourceRegistryEntry,
 )
 from unstructured_ingest.v2.processes.connectors.sql.sql import (
-    _DATE_COLUMNS,
     SQLAccessConfig,
     SqlBatchFileData,
     SQLConnectionConfig,
@@ -23,7 +25,6 @@ from unstructured_ingest.v2.processes.connectors.sql.sql import (
     SQLUploaderConfig,
     SQLUploadStager,
     SQLUploadStagerConfig,
-    parse_date_string,
 )
 
 if TYPE_CHECKING:
@@ -54,6 +55,7 @@ class SingleStoreConnectionConfig(SQLConnectionConfig):
             database=self.database,
             user=self.user,
             password=self.access_config.get_secret_value().password,
+            local_infile=True,
         )
         try:
             yield connection
@@ -93,21 +95,21 @@ class SingleStoreDownloader(SQLDownloader):
     connector_type: str = CONNECTOR_TYPE
     values_delimiter: str = "%s"
 
-    def query_db(self, file_data: SqlBatchFileData) -> tuple[list[tuple], list[str]]:
+    @contextmanager
+    def query_db_cursor(
+        self, file_data: SqlBatchFileData
+    ) -> Generator["SingleStoreCursor", None, None]:
         table_name = file_data.additional_metadata.table_name
         id_column = file_data.additional_metadata.id_column
         ids = tuple([item.identifier for item in file_data.batch_items])
-        with self.connection_config.get_connection() as sqlite_connection:
-            cursor = sqlite_connection.cursor()
+        with self.connection_config.get_cursor() as cursor:
             fields = ",".join(self.download_config.fields) if self.download_config.fields else "*"
             query = (
                 f"SELECT {fields} FROM {table_name} WHERE {id_column} IN {self.values_delimiter}"
             )
             logger.debug(f"running query: {query}\nwith values: {(ids,)}")
             cursor.execute(query, (ids,))
-            rows = cursor.fetchall()
-            columns = [col[0] for col in cursor.description]
-            return rows, columns
+            yield cursor
 
 
 class SingleStoreUploadStagerConfig(SQLUploadStagerConfig):
@@ -129,24 +131,36 @@ class SingleStoreUploader(SQLUploader):
     values_delimiter: str = "%s"
     connector_type: str = CONNECTOR_TYPE
 
-    def prepare_data(
-        self, columns: list[str], data: tuple[tuple[Any, ...], ...]
-    ) -> list[tuple[Any, ...]]:
-        output = []
-        for row in data:
-            parsed = []
-            for column_name, value in zip(columns, row):
-                if isinstance(value, (list, dict)):
-                    value = json.dumps(value)
-                if column_name in _DATE_COLUMNS:
-                    if value is None:
-                        parsed.append(None)
-                    else:
-                        parsed.append(parse_date_string(value))
-                else:
-                    parsed.append(value)
-            output.append(tuple(parsed))
-        return output
+    def prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        for column in df.columns:
+            df[column] = df[column].map(
+                lambda x: json.dumps(x) if isinstance(x, (list, dict)) else x
+            )
+        return super().prepare_dataframe(df=df)
+
+    def write_dataframe(self, df: pd.DataFrame) -> None:
+        # Backslashes are the escape character of LOAD DATA, \N being the null marker
+        escaped_df = pd.DataFrame(
+            {
+                column: pd.Series(
+                    [x.replace("\\", "\\\\") if isinstance(x, str) else x for x in df[column]],
+                    index=df.index,
+                    dtype=object,
+                )
+                for column in df.columns
+            }
+        )
+        stmt = (
+            "LOAD DATA LOCAL INFILE %s INTO TABLE {table_name} "
+            "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' ({columns})"
+        ).format(table_name=self.upload_config.table_name, columns=",".join(df.columns))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / f"{self.upload_config.table_name}.csv"
+            escaped_df.to_csv(csv_path, index=False, header=False, na_rep="\\N")
+            with self.connection_config.get_cursor() as cursor:
+                logger.debug(f"running query: {stmt}")
+                cursor.execute(stmt, [str(csv_path)])
 
 
 singlestore_source_entry = SourceRegistryEntry(
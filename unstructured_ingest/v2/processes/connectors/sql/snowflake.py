@@ -1,13 +1,11 @@
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import TYPE_CHECKING, Generator, Optional
 
-import numpy as np
 import pandas as pd
 from pydantic import Field, Secret
 
-from unstructured_ingest.utils.data_prep import split_dataframe
+from unstructured_ingest.error import WriteError
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.processes.connector_registry import (
@@ -116,9 +114,12 @@ class SnowflakeDownloader(SQLDownloader):
     connector_type: str = CONNECTOR_TYPE
     values_delimiter: str = "?"
 
+    @contextmanager
     # The actual snowflake module package name is: snowflake-connector-python
     @requires_dependencies(["snowflake"], extras="snowflake")
-    def query_db(self, file_data: SqlBatchFileData) -> tuple[list[tuple], list[str]]:
+    def query_db_cursor(
+        self, file_data: SqlBatchFileData
+    ) -> Generator["SnowflakeCursor", None, None]:
         table_name = file_data.additional_metadata.table_name
         id_column = file_data.additional_metadata.id_column
         ids = [item.identifier for item in file_data.batch_items]
@@ -134,11 +135,11 @@ class SnowflakeDownloader(SQLDownloader):
             )
             logger.debug(f"running query: {query}\nwith values: {ids}")
             cursor.execute(query, ids)
-            rows = [
-                tuple(row.values()) if isinstance(row, dict) else row for row in cursor.fetchall()
-            ]
-            columns = [col[0] for col in cursor.description]
-            return rows, columns
+            yield cursor
+
+    def fetch_rows(self, cursor: "SnowflakeCursor") -> Generator[list[tuple], None, None]:
+        for rows in super().fetch_rows(cursor=cursor):
+            yield [tuple(row.values()) if isinstance(row, dict) else row for row in rows]
 
 
 class SnowflakeUploadStagerConfig(SQLUploadStagerConfig):
@@ -160,29 +161,23 @@ class SnowflakeUploader(SQLUploader):
     connector_type: str = CONNECTOR_TYPE
     values_delimiter: str = "?"
 
-    def upload_contents(self, path: Path) -> None:
-        df = pd.read_json(path, orient="records", lines=True)
-        df.replace({np.nan: None}, inplace=True)
-
-        columns = list(df.columns)
-        stmt = "INSERT INTO {table_name} ({columns}) VALUES({values})".format(
-            table_name=self.upload_config.table_name,
-            columns=",".join(columns),
-            values=",".join([self.values_delimiter for _ in columns]),
-        )
-        logger.info(
-            f"writing a total of {len(df)} elements via"
-            f" document batches to destination"
-            f" table named {self.upload_config.table_name}"
-            f" with batch size {self.upload_config.batch_size}"
-        )
-        for rows in split_dataframe(df=df, chunk_size=self.upload_config.batch_size):
-            with self.connection_config.get_cursor() as cursor:
-                values = self.prepare_data(columns, tuple(rows.itertuples(index=False, name=None)))
-                # TODO: executemany break on 'Binding data in type (list) is not supported'
-                for val in values:
-                    logger.debug(f"running query: {stmt}\nwith values: {val}")
-                    cursor.execute(stmt, val)
+    @requires_dependencies(["snowflake", "pyarrow"], extras="snowflake")
+    def write_dataframe(self, df: pd.DataFrame) -> None:
+        from snowflake.connector.pandas_tools import write_pandas
+
+        with self.connection_config.get_connection() as connection:
+            # Stages the dataframe as parquet files and loads them with a single COPY INTO.
+            # Identifiers are left unquoted to resolve to the table's upper case columns.
+            success, num_chunks, num_rows, _ = write_pandas(
+                conn=connection,
+                df=df,
+                table_name=self.upload_config.table_name,
+                quote_identifiers=False,
+                auto_create_table=False,
+            )
+        if not success:
+            raise WriteError(f"failed to write dataframe to {self.upload_config.table_name}")
+        logger.debug(f"wrote {num_rows} rows in {num_chunks} chunks")
 
 
 snowflake_source_entry = SourceRegistryEntry(
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from time import time
-from typing import Any, Generator, Union
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -14,7 +14,9 @@ from dateutil import parser
 from pydantic import BaseModel, Field, Secret
 
 from unstructured_ingest.error import DestinationConnectionError, SourceConnectionError
-from unstructured_ingest.utils.data_prep import get_data_df, split_dataframe
+from unstructured_ingest.utils.data_prep import batch_generator, get_data_df, split_dataframe
+from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.utils.table import get_element_columns
 from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
@@ -35,9 +37,13 @@ from unstructured_ingest.v2.interfaces import (
     UploadStagerConfig,
     download_responses,
 )
+from unstructured_ingest.v2.interfaces.uploader import MAX_BATCH_ELEMENTS
 from unstructured_ingest.v2.logger import logger
 from unstructured_ingest.v2.utils import get_enhanced_element_id
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 _COLUMNS = (
     "id",
     "element_id",
@@ -81,6 +87,8 @@ _COLUMNS = (
 )
 
 _DATE_COLUMNS = ("date_created", "date_modified", "date_processed", "last_modified")
+_JSON_COLUMNS = ("permissions_data", "record_locator", "points", "links")
+_STRING_COLUMNS = ("version", "page_number", "regex_metadata")
 
 
 class SqlAdditionalMetadata(BaseModel):
@@ -101,6 +109,13 @@ def parse_date_string(date_value: Union[str, int]) -> date:
     return parser.parse(date_value)
 
 
+def parse_date_column(series: pd.Series) -> pd.Series:
+    """Parse a column of dates, only parsing each distinct value once since rows
+    coming from the same document share most of their dates."""
+    parsed = {value: parse_date_string(value) for value in series.dropna().unique()}
+    return pd.Series([parsed.get(value) for value in series], index=series.index, dtype=object)
+
+
 class SQLAccessConfig(AccessConfig):
     pass
 
@@ -176,6 +191,15 @@ class SQLIndexer(Indexer, ABC):
 
 class SQLDownloaderConfig(DownloaderConfig):
     fields: list[str] = field(default_factory=list)
+    fetch_size: int = Field(
+        default=1000,
+        description="Number of rows pulled from the database cursor per round trip",
+    )
+    batch_file_format: Optional[Literal["csv", "parquet"]] = Field(
+        default=None,
+        description="If set, write all rows of an indexed batch to a single file of this "
+        "format rather than one csv file per row",
+    )
 
 
 class SQLDownloader(Downloader, ABC):
@@ -183,14 +207,27 @@ class SQLDownloader(Downloader, ABC):
     download_config: SQLDownloaderConfig
 
     @abstractmethod
+    @contextmanager
+    def query_db_cursor(self, file_data: SqlBatchFileData) -> Generator[Any, None, None]:
+        """Yield a cursor that has already executed the query for all rows in the batch"""
+
+    def fetch_rows(self, cursor: Any) -> Generator[list[tuple], None, None]:
+        while rows := cursor.fetchmany(self.download_config.fetch_size):
+            yield rows
+
+    @staticmethod
+    def get_columns(cursor: Any) -> list[str]:
+        return [col[0] for col in cursor.description]
+
     def query_db(self, file_data: SqlBatchFileData) -> tuple[list[tuple], list[str]]:
-        pass
+        with self.query_db_cursor(file_data=file_data) as cursor:
+            rows = [row for chunk in self.fetch_rows(cursor=cursor) for row in chunk]
+            columns = self.get_columns(cursor=cursor)
+            return rows, columns
 
     def sql_to_df(self, rows: list[tuple], columns: list[str]) -> list[pd.DataFrame]:
-        data = [dict(zip(columns, row)) for row in rows]
-        df = pd.DataFrame(data)
-        dfs = [pd.DataFrame([row.values], columns=df.columns) for index, row in df.iterrows()]
-        return dfs
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        return [df.iloc[[i]] for i in range(len(df))]
 
     def get_data(self, file_data: SqlBatchFileData) -> list[pd.DataFrame]:
         rows, columns = self.query_db(file_data=file_data)
@@ -229,14 +266,89 @@ class SQLDownloader(Downloader, ABC):
             file_data=cast_file_data, download_path=download_path
         )
 
+    def write_csv_batch(self, cursor: Any, download_path: Path) -> int:
+        num_rows = 0
+        for rows in self.fetch_rows(cursor=cursor):
+            df = pd.DataFrame.from_records(rows, columns=self.get_columns(cursor=cursor))
+            df.to_csv(
+                download_path, index=False, mode="a" if num_rows else "w", header=not num_rows
+            )
+            num_rows += len(rows)
+        return num_rows
+
+    @staticmethod
+    @requires_dependencies(["pyarrow"])
+    def unify_parquet_schema(tables: list["pa.Table"]) -> "pa.Schema":
+        """Each fetched chunk infers its own types, a column only holding nulls in one chunk
+        or holding ints in one and floats in another gets the promoted type. Columns with
+        types that cannot be promoted are written as strings."""
+        import pyarrow as pa
+
+        fields = []
+        for name in tables[0].column_names:
+            schemas = [pa.schema([table.schema.field(name)]) for table in tables]
+            try:
+                fields.append(pa.unify_schemas(schemas, promote_options="permissive").field(name))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields.append(pa.field(name, pa.string()))
+        return pa.schema(fields)
+
+    @requires_dependencies(["pyarrow"])
+    def write_parquet_batch(self, cursor: Any, download_path: Path) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # The writer needs the schema of the whole batch upfront, so the chunks are kept as
+        # arrow tables and written as row groups once all types are known
+        tables = []
+        for rows in self.fetch_rows(cursor=cursor):
+            columns = self.get_columns(cursor=cursor)
+            tables.append(
+                pa.table({column: list(values) for column, values in zip(columns, zip(*rows))})
+            )
+        if not tables:
+            return 0
+        schema = self.unify_parquet_schema(tables=tables)
+        with pq.ParquetWriter(download_path, schema=schema) as writer:
+            for table in tables:
+                writer.write_table(table.cast(schema))
+        return sum(table.num_rows for table in tables)
+
+    def generate_batch_download_response(self, file_data: SqlBatchFileData) -> DownloadResponse:
+        table_name = file_data.additional_metadata.table_name
+        filename_id = self.get_identifier(table_name=table_name, record_id=file_data.identifier)
+        filename = f"{filename_id}.{self.download_config.batch_file_format}"
+        download_path = self.download_dir / Path(filename)
+        download_path.parent.mkdir(parents=True, exist_ok=True)
+        write_fn = (
+            self.write_parquet_batch
+            if self.download_config.batch_file_format == "parquet"
+            else self.write_csv_batch
+        )
+        with self.query_db_cursor(file_data=file_data) as cursor:
+            num_rows = write_fn(cursor=cursor, download_path=download_path)
+        logger.debug(f"Downloaded {num_rows} rows from table {table_name} to {download_path}")
+        file_data.source_identifiers = SourceIdentifiers(
+            filename=filename,
+            fullpath=filename,
+        )
+        cast_file_data = FileData.cast(file_data=file_data)
+        cast_file_data.identifier = filename_id
+        return super().generate_download_response(
+            file_data=cast_file_data, download_path=download_path
+        )
+
     def run(self, file_data: FileData, **kwargs: Any) -> download_responses:
         sql_filedata = SqlBatchFileData.cast(file_data=file_data)
-        data_dfs = self.get_data(file_data=sql_filedata)
+        if self.download_config.batch_file_format:
+            return [self.generate_batch_download_response(file_data=sql_filedata)]
         download_responses = []
-        for df in data_dfs:
-            download_responses.append(
-                self.generate_download_response(result=df, file_data=sql_filedata)
-            )
+        with self.query_db_cursor(file_data=sql_filedata) as cursor:
+            for rows in self.fetch_rows(cursor=cursor):
+                for df in self.sql_to_df(rows=rows, columns=self.get_columns(cursor=cursor)):
+                    download_responses.append(
+                        self.generate_download_response(result=df, file_data=sql_filedata)
+                    )
         return download_responses
 
 
@@ -248,62 +360,36 @@ class SQLUploadStagerConfig(UploadStagerConfig):
 class SQLUploadStager(UploadStager):
     upload_stager_config: SQLUploadStagerConfig = field(default_factory=SQLUploadStagerConfig)
 
-    def conform_dict(self, element_dict: dict, file_data: FileData) -> dict:
-        data = element_dict.copy()
-        metadata: dict[str, Any] = data.pop("metadata", {})
-        data_source = metadata.pop("data_source", {})
-        coordinates = metadata.pop("coordinates", {})
-
-        data.update(metadata)
-        data.update(data_source)
-        data.update(coordinates)
-
-        data["id"] = get_enhanced_element_id(element_dict=data, file_data=file_data)
-
-        # remove extraneous, not supported columns
-        element = {k: v for k, v in data.items() if k in _COLUMNS}
-        element[RECORD_ID_LABEL] = file_data.identifier
-        return element
+    def conform_elements(self, elements: list[dict], file_data: FileData) -> pd.DataFrame:
+        # Elements are read column by column rather than copied and merged one at a time
+        df = get_element_columns(elements_dict=elements, columns=_COLUMNS, fill_value=np.nan)
+        df["id"] = [
+            get_enhanced_element_id(element_dict=element, file_data=file_data)
+            for element in elements
+        ]
+        df[RECORD_ID_LABEL] = file_data.identifier
+        return df
 
     def conform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         for column in filter(lambda x: x in df.columns, _DATE_COLUMNS):
-            df[column] = df[column].apply(parse_date_string)
-        for column in filter(
-            lambda x: x in df.columns,
-            ("permissions_data", "record_locator", "points", "links"),
-        ):
-            df[column] = df[column].apply(
-                lambda x: json.dumps(x) if isinstance(x, (list, dict)) else None
-            )
-        for column in filter(
-            lambda x: x in df.columns,
-            ("version", "page_number", "regex_metadata"),
-        ):
-            df[column] = df[column].apply(str)
+            # Written as iso strings so the staged file stays serializable
+            df[column] = [
+                value.isoformat() if value is not None else None
+                for value in parse_date_column(df[column])
+            ]
+        for column in filter(lambda x: x in df.columns, _JSON_COLUMNS):
+            df[column] = [
+                json.dumps(value) if isinstance(value, (list, dict)) else None
+                for value in df[column]
+            ]
+        for column in filter(lambda x: x in df.columns, _STRING_COLUMNS):
+            df[column] = df[column].astype(str)
         return df
 
-    def run(
-        self,
-        elements_filepath: Path,
-        file_data: FileData,
-        output_dir: Path,
-        output_filename: str,
-        **kwargs: Any,
-    ) -> Path:
-        elements_contents = self.get_data(elements_filepath=elements_filepath)
-
-        df = pd.DataFrame(
-            data=[
-                self.conform_dict(element_dict=element_dict, file_data=file_data)
-                for element_dict in elements_contents
-            ]
-        )
+    def conform_batch(self, elements: list[dict], file_data: FileData) -> list[dict]:
+        df = self.conform_elements(elements=elements, file_data=file_data)
         df = self.conform_dataframe(df=df)
-
-        output_path = self.get_output_path(output_filename=output_filename, output_dir=output_dir)
-
-        self.write_output(output_path=output_path, data=df.to_dict(orient="records"))
-        return output_path
+        return df.to_dict(orient="records")
 
 
 class SQLUploaderConfig(UploaderConfig):
@@ -320,6 +406,7 @@ class SQLUploader(Uploader):
     upload_config: SQLUploaderConfig
     connection_config: SQLConnectionConfig
     values_delimiter: str = "?"
+    _table_columns: Optional[list[str]] = field(init=False, default=None)
 
     def precheck(self) -> None:
         try:
@@ -329,22 +416,10 @@ class SQLUploader(Uploader):
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    def prepare_data(
-        self, columns: list[str], data: tuple[tuple[Any, ...], ...]
-    ) -> list[tuple[Any, ...]]:
-        output = []
-        for row in data:
-            parsed = []
-            for column_name, value in zip(columns, row):
-                if column_name in _DATE_COLUMNS:
-                    if value is None:
-                        parsed.append(None)
-                    else:
-                        parsed.append(parse_date_string(value))
-                else:
-                    parsed.append(value)
-            output.append(tuple(parsed))
-        return output
+    def prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        for column in filter(lambda x: x in df.columns, _DATE_COLUMNS):
+            df[column] = parse_date_column(df[column])
+        return df.astype(object).where(df.notna(), None)
 
     def _fit_to_schema(self, df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
         columns = set(df.columns)
@@ -368,67 +443,92 @@ class SQLUploader(Uploader):
         for column in missing_columns:
             df[column] = pd.Series()
 
-    def upload_dataframe(self, df: pd.DataFrame, file_data: FileData) -> None:
+    def write_dataframe(self, df: pd.DataFrame) -> None:
+        columns = list(df.columns)
+        stmt = "INSERT INTO {table_name} ({columns}) VALUES({values})".format(
+            table_name=self.upload_config.table_name,
+            columns=",".join(columns),
+            values=",".join([self.values_delimiter for _ in columns]),
+        )
+        # A single cursor is used so all the rows get committed in one transaction
+        with self.connection_config.get_cursor() as cursor:
+            for rows in split_dataframe(df=df, chunk_size=self.upload_config.batch_size):
+                logger.debug(f"running query: {stmt}")
+                cursor.executemany(stmt, list(rows.itertuples(index=False, name=None)))
+
+    def delete_previous_content(self, file_data: list[FileData]) -> None:
         if self.can_delete():
-            self.delete_by_record_id(file_data=file_data)
+            self.delete_by_record_ids(record_ids=[fd.identifier for fd in file_data])
         else:
             logger.warning(
                 f"table doesn't contain expected "
                 f"record id column "
                 f"{self.upload_config.record_id_key}, skipping delete"
             )
-        df.replace({np.nan: None}, inplace=True)
-        self._fit_to_schema(df=df, columns=self.get_table_columns())
 
-        columns = list(df.columns)
-        stmt = "INSERT INTO {table_name} ({columns}) VALUES({values})".format(
-            table_name=self.upload_config.table_name,
-            columns=",".join(columns),
-            values=",".join([self.values_delimiter for _ in columns]),
-        )
+    def upload_dataframe(self, df: pd.DataFrame, file_data: list[FileData]) -> None:
+        self.delete_previous_content(file_data=file_data)
+        self._fit_to_schema(df=df, columns=self.get_table_columns())
+        df = self.prepare_dataframe(df=df)
         logger.info(
-            f"writing a total of {len(df)} elements via"
-            f" document batches to destination"
-            f" table named {self.upload_config.table_name}"
-            f" with batch size {self.upload_config.batch_size}"
+            f"writing a total of {len(df)} elements from {len(file_data)} documents"
+            f" to destination table named {self.upload_config.table_name}"
         )
-        for rows in split_dataframe(df=df, chunk_size=self.upload_config.batch_size):
-            with self.connection_config.get_cursor() as cursor:
-                values = self.prepare_data(columns, tuple(rows.itertuples(index=False, name=None)))
-                # For debugging purposes:
-                # for val in values:
-                #     try:
-                #         cursor.execute(stmt, val)
-                #     except Exception as e:
-                #         print(f"Error: {e}")
-                #         print(f"failed to write {len(columns)}, {len(val)}: {stmt} -> {val}")
-                logger.debug(f"running query: {stmt}")
-                cursor.executemany(stmt, values)
+        self.write_dataframe(df=df)
 
     def get_table_columns(self) -> list[str]:
-        with self.connection_config.get_cursor() as cursor:
-            cursor.execute(f"SELECT * from {self.upload_config.table_name}")
-            return [desc[0] for desc in cursor.description]
+        if self._table_columns is None:
+            with self.connection_config.get_cursor() as cursor:
+                cursor.execute(f"SELECT * FROM {self.upload_config.table_name} LIMIT 0")
+                self._table_columns = [desc[0] for desc in cursor.description]
+        return self._table_columns
 
     def can_delete(self) -> bool:
         return self.upload_config.record_id_key in self.get_table_columns()
 
-    def delete_by_record_id(self, file_data: FileData) -> None:
+    def delete_by_record_ids(self, record_ids: list[str]) -> None:
         logger.debug(
             f"deleting any content with data "
-            f"{self.upload_config.record_id_key}={file_data.identifier} "
+            f"{self.upload_config.record_id_key} in {record_ids} "
             f"from table {self.upload_config.table_name}"
         )
-        stmt = f"DELETE FROM {self.upload_config.table_name} WHERE {self.upload_config.record_id_key} = {self.values_delimiter}"  # noqa: E501
+        stmt = "DELETE FROM {table_name} WHERE {record_id_key} IN ({values})".format(
+            table_name=self.upload_config.table_name,
+            record_id_key=self.upload_config.record_id_key,
+            values=",".join([self.values_delimiter for _ in record_ids]),
+        )
         with self.connection_config.get_cursor() as cursor:
-            cursor.execute(stmt, [file_data.identifier])
+            cursor.execute(stmt, record_ids)
             rowcount = cursor.rowcount
             logger.info(f"deleted {rowcount} rows from table {self.upload_config.table_name}")
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def is_batch(self) -> bool:
+        return True
+
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         df = pd.DataFrame(data)
         self.upload_dataframe(df=df, file_data=file_data)
 
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        df = pd.DataFrame(data)
+        self.upload_dataframe(df=df, file_data=[file_data])
+
+    def run_stream(self, data: Iterable[dict], file_data: FileData, **kwargs: Any) -> None:
+        # Rows are written as they are read, so the content of the record is replaced
+        # across several transactions rather than upserted in a single one
+        self.delete_previous_content(file_data=[file_data])
+        num_rows = 0
+        for rows in batch_generator(data, batch_size=MAX_BATCH_ELEMENTS):
+            df = self.prepare_dataframe(df=pd.DataFrame(data=list(rows)))
+            self.write_dataframe(df=df)
+            num_rows += len(df)
+        logger.info(
+            f"wrote a total of {num_rows} elements from {file_data.identifier}"
+            f" to destination table named {self.upload_config.table_name}"
+        )
+
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
+        if path.suffix == ".ndjson":
+            return super().run(path=path, file_data=file_data, **kwargs)
         df = get_data_df(path=path)
-        self.upload_dataframe(df=df, file_data=file_data)
+        self.upload_dataframe(df=df, file_data=[file_data])
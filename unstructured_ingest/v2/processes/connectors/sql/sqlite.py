@@ -2,8 +2,9 @@ import json
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator
+from typing import TYPE_CHECKING, Generator
 
+import pandas as pd
 from pydantic import Field, Secret, model_validator
 
 from unstructured_ingest.v2.logger import logger
@@ -12,7 +13,6 @@ from unstructured_ingest.v2.processes.connector_registry import (
     SourceRegistryEntry,
 )
 from unstructured_ingest.v2.processes.connectors.sql.sql import (
-    _DATE_COLUMNS,
     SQLAccessConfig,
     SqlBatchFileData,
     SQLConnectionConfig,
@@ -24,7 +24,6 @@ from unstructured_ingest.v2.processes.connectors.sql.sql import (
     SQLUploaderConfig,
     SQLUploadStager,
     SQLUploadStagerConfig,
-    parse_date_string,
 )
 
 if TYPE_CHECKING:
@@ -97,20 +96,18 @@ class SQLiteDownloader(SQLDownloader):
     connector_type: str = CONNECTOR_TYPE
     values_delimiter: str = "?"
 
-    def query_db(self, file_data: SqlBatchFileData) -> tuple[list[tuple], list[str]]:
+    @contextmanager
+    def query_db_cursor(self, file_data: SqlBatchFileData) -> Generator["SqliteCursor", None, None]:
         table_name = file_data.additional_metadata.table_name
         id_column = file_data.additional_metadata.id_column
         ids = [item.identifier for item in file_data.batch_items]
-        with self.connection_config.get_connection() as sqlite_connection:
-            cursor = sqlite_connection.cursor()
+        with self.connection_config.get_cursor() as cursor:
             fields = ",".join(self.download_config.fields) if self.download_config.fields else "*"
             values = ",".join(self.values_delimiter for _ in ids)
             query = f"SELECT {fields} FROM {table_name} WHERE {id_column} IN ({values})"
             logger.debug(f"running query: {query}\nwith values: {ids}")
             cursor.execute(query, ids)
-            rows = cursor.fetchall()
-            columns = [col[0] for col in cursor.description]
-            return rows, columns
+            yield cursor
 
 
 class SQLiteUploadStagerConfig(SQLUploadStagerConfig):
@@ -131,24 +128,12 @@ class SQLiteUploader(SQLUploader):
     connection_config: SQLiteConnectionConfig
     connector_type: str = CONNECTOR_TYPE
 
-    def prepare_data(
-        self, columns: list[str], data: tuple[tuple[Any, ...], ...]
-    ) -> list[tuple[Any, ...]]:
-        output = []
-        for row in data:
-            parsed = []
-            for column_name, value in zip(columns, row):
-                if isinstance(value, (list, dict)):
-                    value = json.dumps(value)
-                if column_name in _DATE_COLUMNS:
-                    if value is None:
-                        parsed.append(None)
-                    else:
-                        parsed.append(parse_date_string(value))
-                else:
-                    parsed.append(value)
-            output.append(tuple(parsed))
-        return output
+    def prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        for column in df.columns:
+            df[column] = df[column].map(
+                lambda x: json.dumps(x) if isinstance(x, (list, dict)) else x
+            )
+        return super().prepare_dataframe(df=df)
 
 
 sqlite_source_entry = SourceRegistryEntry(
@@ -1,9 +1,16 @@
 import json
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Union
+from pathlib import Path
+from typing import Any, Generator, Literal, Optional, Union
+from uuid import uuid4
 
 from dateutil import parser
-from pydantic import ValidationError
+from pydantic import BaseModel, Field, ValidationError
+
+from unstructured_ingest.utils.data_prep import get_data
+from unstructured_ingest.utils.dep_check import requires_dependencies
+from unstructured_ingest.v2.interfaces import UploadContent
 
 
 def parse_datetime(date_value: Union[int, str, float, datetime]) -> datetime:
@@ -27,3 +34,106 @@ def conform_string_to_dict(value: Any) -> dict:
     if isinstance(value, str):
         return json.loads(value)
     raise ValidationError(f"Input could not be mapped to a valid dict: {value}")
+
+
+class AggregatedOutputConfig(BaseModel):
+    aggregate_output: Optional[Literal["ndjson", "parquet"]] = Field(
+        default=None,
+        description="If set, the elements of many documents are packed into shared output files "
+        "of this format, each written along a manifest of the rows of every record, instead of "
+        "one json file per document. Parquet requires the parquet extra",
+    )
+    shard_size_bytes: int = Field(
+        default=128 * 1024 * 1024,
+        ge=1,
+        description="Size of the serialized elements after which an aggregated output file is "
+        "closed and a new one started",
+    )
+
+
+@dataclass
+class OutputShard:
+    """An aggregated output file of elements and the manifest locating each record in it."""
+
+    path: Path
+    manifest_path: Path
+    records: list[dict] = field(default_factory=list)
+    rows: list[str] = field(default_factory=list)
+    size: int = 0
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def write_parquet_shard(rows: list[str], path: Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Nested values are kept as json strings so documents with different metadata fields
+    # can share a schema
+    elements = [
+        {
+            key: json.dumps(value) if isinstance(value, dict) else value
+            for key, value in json.loads(row).items()
+        }
+        for row in rows
+    ]
+    # The columns of the table would otherwise only be the keys of the first element
+    columns = list(dict.fromkeys(key for element in elements for key in element))
+    table = pa.Table.from_pydict(
+        {column: [element.get(column) for element in elements] for column in columns}
+    )
+    pq.write_table(table, path)
+
+
+def write_output_shards(
+    contents: list[UploadContent],
+    output_dir: Path,
+    file_format: Literal["ndjson", "parquet"],
+    shard_size_bytes: int,
+) -> Generator[OutputShard, None, None]:
+    """Pack the elements of whole documents into output files of about shard_size_bytes each.
+    Every file comes with a manifest listing the row offset and count of each record, and the
+    byte range for ndjson files, so a single record can be read back without scanning it all."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def new_shard() -> OutputShard:
+        name = f"elements-{uuid4().hex}"
+        return OutputShard(
+            path=output_dir / f"{name}.{file_format}",
+            manifest_path=output_dir / f"{name}.manifest.json",
+        )
+
+    def close_shard(shard: OutputShard) -> OutputShard:
+        if file_format == "parquet":
+            write_parquet_shard(rows=shard.rows, path=shard.path)
+        else:
+            with shard.path.open("w", encoding="utf-8") as shard_file:
+                shard_file.writelines(shard.rows)
+        manifest = {"file": shard.path.name, "format": file_format, "records": shard.records}
+        with shard.manifest_path.open("w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        shard.rows = []
+        return shard
+
+    shard = new_shard()
+    for content in contents:
+        file_data = content.file_data
+        rows = [json.dumps(element) + "\n" for element in get_data(path=content.path)]
+        size = sum(len(row.encode("utf-8")) for row in rows)
+        record = {
+            "record_id": file_data.identifier,
+            "row_offset": len(shard.rows),
+            "row_count": len(rows),
+        }
+        if file_data.source_identifiers:
+            record["source"] = file_data.source_identifiers.relative_path
+        if file_format == "ndjson":
+            record["byte_offset"] = shard.size
+            record["byte_length"] = size
+        shard.records.append(record)
+        shard.rows.extend(rows)
+        shard.size += size
+        if shard.size >= shard_size_bytes:
+            yield close_shard(shard)
+            shard = new_shard()
+    if shard.records:
+        yield close_shard(shard)
@@ -3,18 +3,20 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Generator, Optional
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Optional
 
 from dateutil import parser
 from pydantic import Field, Secret
 
 from unstructured_ingest.error import DestinationConnectionError, WriteError
+from unstructured_ingest.utils.data_prep import batch_generator
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.constants import RECORD_ID_LABEL
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
     ConnectionConfig,
     FileData,
+    UploadContent,
     Uploader,
     UploaderConfig,
     UploadStager,
@@ -27,6 +29,9 @@ if TYPE_CHECKING:
     from weaviate.client import WeaviateClient
     from weaviate.collections.batch.client import BatchClient
 
+# Maximum number of record ids matched by a single delete filter
+DELETE_BATCH_SIZE = 100
+
 CONNECTOR_TYPE = "weaviate"
 
 
@@ -77,83 +82,47 @@ class WeaviateUploadStager(UploadStager):
         """
         Updates the element dictionary to conform to the Weaviate schema
         """
-        data = element_dict.copy()
-        working_data = data.copy()
+        working_data = element_dict.copy()
+        metadata = working_data.get("metadata", {})
+        data_source = metadata.get("data_source", {})
+        coordinates = metadata.get("coordinates", {})
+
         # Dict as string formatting
-        if (
-            record_locator := working_data.get("metadata", {})
-            .get("data_source", {})
-            .get("record_locator")
-        ):
+        if record_locator := data_source.get("record_locator"):
             # Explicit casting otherwise fails schema type checking
-            working_data["metadata"]["data_source"]["record_locator"] = str(
-                json.dumps(record_locator)
-            )
+            data_source["record_locator"] = str(json.dumps(record_locator))
 
         # Array of items as string formatting
-        if points := working_data.get("metadata", {}).get("coordinates", {}).get("points"):
-            working_data["metadata"]["coordinates"]["points"] = str(json.dumps(points))
+        if points := coordinates.get("points"):
+            coordinates["points"] = str(json.dumps(points))
 
-        if links := working_data.get("metadata", {}).get("links", {}):
-            working_data["metadata"]["links"] = str(json.dumps(links))
+        if links := metadata.get("links", {}):
+            metadata["links"] = str(json.dumps(links))
 
-        if permissions_data := (
-            working_data.get("metadata", {}).get("data_source", {}).get("permissions_data")
-        ):
-            working_data["metadata"]["data_source"]["permissions_data"] = json.dumps(
-                permissions_data
-            )
+        if permissions_data := data_source.get("permissions_data"):
+            data_source["permissions_data"] = json.dumps(permissions_data)
 
         # Datetime formatting
-        if (
-            date_created := working_data.get("metadata", {})
-            .get("data_source", {})
-            .get("date_created")
-        ):
-            working_data["metadata"]["data_source"]["date_created"] = self.parse_date_string(
-                date_created
-            ).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            )
-
-        if (
-            date_modified := working_data.get("metadata", {})
-            .get("data_source", {})
-            .get("date_modified")
+        for date_field, container in (
+            ("date_created", data_source),
+            ("date_modified", data_source),
+            ("date_processed", data_source),
+            ("last_modified", metadata),
         ):
-            working_data["metadata"]["data_source"]["date_modified"] = self.parse_date_string(
-                date_modified
-            ).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            )
-
-        if (
-            date_processed := working_data.get("metadata", {})
-            .get("data_source", {})
-            .get("date_processed")
-        ):
-            working_data["metadata"]["data_source"]["date_processed"] = self.parse_date_string(
-                date_processed
-            ).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            )
-
-        if last_modified := working_data.get("metadata", {}).get("last_modified"):
-            working_data["metadata"]["last_modified"] = self.parse_date_string(
-                last_modified
-            ).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            )
+            if date_value := container.get(date_field):
+                container[date_field] = self.parse_date_string(date_value).strftime(
+                    "%Y-%m-%dT%H:%M:%S.%fZ",
+                )
 
         # String casting
-        if version := working_data.get("metadata", {}).get("data_source", {}).get("version"):
-            working_data["metadata"]["data_source"]["version"] = str(version)
+        if version := data_source.get("version"):
+            data_source["version"] = str(version)
 
-        if page_number := working_data.get("metadata", {}).get("page_number"):
-            working_data["metadata"]["page_number"] = str(page_number)
+        if page_number := metadata.get("page_number"):
+            metadata["page_number"] = str(page_number)
 
-        if regex_metadata := working_data.get("metadata", {}).get("regex_metadata"):
-            working_data["metadata"]["regex_metadata"] = str(json.dumps(regex_metadata))
+        if regex_metadata := metadata.get("regex_metadata"):
+            metadata["regex_metadata"] = str(json.dumps(regex_metadata))
 
         working_data[RECORD_ID_LABEL] = file_data.identifier
         return working_data
@@ -162,6 +131,11 @@ class WeaviateUploadStager(UploadStager):
 class WeaviateUploaderConfig(UploaderConfig):
     collection: str = Field(description="The name of the collection this object belongs to")
     batch_size: Optional[int] = Field(default=None, description="Number of records per batch")
+    concurrent_requests: int = Field(
+        default=2,
+        ge=1,
+        description="Number of batch requests sent concurrently when using fixed size batches",
+    )
     requests_per_minute: Optional[int] = Field(default=None, description="Rate limit for upload")
     dynamic_batch: bool = Field(default=True, description="Whether to use dynamic batch")
     record_id_key: str = Field(
@@ -193,7 +167,9 @@ class WeaviateUploaderConfig(UploaderConfig):
             with client.batch.dynamic() as batch_client:
                 yield batch_client
         elif self.batch_size:
-            with client.batch.fixed_size(batch_size=self.batch_size) as batch_client:
+            with client.batch.fixed_size(
+                batch_size=self.batch_size, concurrent_requests=self.concurrent_requests
+            ) as batch_client:
                 yield batch_client
         elif self.requests_per_minute:
             with client.batch.rate_limit(
@@ -226,42 +202,77 @@ class WeaviateUploader(Uploader, ABC):
             raise WriteError("Failed to upload to weaviate")
 
     @requires_dependencies(["weaviate"], extras="weaviate")
-    def delete_by_record_id(self, client: "WeaviateClient", file_data: FileData) -> None:
+    def delete_by_record_ids(self, client: "WeaviateClient", record_ids: list[str]) -> None:
         from weaviate.classes.query import Filter
 
-        record_id = file_data.identifier
         collection = client.collections.get(self.upload_config.collection)
-        delete_filter = Filter.by_property(name=self.upload_config.record_id_key).equal(
-            val=record_id
+        for record_ids_chunk in batch_generator(record_ids, DELETE_BATCH_SIZE):
+            # Exact matches on each record id, since the property may be tokenized into words
+            # that other record ids share
+            delete_filter = Filter.any_of(
+                [
+                    Filter.by_property(name=self.upload_config.record_id_key).equal(record_id)
+                    for record_id in record_ids_chunk
+                ]
+            )
+            # There is a configurable maximum limit (QUERY_MAXIMUM_RESULTS) on the number of
+            # objects that can be deleted in a single query (default 10,000). To delete
+            # more objects than the limit, re-run the query until nothing is deleted.
+            while True:
+                resp = collection.data.delete_many(where=delete_filter)
+                if resp.failed:
+                    raise WriteError(
+                        f"failed to delete records in collection "
+                        f"{self.upload_config.collection} with record "
+                        f"id property in {record_ids_chunk}"
+                    )
+                if not resp.failed and not resp.successful:
+                    break
+
+    def is_batch(self) -> bool:
+        return True
+
+    def add_objects(self, batch_client: "BatchClient", data: Iterable[dict]) -> None:
+        for e in data:
+            vector = e.pop("embeddings", None)
+            batch_client.add_object(
+                collection=self.upload_config.collection,
+                properties=e,
+                vector=vector,
+            )
+
+    def run_batch(self, contents: list[UploadContent], **kwargs: Any) -> None:
+        logger.info(
+            f"writing objects from {len(contents)} documents to destination "
+            f"class {self.connection_config.access_config} "
         )
-        # There is a configurable maximum limit (QUERY_MAXIMUM_RESULTS) on the number of
-        # objects that can be deleted in a single query (default 10,000). To delete
-        # more objects than the limit, re-run the query until nothing is deleted.
-        while True:
-            resp = collection.data.delete_many(where=delete_filter)
-            if resp.failed:
-                raise WriteError(
-                    f"failed to delete records in collection "
-                    f"{self.upload_config.collection} with record "
-                    f"id property {record_id}"
-                )
-            if not resp.failed and not resp.successful:
-                break
+        # A single batch context is kept open for all documents, so the batch client keeps
+        # its concurrent requests in flight while the next documents are read
+        data = (
+            element for content in contents for element in self.get_content_data(content=content)
+        )
+        with self.connection_config.get_client() as weaviate_client:
+            self.delete_by_record_ids(
+                client=weaviate_client,
+                record_ids=[content.file_data.identifier for content in contents],
+            )
+            with self.upload_config.get_batch_client(client=weaviate_client) as batch_client:
+                self.add_objects(batch_client=batch_client, data=data)
+            self.check_for_errors(client=weaviate_client)
 
-    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+    def run_batch_data(self, data: list[dict], file_data: list[FileData], **kwargs: Any) -> None:
         logger.info(
-            f"writing {len(data)} objects to destination "
+            f"writing {len(data)} objects from {len(file_data)} documents to destination "
             f"class {self.connection_config.access_config} "
         )
 
         with self.connection_config.get_client() as weaviate_client:
-            self.delete_by_record_id(client=weaviate_client, file_data=file_data)
+            self.delete_by_record_ids(
+                client=weaviate_client, record_ids=[fd.identifier for fd in file_data]
+            )
             with self.upload_config.get_batch_client(client=weaviate_client) as batch_client:
-                for e in data:
-                    vector = e.pop("embeddings", None)
-                    batch_client.add_object(
-                        collection=self.upload_config.collection,
-                        properties=e,
-                        vector=vector,
-                    )
+                self.add_objects(batch_client=batch_client, data=data)
             self.check_for_errors(client=weaviate_client)
+
+    def run_data(self, data: list[dict], file_data: FileData, **kwargs: Any) -> None:
+        self.run_batch_data(data=data, file_data=[file_data], **kwargs)